@@ -0,0 +1,67 @@
+"""Settlement and bet placement benchmarks."""
+
+from harness import bench
+
+from justai_roulette.constants import DEFAULT_BALANCE
+from justai_roulette.game.bets import calculate_winnings
+from justai_roulette.game.catalogue import CATALOGUE, OUTSIDE, BetDef
+from justai_roulette.game.engine import RouletteEngine
+from justai_roulette.game.slip import BetSlip
+
+SLIP_SIZES = (1, 18, 150)
+_BANKROLL = 1e12
+
+
+def _bets(size: int) -> list[BetDef]:
+    """Distinct catalogue bets, inside bets first; small slips are spread so they are not all straights."""
+    candidates = [b for b in CATALOGUE if b.kind != OUTSIDE] + [b for b in CATALOGUE if b.kind == OUTSIDE]
+    step = max(1, len(candidates) // size)
+    return candidates[::step][:size]
+
+
+for _size in SLIP_SIZES:
+    @bench(f"settle.calculate_winnings.{_size}")
+    def _calculate_winnings(size=_size):
+        bets = [{"label": b.label, "numbers": list(b.numbers), "payout": b.payout, "amount": 1.0,
+                 "mask": b.mask} for b in _bets(size)]
+
+        def run():
+            for n in range(37):
+                calculate_winnings(bets, n)
+        return run, 37
+
+    @bench(f"settle.finish_spin.{_size}")
+    def _finish_spin(size=_size):
+        engine = RouletteEngine(balance=_BANKROLL)
+        slip = BetSlip()
+        for bet in _bets(size):
+            slip.add(bet.id, 1.0)
+
+        def run():
+            for n in range(37):
+                engine.slip = slip  # frozen once spun, so safe to reuse
+                engine.begin_spin(n)
+                engine.finish_spin()
+        return run, 37
+
+
+@bench("place.repeated_key")
+def _place_repeated_key():
+    engine = RouletteEngine(balance=_BANKROLL)
+
+    def run():
+        for _ in range(100):
+            engine.place_bet(17, 1.0)  # Straight 17
+        engine.clear_bets()
+    return run, 100
+
+
+@bench("place.repeated_call_bet")
+def _place_repeated_call_bet():
+    engine = RouletteEngine(balance=_BANKROLL, max_single_bet=DEFAULT_BALANCE)
+
+    def run():
+        for _ in range(20):
+            engine.place_call_bet("Voisins", 0.5)
+        engine.clear_bets()
+    return run, 20
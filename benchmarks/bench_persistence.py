@@ -0,0 +1,114 @@
+"""Session, history and round log benchmarks (all in a temporary directory)."""
+
+import atexit
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from harness import bench
+
+from justai_roulette import session as session_mod
+from justai_roulette.game.bets import get_number_color
+from justai_roulette.game.engine import RouletteEngine
+from justai_roulette.game.history import SpinHistory
+from justai_roulette.game.roundlog import RoundLog, read_rounds, replay_rounds
+from justai_roulette.game.slip import build_slip
+from justai_roulette.session import HISTORY_LIMIT, SessionData
+
+JOURNAL_EVENTS = 10_000
+HISTORY_SPINS = 1_000_000
+
+_tmp = Path(tempfile.mkdtemp(prefix="justai-bench-"))
+atexit.register(shutil.rmtree, _tmp, ignore_errors=True)
+
+
+def _use_temp_session_files() -> tuple[Path, Path]:
+    """Point session persistence at the temp directory (never the user's files)."""
+    session_mod.SESSION_FILE = _tmp / "session.json"
+    session_mod.JOURNAL_FILE = _tmp / "session.journal"
+    return session_mod.SESSION_FILE, session_mod.JOURNAL_FILE
+
+
+def _large_session(rng: random.Random) -> SessionData:
+    numbers = [rng.randrange(37) for _ in range(HISTORY_LIMIT)]
+    return SessionData(
+        balance=1234.5,
+        history=[(n, get_number_color(n)) for n in numbers],
+        hot_counts={n: rng.randrange(100_000) for n in range(37)},
+        session_stats={"spins": 3_700_000, "bet_total": 1e7, "win_total": 9.7e6},
+    )
+
+
+@bench("session.save")
+def _session_save():
+    _use_temp_session_files()
+    data = _large_session(random.Random(1))
+    return (lambda: session_mod.save_session(data)), 1
+
+
+@bench(f"session.load_with_journal.{JOURNAL_EVENTS}")
+def _session_load():
+    snapshot, journal = _use_temp_session_files()
+    rng = random.Random(2)
+    session_mod.save_session(_large_session(rng))
+    with open(journal, "w", encoding="utf-8") as fh:
+        for seq in range(1, JOURNAL_EVENTS + 1):
+            fh.write(json.dumps({"s": seq, "e": "spin", "n": rng.randrange(37),
+                                 "bet": 1.0, "win": 0.0, "bal": 1000.0}) + "\n")
+    return session_mod.load_session, 1
+
+
+def _history_file() -> Path:
+    path = _tmp / "history.bin"
+    if not path.exists():
+        history = SpinHistory(path)
+        history.extend(bytes(random.Random(3).randrange(37) for _ in range(HISTORY_SPINS)))
+        history.close()
+    return path
+
+
+@bench(f"history.open_and_restore.{HISTORY_SPINS}")
+def _history_open():
+    path = _history_file()
+
+    def run():
+        history = SpinHistory(path)
+        RouletteEngine(history=history)
+        history.close()
+    return run, 1
+
+
+@bench("history.append")
+def _history_append():
+    history = SpinHistory(_tmp / "append.bin", timestamps=True)
+
+    def run():
+        for n in range(37):
+            history.append(n)
+        history.clear()
+    return run, 37
+
+
+@bench("roundlog.append")
+def _roundlog_append():
+    log = RoundLog(_tmp / "append.rounds")
+    slip = build_slip(["Red", "Voisins"], 1.0)
+
+    def run():
+        for n in range(37):
+            log.append(n, slip, 100.0, 100.0, 0.0, 0.0, 0.0)
+        log.flush()
+    return run, 37
+
+
+@bench("roundlog.replay")
+def _roundlog_replay():
+    path = _tmp / "replay.rounds"
+    if not path.exists():
+        log = RoundLog(path)
+        engine = RouletteEngine(balance=1e9, round_log=log)
+        engine.autoplay(build_slip(["Red", "Voisins", "Snake"], 1.0), 10_000)
+        log.close()
+    return (lambda: replay_rounds(read_rounds(path))), 10_000
@@ -0,0 +1,121 @@
+"""Tk rendering benchmarks.
+
+Needs a display; on a headless machine run the suite under Xvfb
+(``xvfb-run python benchmarks/run.py``).  One shared root is mapped (so
+redraws really happen) and every timed batch ends with
+``update_idletasks`` to include the redraw it caused.
+"""
+
+import math
+
+from harness import Skip, bench
+
+_root = {}
+
+
+def _tk():
+    if "root" not in _root:
+        try:
+            from tkinter import Tk
+            root = Tk()
+        except Exception as exc:  # TclError without a display, ImportError without Tk
+            _root["root"] = None
+            _root["error"] = f"no Tk display ({exc}); try xvfb-run"
+        else:
+            root.geometry("1400x900+0+0")
+            from justai_roulette.ui.theme import setup_styles
+            setup_styles(root)
+            _root["root"] = root
+    if _root["root"] is None:
+        raise Skip(_root["error"])
+    return _root["root"]
+
+
+def _frame():
+    from tkinter import Frame
+    root = _tk()
+    for child in root.winfo_children():
+        child.destroy()
+    frame = Frame(root)
+    frame.pack(fill="both", expand=True)
+    return root, frame
+
+
+@bench("ui.table.hit_test")
+def _table_hit_test():
+    from justai_roulette.ui.table import build_table
+    root, frame = _frame()
+    hovered = []
+    canvas = build_table(frame, lambda *a: None, on_hover=hovered.append)[4]
+    root.update()
+    w, h = canvas.winfo_width(), canvas.winfo_height()
+    points = [(x * w // 40, y * h // 16) for y in range(16) for x in range(40)]
+
+    def run():
+        for x, y in points:
+            canvas.event_generate("<Motion>", x=x, y=y)
+    return run, len(points)
+
+
+@bench("ui.chip_tray.select")
+def _chip_tray_select():
+    from tkinter import DoubleVar
+    from justai_roulette.constants import CHIP_VALUES
+    from justai_roulette.ui.chips import build_chip_tray
+    root, frame = _frame()
+    selected = DoubleVar(master=root, value=CHIP_VALUES[0])
+    build_chip_tray(frame, selected)
+    root.update()
+
+    def run():
+        for value in CHIP_VALUES:
+            selected.set(value)
+        root.update_idletasks()
+    return run, len(CHIP_VALUES)
+
+
+@bench("ui.history_strip.refresh")
+def _history_strip_refresh():
+    from justai_roulette.game.history import SpinHistory
+    from justai_roulette.ui.history_strip import build_history_strip
+    root, frame = _frame()
+    history = SpinHistory.from_numbers(range(37))
+    strip = build_history_strip(frame, history)
+    root.update()
+
+    def run():
+        for n in range(37):
+            history.append(n)
+            strip["refresh"]()
+        root.update_idletasks()
+    return run, 37
+
+
+@bench("ui.history_strip.scroll")
+def _history_strip_scroll():
+    from justai_roulette.game.history import SpinHistory
+    from justai_roulette.ui.history_strip import build_history_strip
+    root, frame = _frame()
+    strip = build_history_strip(frame, SpinHistory.from_numbers(n % 37 for n in range(5000)))
+    root.update()
+
+    def run():
+        for step in (1,) * 20 + (-1,) * 20:
+            strip["scroll"](step)
+        root.update_idletasks()
+    return run, 40
+
+
+@bench("ui.wheel.move_ball")
+def _wheel_move_ball():
+    from justai_roulette.ui.wheel import build_wheel
+    root, frame = _frame()
+    wheel = build_wheel(frame)
+    root.update()
+    angles = [2 * math.pi * i / 90 for i in range(90)]
+
+    def run():
+        for angle in angles:
+            wheel["move_ball"](angle, on_track=True)
+        root.update_idletasks()
+    return run, len(angles)
@@ -0,0 +1,36 @@
+"""Registry and timer for the benchmark suite.
+
+A benchmark is a function decorated with ``@bench(name)`` that does its
+setup and returns ``(run, ops)``: ``run()`` is the timed callable and
+``ops`` how many operations one call performs, so results are reported per
+operation.  Raise ``Skip`` from the setup when the environment cannot run
+it (no display, no NumPy).
+"""
+
+import timeit
+from typing import Callable
+
+BENCHMARKS: dict[str, Callable[[], tuple[Callable[[], object], int]]] = {}
+
+
+class Skip(Exception):
+    """Raised by a benchmark's setup to skip it, with the reason as message."""
+
+
+def bench(name: str):
+    """Register a benchmark setup function under ``name``."""
+    def register(setup):
+        if name in BENCHMARKS:
+            raise ValueError(f"duplicate benchmark {name!r}")
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def measure(run: Callable[[], object], ops: int, repeat: int = 5, min_time: float = 0.2) -> float:
+    """Best seconds per operation over ``repeat`` samples of at least ``min_time`` each."""
+    timer = timeit.Timer(run)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat, number)) / number / ops
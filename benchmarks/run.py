@@ -0,0 +1,115 @@
+"""Run the benchmark suite and compare against the JSON baseline.
+
+    python benchmarks/run.py                 # run everything, compare
+    python benchmarks/run.py -k settle       # only names containing "settle"
+    python benchmarks/run.py --save          # record results as the new baseline
+    xvfb-run python benchmarks/run.py        # include the Tk benchmarks headless
+
+Results are seconds per operation (best of ``--repeat`` samples).  Any
+benchmark slower than its baseline by more than ``--threshold`` percent is
+flagged and the exit status is 1.  Baselines are only comparable on the same
+machine and Python, so record one per kiosk model.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+try:
+    import justai_roulette  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(HERE.parent / "src"))
+
+import bench_game  # noqa: E402,F401 - registers benchmarks
+import bench_persistence  # noqa: E402,F401
+import bench_ui  # noqa: E402,F401
+from harness import BENCHMARKS, Skip, measure  # noqa: E402
+
+DEFAULT_BASELINE = HERE / "baseline.json"
+
+
+def _machine() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def _fmt(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="JustAI Roulette benchmark suite.")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="merge these results into the baseline file")
+    parser.add_argument("--threshold", type=float, default=20.0, help="regression threshold in percent")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    base_results = baseline.get("results", {})
+    if base_results and baseline.get("machine") != _machine() and not args.json:
+        print("note: baseline was recorded on a different machine/Python; "
+              "comparisons are indicative only", file=sys.stderr)
+
+    results: dict[str, float] = {}
+    skipped: dict[str, str] = {}
+    regressions: list[str] = []
+    width = max(len(name) for name in BENCHMARKS)
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        try:
+            run, ops = setup()
+        except Skip as exc:
+            skipped[name] = str(exc)
+            if not args.json:
+                print(f"{name:<{width}}  skipped: {exc}")
+            continue
+        per_op = results[name] = measure(run, ops, repeat=args.repeat)
+        line = f"{name:<{width}}  {_fmt(per_op)}/op"
+        base = base_results.get(name)
+        if base:
+            change = (per_op - base) / base * 100
+            line += f"  {change:+7.1f}% vs baseline"
+            if change > args.threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        if not args.json:
+            print(line, flush=True)
+
+    if args.json:
+        print(json.dumps({"machine": _machine(), "results": results, "skipped": skipped,
+                          "regressions": regressions}, indent=2))
+    elif regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%: {', '.join(regressions)}")
+
+    if args.save:
+        merged = {**base_results, **results}
+        args.baseline.write_text(json.dumps({
+            "machine": _machine(),
+            "recorded": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "results": dict(sorted(merged.items())),
+        }, indent=2) + "\n")
+        if not args.json:
+            print(f"baseline saved to {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,13 @@
 """JustAI Roulette - RSL Club-style European Roulette Simulator."""
 
-from .__main__ import main
-
 __version__ = "0.2.0"
 __all__ = ["main"]
+
+
+def __getattr__(name):
+    # The GUI pulls in Tk; only import it when main() is actually requested so
+    # headless tools (simulator, batch settlement) can import the package.
+    if name == "main":
+        from .__main__ import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,1049 @@
+"""JustAI Roulette - the Tk GUI."""
+
+import math
+import queue
+import random
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from tkinter import (
+    BOTH, LEFT, RIGHT, Frame, IntVar, DoubleVar, BooleanVar,
+    StringVar, Tk, Spinbox, Label, Toplevel, TclError
+)
+from tkinter import ttk
+
+from . import probes
+from .constants import (
+    RED_NUMBERS, CHIP_VALUES, Colors, HISTORY_FILE, REPLAY_WINDOW, ROUND_LOG_FILE
+)
+from .game.bets import QUICK_BETS, CALL_BETS, get_number_color
+from .game.engine import RouletteEngine, BetError
+from .game.history import SpinHistory
+from .game.roundlog import RoundLog, read_recent_rounds, read_rounds, replay_rounds
+from .game.wheel import NEIGHBOURS
+from .audio import play_sound, warm_up as warm_up_audio
+from .ui.wheel import build_wheel
+from .ui.racetrack import build_racetrack
+from .ui.table import build_table
+from .ui.theme import setup_styles
+from .ui.controls import build_quick_bet_panel, build_action_panel
+from .ui.chips import build_chip_tray
+from .ui.history_strip import build_history_strip
+from .ui.probe_overlay import build_probe_overlay
+from .ui.replay import build_replay_window
+from .ui.animation import PHASE_DROP, PHASE_SPIN, play_timeline, spin_timeline
+from .session import load_session, SessionData, HISTORY_LIMIT
+from .journal import SessionJournal
+
+
+def _fmt_money(amount: float, symbol: str) -> str:
+    """Format amount as currency string."""
+    return f"{symbol}{amount:,.2f}"
+
+
+def _roulette_numbers():
+    """Iterate European wheel numbers with colors."""
+    for n in range(0, 37):
+        color = "green" if n == 0 else ("red" if n in RED_NUMBERS else "black")
+        yield n, color
+
+
+def _startup_clock(start: float):
+    """Return (phases, mark); ``mark(name)`` records the time since the previous mark."""
+    phases: list[tuple[str, float]] = []
+    last = [start]
+
+    def mark(name: str) -> None:
+        now = time.perf_counter()
+        phases.append((name, now - last[0]))
+        last[0] = now
+
+    return phases, mark
+
+
+def _merge_phases(phases: list[tuple[str, float]]) -> list[tuple[str, float]]:
+    """Sum repeated phase names (e.g. the layout between the timed builders)."""
+    merged: dict[str, float] = {}
+    for name, seconds in phases:
+        merged[name] = merged.get(name, 0.0) + seconds
+    return list(merged.items())
+
+
+def _print_startup_report(phases: list[tuple[str, float]]) -> None:
+    width = max(len(name) for name, _ in phases)
+    for name, seconds in phases:
+        print(f"{name:<{width}}  {seconds * 1000:8.1f} ms", file=sys.stderr)
+    total = sum(seconds for _, seconds in phases)
+    print(f"{'total':<{width}}  {total * 1000:8.1f} ms", file=sys.stderr)
+
+
+def run_gui(startup_report: bool = False, started: float | None = None, remote=None,
+            probes_out: Path | None = None, profiler=None) -> None:
+    """Launch the roulette GUI.
+
+    ``started`` is the ``perf_counter`` time the entry point began importing,
+    so ``startup_report`` can include import time.  With ``remote`` (a
+    ``client.RemoteSeat``) the GUI is a kiosk for a server table: the server
+    runs the spin schedule, validates bets and holds the balance, and the
+    local engine only mirrors the seat for display.  Probe results (see
+    ``probes``; F3 shows them) are written to ``probes_out`` on exit if any
+    were recorded.  A ``profiling.RoundProfiler`` given as ``profiler``
+    captures whole rounds, from ``run_spin`` to the settled spin being saved.
+    """
+    phases, mark = _startup_clock(time.perf_counter() if started is None else started)
+    mark("imports")
+
+    root = Tk()
+    root.title("JustAI Roulette")
+    root.configure(bg=Colors.BG)
+
+    screen_w = root.winfo_screenwidth()
+    screen_h = root.winfo_screenheight()
+    width = max(1220, screen_w - 24)
+    height = max(820, screen_h - 32)
+    root.geometry(f"{int(width)}x{int(height)}+12+12")
+    root.resizable(True, True)
+
+    mark("tk root")
+    setup_styles(root)
+    mark("setup_styles")
+
+    # Load session data (snapshot + journal replay); later changes are journaled
+    session = load_session()
+    journal = SessionJournal(seq=session.journal_seq)
+    mark("session load")
+
+    # UI State Variables
+    result_var = StringVar(value="Place your bets!")
+    balance_var = DoubleVar(value=session.balance)
+    total_bet_var = DoubleVar(value=0.0)
+    winnings_var = DoubleVar(value=0.0)
+    countdown_var = IntVar(value=session.auto_spin_interval)
+    auto_interval_var = IntVar(value=session.auto_spin_interval)
+    session_summary_var = StringVar(value="0 spins")
+    breakdown_var = StringVar(value="")
+    preview_var = StringVar(value="")
+    currency_var = StringVar(value=session.currency)
+    sound_enabled = BooleanVar(value=session.sound_enabled)
+    auto_enabled = BooleanVar(value=session.auto_spin_enabled)
+    selected_chip = DoubleVar(value=CHIP_VALUES[0])
+
+    # Game State - rules live in the engine, the UI only drives it
+    if remote is None:
+        spin_history = SpinHistory(HISTORY_FILE, timestamps=True)
+        if not spin_history and session.history:
+            # First run with the lifetime store: seed it from the session file
+            for num, _ in reversed(session.history):
+                spin_history.append(num, ts=float("nan"))
+        try:
+            round_log = RoundLog(ROUND_LOG_FILE)
+        except ValueError as exc:
+            spin_history.close()
+            journal.close()
+            root.destroy()
+            raise SystemExit(f"justai-roulette: {exc}") from None
+        engine = RouletteEngine.from_session(session, history=spin_history, round_log=round_log)
+    else:
+        # A kiosk leaves the local session, history and round log alone;
+        # the balance arrives with the server's "joined" event
+        spin_history = SpinHistory(timestamps=True)
+        round_log = None
+        engine = RouletteEngine(balance=0.0, history=spin_history, currency=session.currency)
+        balance_var.set(0.0)
+    # settled: the server's per-seat results by round; pending: spin events that
+    # arrived while the previous spin was still animating; round: the one on screen
+    remote_state: dict = {"bets": [], "settled": {}, "pending": deque(), "round": None}
+    # Decorative draws (flashing numbers, ball launch) use their own stream;
+    # outcomes only ever come from engine.rng
+    cosmetic = random.Random()
+    mark("history + engine")
+    timer_handle: dict[str, int | None] = {"id": None}
+    spin_anim: dict = {"cancel": None, "phase": None}
+    winners_overlay: dict = {"active": False}
+    wheel_numbers = tuple(_roulette_numbers())
+
+    auto_interval_var.trace_add("write", lambda *_: countdown_var.set(auto_interval_var.get()))
+    currency_var.trace_add("write", lambda *_: setattr(engine, "currency", currency_var.get()))
+
+    # --- Helper Functions ---
+
+    def _session_snapshot() -> SessionData:
+        """Current state as a SessionData for compaction."""
+        return SessionData(
+            balance=engine.balance,
+            sound_enabled=sound_enabled.get(),
+            auto_spin_enabled=auto_enabled.get(),
+            auto_spin_interval=auto_interval_var.get(),
+            currency=currency_var.get(),
+            history=[(n, get_number_color(n)) for n in engine.history.recent(HISTORY_LIMIT)],
+            hot_counts=engine.hot_counts,
+            color_counts=engine.color_counts,
+            parity_counts=engine.parity_counts,
+            session_stats=engine.session_stats,
+        )
+
+    def _journal_settings(*_):
+        try:
+            journal.append("settings", sound_enabled=sound_enabled.get(),
+                           auto_spin_enabled=auto_enabled.get(),
+                           auto_spin_interval=auto_interval_var.get(),
+                           currency=currency_var.get())
+        except (TclError, ValueError):
+            pass  # Spinbox mid-edit; the next change records it
+
+    for var in (sound_enabled, auto_enabled, auto_interval_var, currency_var):
+        var.trace_add("write", _journal_settings)
+
+    def _on_close():
+        if spin_anim["cancel"] is not None:
+            spin_anim["cancel"]()
+        if remote is not None:
+            remote.close()
+        journal.close(_session_snapshot() if remote is None else None)
+        spin_history.close()
+        if round_log is not None:
+            round_log.close()
+        if probes_out is not None and probes.has_data():
+            try:
+                probes.export(probes_out)
+            except OSError as exc:
+                print(f"Could not write probes to {probes_out}: {exc}", file=sys.stderr)
+        root.destroy()
+
+    def _sync_totals():
+        """Push engine balance and slip total to the HUD."""
+        balance_var.set(engine.balance)
+        total_bet_var.set(engine.total_bet)
+
+    def _update_session_summary():
+        stats = engine.session_stats
+        profit = stats["win_total"] - stats["bet_total"]
+        session_summary_var.set(
+            f"Session: {stats['spins']} spins / profit {_fmt_money(profit, currency_var.get())}"
+        )
+
+    def _remote_send(op: str, **fields):
+        """Mirror a slip action to the table server (no-op when standalone)."""
+        if remote is not None:
+            remote.send(op, **fields)
+
+    def _beep(sound_type: str):
+        """Play a sound effect."""
+        play_sound(sound_type, sound_enabled.get())
+
+    # --- Winner Flash Overlay ---
+
+    def _clear_winner_flash():
+        if winners_overlay.get("timer"):
+            root.after_cancel(winners_overlay["timer"])
+        canvas = winners_overlay.get("canvas")
+        if canvas:
+            for cid in winners_overlay.get("ids", []):
+                table_scaler["forget"](cid)
+                try:
+                    canvas.delete(cid)
+                except Exception:
+                    pass
+        winners_overlay.update({
+            "active": False, "ids": [], "timer": None,
+            "messages": [], "msg_idx": 0, "state": False, "canvas": None
+        })
+
+    def _flash_winners():
+        if not winners_overlay.get("active"):
+            return
+        canvas = winners_overlay.get("canvas")
+        ids = winners_overlay.get("ids", [])
+        if not ids or canvas is None:
+            return
+        state = winners_overlay.get("state", False)
+        for cid in ids:
+            canvas.itemconfigure(cid, state="normal" if state else "hidden")
+        winners_overlay["state"] = not state
+        msgs = winners_overlay.get("messages", [])
+        if msgs:
+            winners_overlay["msg_idx"] = (winners_overlay.get("msg_idx", 0) + 1) % len(msgs)
+            breakdown_var.set(msgs[winners_overlay["msg_idx"]])
+        winners_overlay["timer"] = root.after(600, _flash_winners)
+
+    # --- Settings Dialog ---
+
+    def _open_settings():
+        win = Toplevel(root)
+        win.title("Settings")
+        win.configure(bg=Colors.CARD_BG)
+        win.transient(root)
+        win.grab_set()
+        win.geometry(f"340x480+{root.winfo_x() + 100}+{root.winfo_y() + 50}")
+
+        frame = Frame(win, bg=Colors.CARD_BG)
+        frame.pack(fill=BOTH, expand=True, padx=16, pady=16)
+
+        Label(frame, text="Settings", font=("Segoe UI", 16, "bold"),
+              fg=Colors.ACCENT, bg=Colors.CARD_BG).pack(anchor="w", pady=(0, 12))
+
+        # Auto-Spin
+        Label(frame, text="AUTO-SPIN", font=("Segoe UI", 10, "bold"),
+              fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w", pady=(8, 4))
+        auto_frame = Frame(frame, bg=Colors.CARD_BG)
+        auto_frame.pack(fill="x", pady=(0, 8))
+        ttk.Checkbutton(auto_frame, text="Enable auto-spin", variable=auto_enabled,
+                        style="Game.TCheckbutton", command=schedule_countdown).pack(side=LEFT)
+        Label(auto_frame, text="Interval:", fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG,
+              font=("Segoe UI", 10)).pack(side=LEFT, padx=(12, 4))
+        Spinbox(auto_frame, from_=10, to=120, width=4, textvariable=auto_interval_var,
+                bg=Colors.BUTTON_BG, fg=Colors.TEXT_LIGHT, highlightthickness=0, bd=0,
+                font=("Segoe UI", 10)).pack(side=LEFT)
+        Label(auto_frame, text="s", fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG,
+              font=("Segoe UI", 10)).pack(side=LEFT)
+
+        # Sound
+        Label(frame, text="AUDIO", font=("Segoe UI", 10, "bold"),
+              fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w", pady=(8, 4))
+        ttk.Checkbutton(frame, text="Enable sound effects", variable=sound_enabled,
+                        style="Game.TCheckbutton").pack(anchor="w")
+
+        # Currency
+        Label(frame, text="CURRENCY", font=("Segoe UI", 10, "bold"),
+              fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w", pady=(12, 4))
+        curr_frame = Frame(frame, bg=Colors.CARD_BG)
+        curr_frame.pack(fill="x", pady=(0, 8))
+        for sym in ["$", "EUR", "£"]:
+            ttk.Radiobutton(curr_frame, text=sym if sym != "EUR" else "€",
+                           variable=currency_var, value=sym,
+                           style="Game.TCheckbutton").pack(side=LEFT, padx=(0, 12))
+
+        # Session
+        Label(frame, text="SESSION", font=("Segoe UI", 10, "bold"),
+              fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w", pady=(12, 4))
+        add_row = Frame(frame, bg=Colors.CARD_BG)
+        add_row.pack(fill="x", pady=(0, 8))
+        Label(add_row, text="Add balance:", fg=Colors.TEXT_LIGHT, bg=Colors.CARD_BG,
+              font=("Segoe UI", 10)).pack(side=LEFT)
+        add_amount = StringVar(value="100")
+        Spinbox(add_row, from_=0, to=100000, textvariable=add_amount, width=8,
+                bg=Colors.BUTTON_BG, fg=Colors.TEXT_LIGHT, highlightthickness=0, bd=0).pack(side=LEFT, padx=8)
+
+        def _apply_add():
+            if remote is not None:
+                result_var.set("The table server holds the balance.")
+                return
+            try:
+                amt = float(add_amount.get())
+                if amt > 0:
+                    engine.add_balance(amt)
+                    _sync_totals()
+                    journal.append("balance", bal=engine.balance)
+            except ValueError:
+                pass
+
+        ttk.Button(add_row, text="Add", command=_apply_add, width=6).pack(side=LEFT)
+        ttk.Button(frame, text="Reset Session",
+                   command=lambda: (_reset_session(), win.destroy()), width=20).pack(anchor="w", pady=(4, 0))
+
+        # Help
+        Label(frame, text="HELP", font=("Segoe UI", 10, "bold"),
+              fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w", pady=(16, 4))
+        Label(frame, text="Straight: 35:1 • Split: 17:1 • Corner: 8:1\nDozen/Column: 2:1 • Even money: 1:1",
+              font=("Segoe UI", 9), fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG,
+              justify="left").pack(anchor="w")
+
+        ttk.Button(frame, text="Close", command=win.destroy,
+                   style="Accent.TButton", width=12).pack(anchor="e", pady=(16, 0))
+
+    # --- Build UI Layout ---
+
+    # Main game container
+    game_frame = Frame(root, bg=Colors.FELT)
+    game_frame.pack(fill=BOTH, expand=True)
+
+    # Top HUD bar
+    hud_bar = Frame(game_frame, bg=Colors.CARD_BG, height=72)
+    hud_bar.pack(fill="x")
+    hud_bar.pack_propagate(False)
+
+    # Money displays
+    money_frame = Frame(hud_bar, bg=Colors.CARD_BG)
+    money_frame.pack(side=LEFT, padx=20, pady=8)
+
+    # Balance
+    balance_inner = Frame(money_frame, bg=Colors.CARD_BG)
+    balance_inner.pack(side=LEFT, padx=(0, 28))
+    Label(balance_inner, text="BALANCE", font=("Segoe UI", 10, "bold"),
+          fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w")
+    balance_label = Label(balance_inner, text=_fmt_money(balance_var.get(), currency_var.get()),
+                          font=("Segoe UI", 22, "bold"), fg="#3fe68b", bg=Colors.CARD_BG)
+    balance_label.pack(anchor="w")
+    balance_var.trace_add("write", lambda *_: balance_label.config(
+        text=_fmt_money(balance_var.get(), currency_var.get())))
+
+    # Bet
+    bet_inner = Frame(money_frame, bg=Colors.CARD_BG)
+    bet_inner.pack(side=LEFT, padx=(0, 28))
+    Label(bet_inner, text="BET", font=("Segoe UI", 10, "bold"),
+          fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w")
+    bet_label = Label(bet_inner, text="$0.00", font=("Segoe UI", 22, "bold"),
+                      fg="#ff7b7b", bg=Colors.CARD_BG)
+    bet_label.pack(anchor="w")
+    total_bet_var.trace_add("write", lambda *_: bet_label.config(
+        text=_fmt_money(total_bet_var.get(), currency_var.get())))
+
+    # Win
+    win_inner = Frame(money_frame, bg=Colors.CARD_BG)
+    win_inner.pack(side=LEFT, padx=(0, 28))
+    Label(win_inner, text="WIN", font=("Segoe UI", 10, "bold"),
+          fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w")
+    win_label = Label(win_inner, text="$0.00", font=("Segoe UI", 22, "bold"),
+                      fg="#54a7ff", bg=Colors.CARD_BG)
+    win_label.pack(anchor="w")
+    winnings_var.trace_add("write", lambda *_: win_label.config(
+        text=_fmt_money(winnings_var.get(), currency_var.get())))
+
+    # Session
+    session_inner = Frame(money_frame, bg=Colors.CARD_BG)
+    session_inner.pack(side=LEFT)
+    Label(session_inner, text="SESSION", font=("Segoe UI", 10, "bold"),
+          fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack(anchor="w")
+    Label(session_inner, textvariable=session_summary_var, font=("Segoe UI", 12),
+          fg=Colors.TEXT_LIGHT, bg=Colors.CARD_BG).pack(anchor="w")
+
+    # Center: Result display
+    center_hud = Frame(hud_bar, bg=Colors.CARD_BG)
+    center_hud.pack(side=LEFT, fill="x", expand=True, padx=20)
+    Label(center_hud, textvariable=result_var, font=("Segoe UI", 15, "bold"),
+          fg=Colors.ACCENT, bg=Colors.CARD_BG).pack(pady=(8, 0))
+    Label(center_hud, textvariable=breakdown_var, font=("Segoe UI", 11),
+          fg=Colors.TEXT_MUTED, bg=Colors.CARD_BG).pack()
+    Label(center_hud, textvariable=preview_var, font=("Segoe UI", 11),
+          fg=Colors.ACCENT, bg=Colors.CARD_BG).pack()
+
+    # Right: Settings button
+    right_hud = Frame(hud_bar, bg=Colors.CARD_BG)
+    right_hud.pack(side=RIGHT, padx=20, pady=8)
+    ttk.Button(right_hud, text="Settings", command=_open_settings, width=10).pack()
+    ttk.Button(right_hud, text="Replay", command=lambda: _open_replay(), width=10).pack(pady=(4, 0))
+
+    # Wooden table frame
+    wood_border = Frame(game_frame, bg=Colors.WOOD_DARK)
+    wood_border.pack(fill=BOTH, expand=True, padx=12, pady=8)
+    wood_inner = Frame(wood_border, bg=Colors.WOOD_MID)
+    wood_inner.pack(fill=BOTH, expand=True, padx=6, pady=6)
+    gold_trim = Frame(wood_inner, bg=Colors.ACCENT)
+    gold_trim.pack(fill=BOTH, expand=True, padx=3, pady=3)
+    felt_surface = Frame(gold_trim, bg=Colors.FELT)
+    felt_surface.pack(fill=BOTH, expand=True, padx=2, pady=2)
+
+    # Main table row
+    table_row = Frame(felt_surface, bg=Colors.FELT)
+    table_row.pack(fill=BOTH, expand=True, padx=4, pady=4)
+    table_row.grid_columnconfigure(0, weight=0)
+    table_row.grid_columnconfigure(1, weight=1)
+    table_row.grid_rowconfigure(0, weight=1)
+
+    # Wheel section
+    wheel_section = Frame(table_row, bg=Colors.FELT)
+    wheel_section.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
+
+    countdown_section = Frame(wheel_section, bg=Colors.FELT)
+    countdown_section.pack(fill="x", pady=(0, 8))
+    Label(countdown_section, text="NEXT SPIN", font=("Segoe UI", 12, "bold"),
+          fg=Colors.TEXT_MUTED, bg=Colors.FELT).pack()
+    Label(countdown_section, textvariable=countdown_var, font=("Segoe UI", 36, "bold"),
+          fg=Colors.ACCENT, bg=Colors.FELT).pack()
+
+    # Packed from the bottom before the wheel so the wheel only takes what is left
+    racetrack = build_racetrack(wheel_section, lambda n, k: _place_neighbour_bet(n, k),
+                                on_hover=lambda n, k: _on_racetrack_hover(n, k))
+    mark("racetrack")
+
+    wheel_container = Frame(wheel_section, bg=Colors.FELT)
+    wheel_container.pack(fill=BOTH, expand=True)
+    mark("layout")
+    wheel_ui = build_wheel(wheel_container)
+    probe_overlay = build_probe_overlay(wheel_ui["canvas"])
+    mark("build_wheel")
+
+    # Table area
+    table_area = Frame(table_row, bg=Colors.FELT)
+    table_area.grid(row=0, column=1, sticky="nsew")
+
+    # --- Bet Selection Handler ---
+
+    def _set_selection(bet_id: int, x: float, y: float, mark_cb):
+        clicked = probes.start()
+        if engine.spinning:
+            result_var.set("Wait for spin...")
+            return
+        if winners_overlay["active"]:
+            _clear_winner_flash()
+            clear_markers()
+
+        amount = selected_chip.get()
+        try:
+            bet = engine.place_bet(bet_id, amount, x, y)
+        except BetError as exc:
+            result_var.set(str(exc))
+            return
+
+        _remote_send("bet", kind="id", id=bet_id, amount=amount, x=x, y=y)
+        total_bet_var.set(engine.total_bet)
+        mark_cb(bet.key, bet.amount, x, y)
+        if clicked:
+            # Idle callbacks run after the redraw the marker scheduled
+            root.after_idle(probes.stop, "click_to_marker", clicked)
+
+    # History strip
+    history_strip = build_history_strip(table_area, engine.history)
+
+    # Betting table
+    table_frame = Frame(table_area, bg=Colors.FELT)
+    table_frame.pack(fill=BOTH, expand=True)
+    mark("layout")
+    (clear_markers, place_marker, number_centers, outside_bet_centers,
+     table_canvas, table_scaler, remove_marker, show_table_coverage, bet_anchors) = build_table(
+        table_frame, _set_selection, on_hover=lambda bet: _on_table_hover(bet))
+    mark("build_table")
+
+    # Bottom section
+    bottom_section = Frame(table_area, bg=Colors.FELT)
+    bottom_section.pack(fill="x")
+
+    # Chip tray
+    mark("layout")
+    build_chip_tray(bottom_section, selected_chip)
+    mark("chip tray")
+
+    # --- Bet Management Functions ---
+
+    def clear_bets():
+        engine.clear_bets()
+        _remote_send("clear")
+        total_bet_var.set(0)
+        clear_markers()
+        _clear_winner_flash()
+
+    def _reset_session():
+        if remote is not None:
+            result_var.set("The table server holds the balance.")
+            return
+        clear_bets()
+        engine.reset()
+        _sync_totals()
+        winnings_var.set(0.0)
+        history_strip["refresh"]()
+        _update_session_summary()
+        result_var.set("Session reset.")
+        journal.append("reset", bal=engine.balance)
+
+    def undo_last():
+        touched = engine.undo_last()
+        if not touched:
+            return
+        _remote_send("undo")
+        for bet in touched:
+            if bet.amount:
+                place_marker(bet.key, bet.amount, bet.x, bet.y)
+            else:
+                remove_marker(bet.key)
+        total_bet_var.set(engine.total_bet)
+
+    def rebet_previous():
+        try:
+            bets = engine.rebet()
+        except BetError as exc:
+            result_var.set(str(exc))
+            return
+        if not bets:
+            return
+        _remote_send("rebet")
+        _clear_winner_flash()
+        clear_markers()
+        for bet in bets:
+            place_marker(bet.key, bet.amount, bet.x, bet.y)
+        total_bet_var.set(engine.total_bet)
+
+    def _double_bets():
+        try:
+            if not engine.double_bets():
+                return
+        except BetError as exc:
+            result_var.set(str(exc))
+            return
+        _remote_send("double")
+        for bet in engine.slip:
+            place_marker(bet.key, bet.amount, bet.x, bet.y)
+        total_bet_var.set(engine.total_bet)
+        _beep("chip_place")
+
+    # --- Hover Preview ---
+
+    # Call bets: (covered numbers, chips per unit), computed once
+    call_bet_cover = {
+        name: (tuple(sorted({n for numbers, _, _ in parts for n in numbers})),
+               sum(chip_count for _, _, chip_count in parts))
+        for name, parts in CALL_BETS.items()
+    }
+
+    def _preview(label: str | None, numbers=None, chips: int = 1):
+        """Light up the numbers a bet covers on the table and wheel, and show its cost."""
+        show_table_coverage(numbers)
+        wheel_ui["show_coverage"](numbers)
+        if label is None:
+            preview_var.set("")
+            return
+        cost = _fmt_money(chips * selected_chip.get(), currency_var.get())
+        chip_text = f"{chips} chips = " if chips > 1 else ""
+        preview_var.set(f"{label}: {len(numbers)} numbers, {chip_text}{cost}")
+
+    def _on_table_hover(bet):
+        if bet is None:
+            _preview(None)
+        else:
+            _preview(bet.label, bet.numbers)
+
+    def _on_quick_hover(bet_name: str | None):
+        if bet_name in CALL_BETS:
+            numbers, chips = call_bet_cover[bet_name]
+            _preview(bet_name, numbers, chips)
+        elif bet_name in QUICK_BETS:
+            _preview(bet_name, QUICK_BETS[bet_name][0])
+        else:
+            _preview(None)
+
+    # --- Quick Bet Functions ---
+
+    def _quick_bet(bet_name: str):
+        if engine.spinning:
+            return
+        if winners_overlay["active"]:
+            _clear_winner_flash()
+            clear_markers()
+
+        chip_amount = selected_chip.get()
+
+        if bet_name in CALL_BETS:
+            _place_call_bet(bet_name, chip_amount)
+            return
+
+        if bet_name not in QUICK_BETS:
+            return
+
+        cx, cy = outside_bet_centers.get(bet_name, (wheel_ui["cx"], wheel_ui["cy"]))
+        try:
+            bet = engine.place_quick_bet(bet_name, chip_amount, cx, cy)
+        except BetError as exc:
+            result_var.set(str(exc))
+            return
+
+        _remote_send("bet", kind="quick", name=bet_name, amount=chip_amount)
+        place_marker(bet.key, bet.amount, cx, cy)
+        total_bet_var.set(engine.total_bet)
+        _beep("chip_place")
+
+    def _locate_numbers(numbers: list[int]) -> tuple[float, float]:
+        """Table position for a chip covering ``numbers``."""
+        if len(numbers) == 1 and numbers[0] in number_centers:
+            return number_centers[numbers[0]]
+        if all(n in number_centers for n in numbers):
+            xs = [number_centers[n][0] for n in numbers]
+            ys = [number_centers[n][1] for n in numbers]
+            return sum(xs) / len(xs), sum(ys) / len(ys)
+        return wheel_ui["cx"], wheel_ui["cy"]
+
+    def _place_call_bet(bet_name: str, chip_amount: float):
+        try:
+            bets = engine.place_call_bet(bet_name, chip_amount, bet_anchors.__getitem__)
+        except BetError as exc:
+            result_var.set(str(exc))
+            return
+
+        _remote_send("bet", kind="call", name=bet_name, amount=chip_amount)
+        for bet in bets:
+            place_marker(bet.key, bet.amount, bet.x, bet.y)
+
+        total_bet_var.set(engine.total_bet)
+        _beep("chip_place")
+
+    def _on_racetrack_hover(number: int | None, k: int):
+        if number is None:
+            _preview(None)
+        else:
+            _preview(f"{number} and {k} neighbours", NEIGHBOURS[k][number], 2 * k + 1)
+
+    def _place_neighbour_bet(number: int, k: int):
+        if engine.spinning:
+            result_var.set("Wait for spin...")
+            return
+        if winners_overlay["active"]:
+            _clear_winner_flash()
+            clear_markers()
+
+        chip_amount = selected_chip.get()
+        try:
+            bets = engine.place_neighbour_bet(number, k, chip_amount, bet_anchors.__getitem__)
+        except BetError as exc:
+            result_var.set(str(exc))
+            return
+
+        _remote_send("bet", kind="neighbours", number=number, k=k, amount=chip_amount)
+        for bet in bets:
+            place_marker(bet.key, bet.amount, bet.x, bet.y)
+
+        total_bet_var.set(engine.total_bet)
+        _beep("chip_place")
+
+    # Controls
+    controls_row = Frame(bottom_section, bg=Colors.FELT)
+    controls_row.pack(fill="x", padx=6, pady=(0, 8))
+
+    quick_bet_panel = build_quick_bet_panel(controls_row, _quick_bet, Colors.FELT, on_hover=_on_quick_hover)
+    quick_bet_panel.pack(side=LEFT, fill="x", expand=True)
+
+    action_panel = build_action_panel(
+        controls_row,
+        on_rebet=rebet_previous,
+        on_double=_double_bets,
+        on_undo=undo_last,
+        on_clear=clear_bets,
+        on_spin=lambda: run_spin() if remote is None else result_var.set("The table server runs the spins."),
+        bg_color=Colors.FELT,
+    )
+    action_panel.pack(side=RIGHT, padx=(12, 0))
+
+    # --- Spin Logic ---
+
+    def finish_spin():
+        result = engine.finish_spin()
+        final_number, final_color, total_win = result.number, result.color, result.total_win
+        settled = remote_state["settled"].pop(remote_state["round"], None)
+        remote_state["round"] = None
+        if settled is not None:
+            # The server's settlement is authoritative; the local one is a mirror
+            total_win = settled["win"]
+            engine.balance = settled["balance"]
+
+        winnings_var.set(total_win)
+        if total_win > 0:
+            _beep("big_win" if result.is_big_win else "win")
+            prefix = "BIG WIN!" if result.is_big_win else "WIN!"
+            result_var.set(f"{prefix} {final_number} ({final_color}) - {_fmt_money(total_win, currency_var.get())}")
+        else:
+            result_var.set(f"Result: {final_number} ({final_color})")
+
+        _sync_totals()
+        _update_session_summary()
+        history_strip["refresh"]()
+
+        _clear_winner_flash()
+        clear_markers()
+
+        winners = result.winners
+        if winners:
+            winners_overlay["active"] = True
+            winners_overlay["canvas"] = table_canvas
+            winners_overlay["ids"] = []
+            winners_overlay["messages"] = [
+                f"{b.label}: {_fmt_money(b.win_amount, currency_var.get())}"
+                for b in winners
+            ]
+
+            for wb in winners:
+                place_marker(wb.key, wb.amount, wb.x, wb.y)
+                cid = table_canvas.create_oval(0, 0, 0, 0, outline=Colors.ACCENT, width=3)
+                table_scaler["place"](cid, wb.x - 18, wb.y - 18, wb.x + 18, wb.y + 18)
+                winners_overlay["ids"].append(cid)
+
+            winners_overlay["timer"] = root.after(600, _flash_winners)
+        else:
+            breakdown_var.set("Better luck next spin!")
+
+        if remote is None:
+            journal.record_spin(final_number, result.bet_amount, total_win, engine.balance)
+            # A profiled round always saves, and waits for it, so the save is in its dump
+            profiled = profiler.thread_profile() if profiler is not None else None
+            if journal.should_compact or profiled is not None:
+                journal.compact(_session_snapshot(), profiled)
+                if profiled is not None:
+                    journal.flush()
+        if profiler is not None:
+            profiler.end()
+        schedule_countdown(reset=False)
+        if remote_state["pending"]:
+            root.after_idle(_start_remote_spin, remote_state["pending"].popleft())
+
+    def _draw_spin_frame(timeline, i):
+        wheel_ui["move_ball"](timeline.angle[i], radius=timeline.radius[i])
+        phase = timeline.phase[i]
+        if phase == PHASE_SPIN:
+            n, c = cosmetic.choice(wheel_numbers)
+            result_var.set(f"Spinning... {n} ({c})")
+        elif phase == PHASE_DROP and spin_anim["phase"] != PHASE_DROP:
+            result_var.set("Ball dropping...")
+        spin_anim["phase"] = phase
+
+    def _end_spin(final_number, final_color):
+        spin_anim.update(cancel=None, phase=None)
+        wheel_ui["show_result"](final_number, final_color)
+        finish_spin()
+
+    def run_spin(number: int | None = None):
+        if engine.spinning:
+            return
+        _cancel_countdown()
+        countdown_var.set(auto_interval_var.get() if remote is None else 0)
+
+        if profiler is not None:
+            profiler.begin()
+        final_number = engine.begin_spin(number)
+        final_color = get_number_color(final_number)
+        total_bet_var.set(engine.stake)
+        _beep("spin_start")
+
+        target_angle = wheel_ui["number_to_angle"][final_number]
+        rotations = 3 + cosmetic.randint(0, 2)
+        start_angle = target_angle + 2 * math.pi * rotations + cosmetic.random() * 2 * math.pi
+        timeline = spin_timeline(start_angle, target_angle,
+                                 wheel_ui["ball_track_radius"], wheel_ui["outer_radius"])
+
+        wheel_ui["reset"]()
+        spin_anim["cancel"] = play_timeline(
+            root, timeline,
+            on_frame=lambda i: _draw_spin_frame(timeline, i),
+            on_event=_beep,
+            on_done=lambda: _end_spin(final_number, final_color),
+        )
+
+    # --- Replay ---
+
+    def _show_replay_round(rnd):
+        """Lay a logged round's slip and outcome out on the table and wheel."""
+        _clear_winner_flash()
+        clear_markers()
+        for bet in rnd.bets:
+            x, y = bet_anchors.get(bet.bet_id) or _locate_numbers(list(bet.numbers))
+            place_marker(tuple(sorted(bet.numbers)), bet.amount, x, y)
+        color = get_number_color(rnd.number)
+        wheel_ui["move_ball"](wheel_ui["number_to_angle"][rnd.number])
+        wheel_ui["show_result"](rnd.number, color)
+        show_table_coverage([rnd.number])
+        wheel_ui["show_coverage"]([rnd.number])
+        symbol = currency_var.get()
+        result_var.set(f"Replay: round {rnd.seq} - {rnd.number} ({color})")
+        breakdown_var.set(f"Balance {_fmt_money(rnd.balance_before, symbol)} -> "
+                          f"{_fmt_money(rnd.balance_after, symbol)}")
+
+    def _close_replay():
+        clear_markers()
+        for bet in engine.slip:
+            place_marker(bet.key, bet.amount, bet.x, bet.y)
+        show_table_coverage(None)
+        wheel_ui["show_coverage"](None)
+        wheel_ui["reset"]()
+        result_var.set("Place your bets!")
+        breakdown_var.set("")
+        schedule_countdown()
+
+    replay_state = {"results": None, "window": None}
+
+    def _verify_round_log(results: queue.SimpleQueue):
+        """Worker thread: load the recent rounds, then check the whole log."""
+        try:
+            results.put(("rounds", read_recent_rounds(ROUND_LOG_FILE, REPLAY_WINDOW)))
+            results.put(("report", replay_rounds(read_rounds(ROUND_LOG_FILE))))
+        except (OSError, ValueError) as exc:
+            results.put(("error", exc))
+
+    def _poll_replay():
+        results = replay_state["results"]
+        while True:
+            try:
+                kind, value = results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "rounds":
+                if not value:
+                    result_var.set("No rounds recorded yet.")
+                elif engine.spinning:
+                    result_var.set("Replay cancelled: a spin started.")
+                else:
+                    _cancel_countdown()
+                    result_var.set("")
+                    replay_state["window"] = build_replay_window(
+                        root, value, None, _show_replay_round, _close_replay, currency_var.get())
+                    continue
+            elif kind == "report":
+                if replay_state["window"] is not None:
+                    replay_state["window"]["set_mismatches"](value.mismatches)
+            else:
+                result_var.set(f"Cannot read round log: {value}")
+            # The worker has nothing more to send
+            replay_state["results"] = replay_state["window"] = None
+            return
+        root.after(100, _poll_replay)
+
+    def _open_replay():
+        if engine.spinning or replay_state["results"] is not None:
+            return
+        if round_log is not None:
+            round_log.flush()
+        result_var.set("Reading the round log...")
+        replay_state["results"] = queue.SimpleQueue()
+        threading.Thread(target=_verify_round_log, args=(replay_state["results"],),
+                         name="replay-check", daemon=True).start()
+        _poll_replay()
+
+    # --- Countdown Timer ---
+
+    def _cancel_countdown():
+        if timer_handle["id"] is not None:
+            root.after_cancel(timer_handle["id"])
+            timer_handle["id"] = None
+
+    def tick():
+        if not auto_enabled.get() or engine.spinning:
+            if auto_enabled.get():
+                timer_handle["id"] = root.after(1000, tick)
+            return
+        remaining = countdown_var.get()
+        if remaining > 0:
+            countdown_var.set(remaining - 1)
+            timer_handle["id"] = root.after(1000, tick)
+        else:
+            countdown_var.set(auto_interval_var.get())
+            run_spin()
+
+    def schedule_countdown(reset: bool = True):
+        _cancel_countdown()
+        if not auto_enabled.get() or remote is not None:
+            return
+        if reset:
+            countdown_var.set(auto_interval_var.get())
+        timer_handle["id"] = root.after(1000, tick)
+
+    # --- Table Server ---
+
+    def _load_remote_slip(bets: list[dict]):
+        """Replace the local slip with the server's copy (after a rejected action)."""
+        engine.clear_bets()
+        clear_markers()
+        for b in bets:
+            bet = engine.slip.add(b["id"], b["amount"], b["x"], b["y"])
+            place_marker(bet.key, bet.amount, bet.x, bet.y)
+        total_bet_var.set(engine.total_bet)
+
+    def _start_remote_spin(event: dict):
+        remote_state["round"] = event["round"]
+        if winners_overlay["active"]:
+            _clear_winner_flash()
+        run_spin(event["number"])
+
+    def _on_remote_event(event: dict):
+        kind = event.get("ev")
+        if kind == "tick" or kind == "open":
+            countdown_var.set(event["remaining"])
+        elif kind == "slip":
+            remote_state["bets"] = event["bets"]
+        elif kind == "spin":
+            remote_state["bets"] = []
+            if "balance" in event:
+                remote_state["settled"][event["round"]] = event
+            if engine.spinning:
+                remote_state["pending"].append(event)  # started once this spin has settled
+            else:
+                _start_remote_spin(event)
+        elif kind == "joined":
+            engine.balance = event["balance"]
+            remote_state["bets"] = event["bets"]
+            _load_remote_slip(event["bets"])
+            _sync_totals()
+            countdown_var.set(event["remaining"])
+            result_var.set(f"Seated at table {event['table']} as {event['seat']}")
+        elif kind == "error":
+            result_var.set(event["message"])
+            if not engine.spinning:
+                _load_remote_slip(remote_state["bets"])
+        elif kind == "closed":
+            result_var.set("Disconnected from the table server.")
+
+    def _poll_remote():
+        for event in remote.poll():
+            _on_remote_event(event)
+        if remote.connected:
+            root.after(50, _poll_remote)
+
+    # --- Keyboard Input ---
+
+    # "n" before a number places it with the racetrack's neighbours; "+" / "-" change the count
+    key_buffer = {"digits": "", "timer": None, "neighbours": False}
+
+    def _reset_keys():
+        key_buffer.update({"digits": "", "timer": None, "neighbours": False})
+
+    def _restart_key_timer():
+        if key_buffer["timer"]:
+            root.after_cancel(key_buffer["timer"])
+        key_buffer["timer"] = root.after(700, _reset_keys)
+
+    def _on_key(event):
+        if event.char in ("+", "-"):
+            racetrack["set_neighbours"](racetrack["neighbours"]() + (1 if event.char == "+" else -1))
+            return
+        if event.char in ("n", "N"):
+            key_buffer["neighbours"] = True
+            _restart_key_timer()
+            return
+        if not event.char.isdigit():
+            return
+        key_buffer["digits"] += event.char
+        _restart_key_timer()
+        try:
+            val = int(key_buffer["digits"])
+            if 0 <= val <= 36 and val in number_centers:
+                if key_buffer["neighbours"]:
+                    _place_neighbour_bet(val, racetrack["neighbours"]())
+                else:
+                    cx, cy = number_centers[val]
+                    _set_selection(val, cx, cy, place_marker)  # straight ids are the numbers
+                root.after_cancel(key_buffer["timer"])
+                _reset_keys()
+        except ValueError:
+            pass
+
+    root.bind("<Key>", _on_key)
+    root.bind("<F3>", lambda _e: probe_overlay["toggle"]())
+
+    # --- Initialize ---
+
+    history_strip["refresh"]()
+    _update_session_summary()
+    schedule_countdown()
+    if remote is not None:
+        root.title(f"JustAI Roulette - table {remote.table}, seat {remote.seat}")
+        _poll_remote()
+
+    root.update_idletasks()
+    root.minsize(min(screen_w - 16, root.winfo_reqwidth()),
+                 min(screen_h - 16, root.winfo_reqheight()))
+    root.protocol("WM_DELETE_WINDOW", _on_close)
+
+    if startup_report:
+        root.update()
+        mark("first frame")
+        _print_startup_report(_merge_phases(phases))
+        if remote is not None:
+            remote.close()
+        journal.close()
+        spin_history.close()
+        if round_log is not None:
+            round_log.close()
+        root.destroy()
+        return
+
+    # The audio backend is only loaded once sound is wanted, off the UI thread
+    if sound_enabled.get():
+        root.after_idle(warm_up_audio)
+    sound_enabled.trace_add("write", lambda *_: sound_enabled.get() and warm_up_audio())
+    root.mainloop()
+
@@ -1,93 +1,179 @@
-"""Cross-platform audio support for JustAI Roulette."""
+"""Cross-platform audio support for JustAI Roulette.
+
+Sounds are rendered once into a bank of 16-bit PCM buffers the first time
+one is needed, and played by a single long-lived worker thread fed through
+a small bounded queue.  When sounds pile up (e.g. a burst of ball clicks on
+a slow machine) duplicates are coalesced and overflow is dropped, so a
+sound never blocks the UI or allocates mid-animation.
+
+Nothing is probed at import time: the backend (simpleaudio, or winsound on
+Windows) is loaded by ``warm_up`` - on a background thread - or by the
+worker when the first sound is queued, so a session with sound off never
+pays for it.
+"""
 
 import sys
 import math
+import queue
+import random
 import threading
+from array import array
 
-_AUDIO_AVAILABLE = False
+_AUDIO_AVAILABLE: bool | None = None  # None until the backend is probed
 _sa = None
 _winsound = None
+_backend_lock = threading.Lock()
 
-try:
-    import simpleaudio as sa
-    _sa = sa
-    _AUDIO_AVAILABLE = True
-except ImportError:
-    try:
-        if sys.platform == "win32":
-            import winsound
-            _winsound = winsound
-            _AUDIO_AVAILABLE = True
-    except ImportError:
-        pass
+SAMPLE_RATE = 44100
+QUEUE_SIZE = 8
 
+# name -> (kind, frequency Hz, duration s, volume); kinds are rendered below
+SOUNDS: dict[str, tuple[str, float, float, float]] = {
+    "chip_place": ("tone", 800, 0.05, 0.2),
+    "spin": ("tone", 400, 0.1, 0.15),
+    "spin_start": ("sweep", 320, 0.35, 0.2),
+    "ball_click": ("click", 2600, 0.03, 0.3),
+    "ball_drop": ("tone", 600, 0.08, 0.25),
+    "win": ("tone", 523, 0.15, 0.3),       # C5
+    "big_win": ("tone", 659, 0.3, 0.4),    # E5
+}
 
-def is_audio_available() -> bool:
-    """Check if audio playback is available."""
+_bank: dict[str, bytes] = {}
+_bank_lock = threading.Lock()
+_waves: dict = {}  # simpleaudio WaveObjects, only touched by the worker
+_queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+
+
+def _load_backend() -> bool:
+    """Import the playback backend once; returns whether audio is available."""
+    global _AUDIO_AVAILABLE, _sa, _winsound
+    if _AUDIO_AVAILABLE is not None:
+        return _AUDIO_AVAILABLE
+    with _backend_lock:
+        if _AUDIO_AVAILABLE is None:
+            try:
+                import simpleaudio as sa
+                _sa = sa
+            except ImportError:
+                try:
+                    if sys.platform == "win32":
+                        import winsound
+                        _winsound = winsound
+                except ImportError:
+                    pass
+            _AUDIO_AVAILABLE = _sa is not None or _winsound is not None
     return _AUDIO_AVAILABLE
 
 
-def _generate_tone(frequency: float, duration: float, volume: float = 0.3) -> bytes:
-    """Generate a simple sine wave tone."""
+def is_audio_available() -> bool:
+    """Check if audio playback is available (loads the backend if needed)."""
+    return _load_backend()
+
+
+def warm_up() -> None:
+    """Load the backend and render the sample bank on a background thread."""
+    def _warm():
+        if _load_backend() and _sa is not None:
+            for name in SOUNDS:
+                sample(name)
+
+    threading.Thread(target=_warm, name="audio-warmup", daemon=True).start()
+
+
+def _render(kind: str, frequency: float, duration: float, volume: float) -> bytes:
+    """Render one sound as mono 16-bit PCM."""
+    count = int(SAMPLE_RATE * duration)
+    ramp = max(1, int(SAMPLE_RATE * 0.01))
+    noise = random.Random(0)
+    samples = array("h", bytes(2 * count))
+    phase = 0.0
+    for i in range(count):
+        t = i / SAMPLE_RATE
+        if kind == "sweep":
+            # Falling whoosh: the ball being launched around the track
+            phase += 2 * math.pi * frequency * (1 - 0.5 * i / count) / SAMPLE_RATE
+            value = 0.7 * math.sin(phase) + 0.3 * (noise.random() * 2 - 1)
+        elif kind == "click":
+            # Short decaying knock of the ball hitting a fret
+            value = (0.6 * math.sin(2 * math.pi * frequency * t)
+                     + 0.4 * (noise.random() * 2 - 1)) * math.exp(-t * 180)
+        else:
+            value = math.sin(2 * math.pi * frequency * t)
+        # Envelope to avoid clicks at the ends
+        env = min(1.0, (count - i) / ramp)
+        if kind != "click":
+            env = min(env, i / ramp)
+        samples[i] = int(value * env * volume * 32767)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def sample(sound_name: str) -> bytes | None:
+    """Pre-rendered PCM for ``sound_name`` (rendered on first use, then cached)."""
+    data = _bank.get(sound_name)
+    if data is None and sound_name in SOUNDS:
+        with _bank_lock:
+            data = _bank.get(sound_name)
+            if data is None:
+                data = _bank[sound_name] = _render(*SOUNDS[sound_name])
+    return data
+
+
+def _play_now(sound_name: str) -> None:
     try:
-        import numpy as np
-        sample_rate = 44100
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        tone = np.sin(2 * np.pi * frequency * t) * volume
-        # Apply envelope to avoid clicks
-        attack = int(sample_rate * 0.01)
-        release = int(sample_rate * 0.01)
-        envelope = np.ones_like(tone)
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
-        tone = tone * envelope
-        audio = (tone * 32767).astype(np.int16)
-        return audio.tobytes()
-    except ImportError:
-        return b""
+        if _sa:
+            wave = _waves.get(sound_name)
+            if wave is None:
+                wave = _waves[sound_name] = _sa.WaveObject(sample(sound_name), 1, 2, SAMPLE_RATE)
+            wave.play()
+        elif _winsound and sys.platform == "win32":
+            # Fallback to Windows beep (blocks, which paces the queue)
+            _, freq, dur, _ = SOUNDS[sound_name]
+            _winsound.Beep(int(freq), max(20, int(dur * 1000)))
+    except Exception:
+        pass  # Silently fail if audio doesn't work
+
+
+def _run() -> None:
+    if not _load_backend():
+        return
+    while True:
+        names = [_queue.get()]
+        while True:
+            try:
+                names.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        # Coalesce a backlog: each sound plays at most once per batch
+        for name in dict.fromkeys(names):
+            _play_now(name)
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_run, name="audio", daemon=True)
+                _worker.start()
 
 
 def play_sound(sound_name: str, enabled: bool = True) -> None:
     """
-    Play a sound effect.
+    Play a sound effect without blocking.
 
     Args:
-        sound_name: One of 'chip_place', 'spin', 'ball_drop', 'win', 'big_win'
+        sound_name: A key of ``SOUNDS``, e.g. 'chip_place', 'spin_start',
+            'ball_click', 'win', 'big_win'
         enabled: Whether sound is enabled
     """
-    if not enabled or not _AUDIO_AVAILABLE:
+    if not enabled or _AUDIO_AVAILABLE is False or sound_name not in SOUNDS:
         return
-
-    def _play():
-        try:
-            if _sa:
-                # Use simpleaudio with generated tones
-                sounds = {
-                    "chip_place": (800, 0.05, 0.2),
-                    "spin": (400, 0.1, 0.15),
-                    "ball_drop": (600, 0.08, 0.25),
-                    "win": (523, 0.15, 0.3),       # C5
-                    "big_win": (659, 0.3, 0.4),    # E5
-                }
-                if sound_name in sounds:
-                    freq, dur, vol = sounds[sound_name]
-                    audio_data = _generate_tone(freq, dur, vol)
-                    if audio_data:
-                        wave_obj = _sa.WaveObject(audio_data, 1, 2, 44100)
-                        wave_obj.play()
-            elif _winsound and sys.platform == "win32":
-                # Fallback to Windows beep
-                freqs = {
-                    "chip_place": 800,
-                    "spin": 400,
-                    "ball_drop": 600,
-                    "win": 523,
-                    "big_win": 659,
-                }
-                if sound_name in freqs:
-                    _winsound.Beep(freqs[sound_name], 50)
-        except Exception:
-            pass  # Silently fail if audio doesn't work
-
-    # Play in background thread to avoid blocking UI
-    threading.Thread(target=_play, daemon=True).start()
+    _ensure_worker()
+    try:
+        _queue.put_nowait(sound_name)
+    except queue.Full:
+        pass  # Already behind; dropping beats playing late
@@ -0,0 +1,72 @@
+"""Blocking client for ``justai_roulette.server``, for use from the Tk thread.
+
+A reader thread decodes server events into a queue; the UI drains it with
+``poll`` from a ``root.after`` loop, so no socket call ever blocks a frame.
+"""
+
+import json
+import queue
+import socket
+import threading
+
+from .server import DEFAULT_PORT, encode
+
+
+class RemoteSeat:
+    """A seat at a server table."""
+
+    def __init__(self, table: str, seat: str, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 timeout: float = 5.0):
+        self.table = table
+        self.seat = seat
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.settimeout(None)
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self.connected = True
+        self.send("join", table=table, seat=seat)
+        self._thread = threading.Thread(target=self._run, name="remote-seat", daemon=True)
+        self._thread.start()
+
+    def send(self, op: str, **fields) -> None:
+        """Send a request; a dropped connection surfaces as a ``closed`` event."""
+        try:
+            with self._lock:
+                self._sock.sendall(encode({"op": op, **fields}))
+        except OSError:
+            self._lost()
+
+    def poll(self) -> list[dict]:
+        """Events received since the last call, oldest first."""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self) -> None:
+        if self.connected:
+            self.send("leave")
+        self.connected = False
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+    def _lost(self) -> None:
+        if self.connected:
+            self._events.put({"ev": "closed"})
+            self.connected = False
+
+    def _run(self) -> None:
+        try:
+            with self._sock.makefile("rb") as stream:
+                for line in stream:
+                    try:
+                        self._events.put(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        self._lost()
@@ -55,6 +55,12 @@ class Colors:
 
 # Session and limits
 SESSION_FILE = Path.home() / ".justai_roulette_session.json"
+JOURNAL_FILE = Path.home() / ".justai_roulette_session.journal"
+HISTORY_FILE = Path.home() / ".justai_roulette_history.bin"
+ROUND_LOG_FILE = Path.home() / ".justai_roulette_rounds.bin"
+REPLAY_WINDOW = 10_000  # most recent rounds the replay window steps through
+PROBES_FILE = Path.home() / ".justai_roulette_probes.json"
+PROFILE_DIR = Path.home() / ".justai_roulette_profile"
 MAX_SINGLE_BET = 100.0
 DEFAULT_BALANCE = 100.0
 
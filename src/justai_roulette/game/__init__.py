@@ -1,3 +1,5 @@
 """Game logic for JustAI Roulette."""
 
 from .bets import QUICK_BETS, CALL_BETS, get_number_color, calculate_winnings
+from .engine import RouletteEngine, BetError, SpinResult
+from .stats import SpinStats
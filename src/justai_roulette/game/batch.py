@@ -0,0 +1,66 @@
+"""Vectorised settlement of bet slips against arrays of spin outcomes.
+
+Requires NumPy (``pip install justai-roulette[sim]``).  Each slip is reduced
+to its 37-slot return vector once; settling is then a fancy-index into a
+37 x K payout matrix instead of a Python loop per bet per spin.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from .bets import POCKETS
+from .slip import BetSlip
+
+
+def payout_vector(slip) -> np.ndarray:
+    """Net result per pocket for ``slip`` (a BetSlip or a list of bet dicts)."""
+    if isinstance(slip, BetSlip):
+        returns, stake = slip.returns, slip.total
+    else:
+        returns = [0.0] * POCKETS
+        stake = 0.0
+        for bet in slip:
+            win = bet["amount"] * (bet["payout"] + 1)
+            for n in bet["numbers"]:
+                returns[n] += win
+            stake += bet["amount"]
+    return np.asarray(returns, dtype=np.float64) - stake
+
+
+def payout_matrix(slips: Iterable) -> np.ndarray:
+    """Stack the payout vectors of several slips into a 37 x K matrix."""
+    columns = [payout_vector(s) for s in slips]
+    if not columns:
+        return np.zeros((POCKETS, 0), dtype=np.float64)
+    return np.stack(columns, axis=1)
+
+
+def _check_outcomes(outcomes) -> np.ndarray:
+    outcomes = np.asarray(outcomes)
+    if outcomes.dtype.kind not in "iu":
+        raise TypeError(f"outcomes must be an integer array, got {outcomes.dtype}")
+    if outcomes.size and (outcomes.min() < 0 or outcomes.max() >= POCKETS):
+        raise ValueError("outcomes must be pocket numbers 0-36")
+    return outcomes
+
+
+def settle_batch(slip, outcomes) -> np.ndarray:
+    """Net win/loss of ``slip`` on every spin in ``outcomes``.
+
+    Returns a float64 array shaped like ``outcomes``.
+    """
+    return payout_vector(slip)[_check_outcomes(outcomes)]
+
+
+def settle_matrix(slips, outcomes) -> np.ndarray:
+    """Net win/loss of every slip on every spin.
+
+    ``slips`` may be an iterable of slips or a payout matrix from
+    ``payout_matrix``.  Returns an array of shape ``(len(outcomes), K)``;
+    for very long outcome arrays settle in chunks to bound memory.
+    """
+    matrix = slips if isinstance(slips, np.ndarray) else payout_matrix(slips)
+    if matrix.ndim != 2 or matrix.shape[0] != POCKETS:
+        raise ValueError(f"payout matrix must be {POCKETS} x K, got {matrix.shape}")
+    return matrix[_check_outcomes(outcomes)]
@@ -2,6 +2,8 @@
 
 from ..constants import RED_NUMBERS, COLUMNS
 
+POCKETS = 37
+
 # Quick bet definitions for RSL-style one-touch betting
 # Format: (numbers, payout)
 QUICK_BETS = {
@@ -71,12 +73,21 @@ def get_number_color(num: int) -> str:
     return "red" if num in RED_NUMBERS else "black"
 
 
+def number_mask(numbers) -> int:
+    """Coverage bitmask for a bet: bit ``n`` is set if the bet covers pocket ``n``."""
+    mask = 0
+    for n in numbers:
+        mask |= 1 << n
+    return mask
+
+
 def calculate_winnings(bets: list[dict], winning_number: int) -> tuple[float, list[dict]]:
     """
     Calculate total winnings from placed bets.
 
     Args:
         bets: List of bet dicts with 'numbers', 'payout', 'amount' keys
+            (and optionally a precomputed 'mask' from number_mask)
         winning_number: The winning roulette number
 
     Returns:
@@ -84,9 +95,11 @@ def calculate_winnings(bets: list[dict], winning_number: int) -> tuple[float, li
     """
     total = 0.0
     winners = []
+    bit = 1 << winning_number
 
     for bet in bets:
-        if winning_number in bet["numbers"]:
+        mask = bet.get("mask")
+        if (mask & bit) if mask is not None else winning_number in bet["numbers"]:
             win_amount = bet["amount"] * (bet["payout"] + 1)
             total += win_amount
             winners.append({**bet, "win_amount": win_amount})
@@ -0,0 +1,85 @@
+"""Every legal European roulette bet, numbered.
+
+The catalogue is built once at import.  ``CATALOGUE[i]`` is the ``BetDef``
+with id ``i``, and each bet carries its sorted numbers, payout and coverage
+bitmask, so slips, hit-testing, call bets and the round log all refer to
+bets by a small integer instead of rebuilding number lists.
+
+Ids are stored in round logs: new bets may only ever be appended.
+Straights come first, so the straight on ``n`` has id ``n``.
+"""
+
+from typing import NamedTuple
+
+from .bets import CALL_BETS, QUICK_BETS, number_mask
+
+STRAIGHT = "straight"
+SPLIT = "split"
+STREET = "street"
+TRIO = "trio"
+CORNER = "corner"
+BASKET = "basket"
+SIX_LINE = "six line"
+OUTSIDE = "outside"
+
+PAYOUTS = {STRAIGHT: 35, SPLIT: 17, STREET: 11, TRIO: 11, CORNER: 8, BASKET: 6, SIX_LINE: 5}
+
+
+class BetDef(NamedTuple):
+    """One bet in the catalogue."""
+    id: int
+    kind: str
+    label: str
+    numbers: tuple[int, ...]  # sorted
+    payout: int
+    mask: int
+
+
+def _inside_bets() -> list[tuple[str, str, tuple[int, ...]]]:
+    """(kind, label, numbers) for every inside bet, in id order."""
+    bets = [(STRAIGHT, f"Straight {n}", (n,)) for n in range(37)]
+    bets += [(SPLIT, f"Split 0/{n}", (0, n)) for n in (1, 2, 3)]
+    bets += [(SPLIT, f"Split {n}/{n + 3}", (n, n + 3)) for n in range(1, 34)]
+    bets += [(SPLIT, f"Split {n}/{n + 1}", (n, n + 1)) for n in range(1, 36) if n % 3]
+    bets += [(STREET, f"Street {n}-{n + 2}", (n, n + 1, n + 2)) for n in range(1, 37, 3)]
+    bets += [(TRIO, "Trio 0/1/2", (0, 1, 2)), (TRIO, "Trio 0/2/3", (0, 2, 3))]
+    bets += [(CORNER, f"Corner {n}/{n + 1}/{n + 3}/{n + 4}", (n, n + 1, n + 3, n + 4))
+             for n in range(1, 33) if n % 3]
+    bets += [(BASKET, "First Four", (0, 1, 2, 3))]
+    bets += [(SIX_LINE, f"Six Line {n}-{n + 5}", tuple(range(n, n + 6))) for n in range(1, 32, 3)]
+    return bets
+
+
+def _build() -> tuple[BetDef, ...]:
+    specs = [(kind, label, numbers, PAYOUTS[kind]) for kind, label, numbers in _inside_bets()]
+    specs += [(OUTSIDE, name, tuple(sorted(numbers)), payout)
+              for name, (numbers, payout) in QUICK_BETS.items()]
+    return tuple(BetDef(i, kind, label, numbers, payout, number_mask(numbers))
+                 for i, (kind, label, numbers, payout) in enumerate(specs))
+
+
+CATALOGUE: tuple[BetDef, ...] = _build()
+BY_NUMBERS: dict[tuple[int, ...], BetDef] = {b.numbers: b for b in CATALOGUE}
+BY_LABEL: dict[str, BetDef] = {b.label: b for b in CATALOGUE}
+
+
+def find_bet(numbers) -> BetDef | None:
+    """The catalogue bet covering exactly ``numbers`` (in any order), or None."""
+    return BY_NUMBERS.get(tuple(sorted(numbers)))
+
+
+def _call_bet_ids() -> dict[str, tuple[tuple[int, int], ...]]:
+    table = {}
+    for name, components in CALL_BETS.items():
+        ids = []
+        for numbers, payout, chips in components:
+            bet = find_bet(numbers)
+            if bet is None or bet.payout != payout:
+                raise ValueError(f"{name}: {numbers} at {payout}:1 is not a legal bet")
+            ids.append((bet.id, chips))
+        table[name] = tuple(ids)
+    return table
+
+
+# Call bets as (bet id, chips) components
+CALL_BET_IDS: dict[str, tuple[tuple[int, int], ...]] = _call_bet_ids()
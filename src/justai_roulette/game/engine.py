@@ -0,0 +1,380 @@
+"""Headless roulette engine - balance, bet slip, history and stats.
+
+The Tk UI only drives this object; nothing in here touches a widget, so a
+spin can be settled (and profiled) without a display server.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .. import probes
+from ..constants import DEFAULT_BALANCE, MAX_SINGLE_BET
+from .bets import CALL_BETS, QUICK_BETS, get_number_color
+from .catalogue import BY_LABEL, CALL_BET_IDS, CATALOGUE
+from .history import SpinHistory
+from .rng import Rng, SystemRng
+from .roundlog import RoundLog
+from .slip import Bet, BetSlip
+from .stats import DEFAULT_WINDOWS, SpinStats
+from .wheel import neighbours
+
+
+class BetError(ValueError):
+    """Raised when a bet cannot be placed; the message is shown to the player."""
+
+
+@dataclass
+class SpinResult:
+    """Outcome of one settled spin."""
+    number: int
+    color: str
+    bet_amount: float
+    total_win: float
+    max_payout: int = 0
+    winners: list[Bet] = field(default_factory=list)
+
+    @property
+    def is_big_win(self) -> bool:
+        return self.total_win > 0 and (self.total_win >= self.bet_amount * 10 or self.max_payout >= 35)
+
+
+@dataclass
+class AutoplayResult:
+    """Outcome of ``RouletteEngine.autoplay``."""
+    spins: int
+    bet_total: float
+    win_total: float
+    biggest_win: float
+    stopped: str  # "done" or "balance" (the stake could no longer be covered)
+
+
+class RouletteEngine:
+    """Game rules for a single European roulette seat.
+
+    Frequency counts live in ``stats`` (a ``SpinStats``) and are rebuilt from
+    ``hot_counts`` plus the recent history; ``color_counts`` and
+    ``parity_counts`` are accepted for compatibility but derived from the
+    per-pocket counts, so older sessions with stale parity totals self-heal.
+    """
+
+    def __init__(
+        self,
+        balance: float = DEFAULT_BALANCE,
+        history: SpinHistory | list[tuple[int, str]] | None = None,
+        hot_counts: dict[int, int] | None = None,
+        color_counts: dict[str, int] | None = None,
+        parity_counts: dict[str, int] | None = None,
+        session_stats: dict[str, Any] | None = None,
+        currency: str = "$",
+        max_single_bet: float = MAX_SINGLE_BET,
+        rng: Rng | None = None,
+        stat_windows: tuple[int, ...] = DEFAULT_WINDOWS,
+        round_log: RoundLog | None = None,
+    ):
+        self.balance = float(balance)
+        self.currency = currency
+        self.max_single_bet = max_single_bet
+        if isinstance(history, SpinHistory):
+            self.history = history
+        else:
+            # Legacy (number, color) list, newest first
+            self.history = SpinHistory.from_numbers(n for n, _ in reversed(list(history or [])))
+        recent = self.history.recent(max(stat_windows, default=0))
+        self.stats = SpinStats.restore(hot_counts, reversed(recent), stat_windows)
+        self.session_stats: dict[str, Any] = dict(
+            session_stats or {"spins": 0, "bet_total": 0.0, "win_total": 0.0}
+        )
+        self.slip = BetSlip()
+        self.last_slip = BetSlip()
+        self.last_number: int | None = None
+        self.spinning = False
+        self.rng: Rng = rng or SystemRng()  # outcomes only - never cosmetic draws
+        self.round_log = round_log
+        self._pending: tuple[int, BetSlip, float] | None = None
+
+    @classmethod
+    def from_session(cls, session, **kwargs) -> "RouletteEngine":
+        """Build an engine from a loaded SessionData.
+
+        Pass ``history=`` to use a persistent SpinHistory instead of the
+        short list kept in the session file.
+        """
+        kwargs.setdefault("history", session.history)
+        return cls(
+            balance=session.balance,
+            hot_counts=session.hot_counts,
+            color_counts=session.color_counts,
+            parity_counts=session.parity_counts,
+            session_stats=session.session_stats,
+            currency=session.currency,
+            **kwargs,
+        )
+
+    # --- Stats ---
+
+    @property
+    def hot_counts(self) -> dict[int, int]:
+        """All-time spins per pocket (pockets never hit are omitted)."""
+        return {n: c for n, c in enumerate(self.stats.all_time.pockets) if c}
+
+    @property
+    def color_counts(self) -> dict[str, int]:
+        return self.stats.counts("color")
+
+    @property
+    def parity_counts(self) -> dict[str, int]:
+        return self.stats.counts("parity")
+
+    # --- Bet slip ---
+
+    @property
+    def total_bet(self) -> float:
+        return self.slip.total
+
+    @property
+    def stake(self) -> float:
+        """Amount riding on the spin in progress (0 when idle)."""
+        return self._pending[1].total if self._pending else 0.0
+
+    def _check_open(self) -> None:
+        if self.spinning:
+            raise BetError("Wait for spin...")
+
+    def _check_amount(self, bet_id: int, amount: float) -> None:
+        """Reject a stake that is not positive and finite, or over ``max_single_bet``.
+
+        Chips already on ``bet_id`` count towards the limit.
+        """
+        if not 0 < amount < math.inf:
+            raise BetError("Bet amount must be a positive number.")
+        placed = self.slip.get(bet_id)
+        if (placed.amount if placed else 0.0) + amount > self.max_single_bet:
+            raise BetError(f"Max bet: {self.currency}{self.max_single_bet:,.2f}")
+
+    def place_bet(self, bet_id: int, amount: float, x: float = 0.0, y: float = 0.0) -> Bet:
+        """Add a chip on catalogue bet ``bet_id``, stacking onto it if already placed."""
+        self._check_open()
+        if not 0 <= bet_id < len(CATALOGUE):
+            raise BetError(f"Unknown bet id: {bet_id}")
+        self._check_amount(bet_id, amount)
+        if self.total_bet + amount > self.balance:
+            raise BetError("Insufficient balance!")
+        return self.slip.add(bet_id, amount, x, y)
+
+    def place_quick_bet(self, bet_name: str, amount: float,
+                        x: float = 0.0, y: float = 0.0) -> Bet:
+        """Place one of the QUICK_BETS outside bets."""
+        self._check_open()
+        if bet_name not in QUICK_BETS:
+            raise BetError(f"Unknown bet: {bet_name}")
+        bet_id = BY_LABEL[bet_name].id
+        self._check_amount(bet_id, amount)
+        if self.total_bet + amount > self.balance:
+            raise BetError("Insufficient balance.")
+        return self.slip.add(bet_id, amount, x, y)
+
+    def place_call_bet(self, bet_name: str, chip_amount: float,
+                       locate: Callable[[int], tuple[float, float]] | None = None) -> list[Bet]:
+        """Place every component of an announced bet from CALL_BETS.
+
+        ``locate`` maps a component's bet id to the marker position; it is
+        only needed by front ends that draw chips.
+        """
+        self._check_open()
+        if bet_name not in CALL_BETS:
+            raise BetError(f"Unknown bet: {bet_name}")
+        bets = CALL_BET_IDS[bet_name]
+        for bet_id, chips in bets:
+            self._check_amount(bet_id, chip_amount * chips)
+        total_chips = sum(c for _, c in bets)
+        if self.total_bet + chip_amount * total_chips > self.balance:
+            raise BetError(f"Need {total_chips} chips for {bet_name}.")
+
+        return self.slip.add_group(
+            (bet_id, chip_amount * chips, *(locate(bet_id) if locate else (0.0, 0.0)))
+            for bet_id, chips in bets
+        )
+
+    def place_neighbour_bet(self, number: int, k: int, chip_amount: float,
+                            locate: Callable[[int], tuple[float, float]] | None = None) -> list[Bet]:
+        """Place ``number`` and ``k`` neighbours either side as one undoable action.
+
+        Each pocket gets one straight of ``chip_amount``; ``locate`` is as for
+        ``place_call_bet``.
+        """
+        self._check_open()
+        try:
+            bet_ids = neighbours(number, k)
+        except ValueError as exc:
+            raise BetError(str(exc)) from None
+        for bet_id in bet_ids:
+            self._check_amount(bet_id, chip_amount)
+        if self.total_bet + chip_amount * len(bet_ids) > self.balance:
+            raise BetError(f"Need {len(bet_ids)} chips for {number} and {k} neighbours.")
+
+        return self.slip.add_group(
+            (bet_id, chip_amount, *(locate(bet_id) if locate else (0.0, 0.0)))
+            for bet_id in bet_ids
+        )
+
+    def undo_last(self) -> list[Bet]:
+        """Revert the last chip action and return the bets it touched.
+
+        Bets that the action created come back with ``amount`` 0; an empty
+        list means there was nothing to undo.
+        """
+        if self.spinning:
+            return []
+        return self.slip.undo()
+
+    def clear_bets(self) -> None:
+        self.slip.clear()
+
+    def rebet(self) -> list[Bet]:
+        """Replace the slip with the previous spin's bets and return them (empty if none)."""
+        if self.spinning or not self.last_slip:
+            return []
+        if self.last_slip.total > self.balance:
+            raise BetError("Insufficient balance to re-bet.")
+        return self.slip.restore(self.last_slip)
+
+    def double_bets(self) -> bool:
+        """Double every bet on the slip. Returns False if the slip is empty."""
+        if self.spinning or not self.slip:
+            return False
+        if self.total_bet * 2 > self.balance:
+            raise BetError("Insufficient balance to double.")
+        self.slip.double()
+        return True
+
+    # --- Balance ---
+
+    def add_balance(self, amount: float) -> None:
+        if amount > 0:
+            self.balance += amount
+
+    def reset(self, balance: float = DEFAULT_BALANCE) -> None:
+        """Start a fresh session: clears the slip, balance and stats.
+
+        The spin history is the machine's lifetime record and is kept.
+        """
+        self.clear_bets()
+        self.balance = float(balance)
+        self.session_stats.update({"spins": 0, "bet_total": 0.0, "win_total": 0.0})
+        self.stats.reset()
+
+    # --- Spin ---
+
+    def begin_spin(self, number: int | None = None) -> int:
+        """Close betting and pick the outcome. Returns the winning number.
+
+        The slip is snapshotted here so the UI can animate while the bets
+        stay frozen; call ``finish_spin`` to settle.
+        """
+        if self.spinning:
+            raise BetError("Wait for spin...")
+        slip = self.slip
+        if slip.total > 0 and slip and slip.total <= self.balance:
+            self.last_slip = slip  # never mutated again; rebet copies out of it
+        else:
+            slip = BetSlip()
+        self.slip = BetSlip()
+
+        if number is None:
+            number = self.rng.pocket()
+        self.spinning = True
+        self._pending = (number, slip, time.time())
+        return number
+
+    def finish_spin(self) -> SpinResult:
+        """Settle the spin started by ``begin_spin``."""
+        if self._pending is None:
+            raise RuntimeError("finish_spin() called without begin_spin()")
+        started = probes.start()
+        number, slip, opened = self._pending
+        self._pending = None
+        color = get_number_color(number)
+
+        bet_amount = slip.total
+        total_win = slip.payout(number)
+        winners = slip.winners(number) if total_win else []
+        max_payout = max((b.payout for b in winners), default=0)
+
+        before = self.balance
+        self.balance += total_win - bet_amount
+        if self.round_log is not None:
+            self.round_log.append(number, slip, before, self.balance, total_win, opened)
+            self.round_log.flush()
+        self.session_stats["spins"] += 1
+        self.session_stats["bet_total"] += bet_amount
+        self.session_stats["win_total"] += total_win
+
+        self.history.append(number)
+        self.stats.record(number)
+        self.last_number = number
+
+        self.spinning = False
+        probes.stop("settle", started)
+        return SpinResult(number, color, bet_amount, total_win, max_payout, winners)
+
+    def spin(self, number: int | None = None) -> SpinResult:
+        """Run a whole round with no animation."""
+        self.begin_spin(number)
+        return self.finish_spin()
+
+    def autoplay(self, slip: BetSlip, spins: int) -> AutoplayResult:
+        """Re-bet ``slip`` for up to ``spins`` rounds, as fast as possible.
+
+        Applies the same limits as placing the bets and re-betting by hand:
+        every bet must be within ``max_single_bet`` and play stops once the
+        stake exceeds the balance.  Only the return vector is consulted per
+        spin; history and stats are updated once at the end.  With a
+        ``round_log`` every round is still recorded, stamped once per block
+        of outcomes.  The slip is copied first, so the caller may go on
+        editing it.
+        """
+        self._check_open()
+        slip = slip.copy()  # frozen, like a spun slip: the log and rebet rely on it
+        for bet in slip:
+            if bet.amount > self.max_single_bet:
+                raise BetError(f"Max bet: {self.currency}{self.max_single_bet:,.2f}")
+        stake, returns = slip.total, slip.returns
+        balance = self.balance
+        log = self.round_log
+        outcomes = bytearray()
+        won = biggest = 0.0
+        stopped = "done"
+        remaining = spins
+        while remaining > 0 and stopped == "done":
+            block = self.rng.pockets(min(remaining, 4096))
+            remaining -= len(block)
+            opened = time.time()
+            for number in block:
+                if stake > balance:
+                    stopped = "balance"
+                    break
+                outcomes.append(number)
+                win = returns[number]
+                if log is not None:
+                    log.append(number, slip, balance, balance + win - stake, win, opened, opened)
+                balance += win - stake
+                if win:
+                    won += win
+                    if win > biggest:
+                        biggest = win
+        played = len(outcomes)
+        if log is not None:
+            log.flush()
+
+        self.balance = balance
+        self.session_stats["spins"] += played
+        self.session_stats["bet_total"] += stake * played
+        self.session_stats["win_total"] += won
+        self.history.extend(bytes(outcomes))
+        self.stats.record_many(bytes(outcomes))
+        if played:
+            self.last_number = outcomes[-1]
+            self.last_slip = slip
+        return AutoplayResult(played, stake * played, won, biggest, stopped)
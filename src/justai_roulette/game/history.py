@@ -0,0 +1,191 @@
+"""Compact, unbounded spin history.
+
+Each spin is stored as a single byte (the pocket number), optionally with a
+float64 timestamp column.  Storage is either in memory or a memory-mapped
+file, so a machine can keep its lifetime history - millions of spins -
+without it living in the session JSON.
+
+Buffers grow in large steps by allocating a bigger buffer rather than
+resizing in place, so NumPy views handed out by ``numbers_array`` stay valid
+(they simply stop seeing newer spins).
+"""
+
+import mmap
+import os
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+_MAGIC = b"JRHIST01"
+_HEADER = struct.Struct("<8sQ")  # magic, spin count
+_GROW = 1 << 16  # spins per growth step
+_MEM_START = 1 << 10  # in-memory histories start small (a server keeps one per seat)
+
+
+class _Column:
+    """Fixed-width column in a growable bytearray or memory-mapped file."""
+
+    def __init__(self, fmt: str, path: Path | None = None, offset: int = 0):
+        self.fmt = fmt
+        self.itemsize = struct.calcsize(fmt)
+        self.offset = offset
+        self._fh = None
+        if path is not None:
+            self._fh = open(path, "r+b" if path.exists() else "w+b")
+            size = os.fstat(self._fh.fileno()).st_size
+            capacity = max(_GROW, (size - offset) // self.itemsize)
+        else:
+            capacity = _MEM_START
+        self._map(capacity)
+
+    def _map(self, capacity: int) -> None:
+        nbytes = self.offset + capacity * self.itemsize
+        if self._fh is not None:
+            if os.fstat(self._fh.fileno()).st_size < nbytes:
+                os.ftruncate(self._fh.fileno(), nbytes)
+            self.buf = mmap.mmap(self._fh.fileno(), nbytes)
+        else:
+            old = getattr(self, "buf", None)
+            self.buf = bytearray(nbytes)
+            if old is not None:
+                self.buf[:len(old)] = old
+        self.capacity = capacity
+        self.view = memoryview(self.buf)[self.offset:].cast(self.fmt)
+
+    def ensure(self, count: int) -> None:
+        if count > self.capacity:
+            self._map(max(count, self.capacity * 2, self.capacity + _GROW))
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self.buf.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.view = None
+        if self._fh is not None:
+            try:
+                self.buf.close()
+            except BufferError:
+                pass  # a NumPy view is still alive; the mapping goes with it
+            self._fh.close()
+            self._fh = None
+
+
+class SpinHistory:
+    """Append-only record of spin outcomes, oldest first.
+
+    ``path`` selects a memory-mapped file (plus ``<path>.ts`` for timestamps);
+    without it the history lives in memory.
+    """
+
+    def __init__(self, path: Path | str | None = None, timestamps: bool = False):
+        self.path = Path(path) if path is not None else None
+        self._count = 0
+        self._numbers = _Column("B", self.path, offset=_HEADER.size)
+        if self.path is not None:
+            magic, count = _HEADER.unpack_from(self._numbers.buf, 0)
+            if magic == _MAGIC:
+                self._count = min(count, self._numbers.capacity)
+            else:
+                _HEADER.pack_into(self._numbers.buf, 0, _MAGIC, 0)
+        self._times = None
+        if timestamps:
+            ts_path = self.path.with_name(self.path.name + ".ts") if self.path else None
+            self._times = _Column("d", ts_path)
+            self._times.ensure(self._count)
+
+    @classmethod
+    def from_numbers(cls, numbers: Iterable[int], **kwargs) -> "SpinHistory":
+        """Build a history from outcomes listed oldest first."""
+        history = cls(**kwargs)
+        for n in numbers:
+            history.append(n)
+        return history
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("spin history index out of range")
+        return self._numbers.view[index]
+
+    def __iter__(self) -> Iterator[int]:
+        view = self._numbers.view
+        return (view[i] for i in range(self._count))
+
+    def __reversed__(self) -> Iterator[int]:
+        view = self._numbers.view
+        return (view[i] for i in range(self._count - 1, -1, -1))
+
+    @property
+    def has_timestamps(self) -> bool:
+        return self._times is not None
+
+    def append(self, number: int, ts: float | None = None) -> None:
+        count = self._count + 1
+        self._numbers.ensure(count)
+        self._numbers.view[count - 1] = number
+        if self._times is not None:
+            self._times.ensure(count)
+            self._times.view[count - 1] = time.time() if ts is None else ts
+        self._count = count
+        if self.path is not None:
+            _HEADER.pack_into(self._numbers.buf, 0, _MAGIC, count)
+
+    def extend(self, numbers: bytes, ts: float | None = None) -> None:
+        """Append many outcomes (one byte each, oldest first) in one copy."""
+        start, count = self._count, self._count + len(numbers)
+        self._numbers.ensure(count)
+        self._numbers.view[start:count] = memoryview(numbers).cast("B")
+        if self._times is not None:
+            self._times.ensure(count)
+            stamp = time.time() if ts is None else ts
+            self._times.view[start:count] = array("d", [stamp]) * (count - start)
+        self._count = count
+        if self.path is not None:
+            _HEADER.pack_into(self._numbers.buf, 0, _MAGIC, count)
+
+    def recent(self, n: int) -> list[int]:
+        """The last ``n`` outcomes, newest first."""
+        start = max(0, self._count - n)
+        return self._numbers.view[start:self._count].tolist()[::-1]
+
+    def last(self) -> int | None:
+        return self._numbers.view[self._count - 1] if self._count else None
+
+    def clear(self) -> None:
+        self._count = 0
+        if self.path is not None:
+            _HEADER.pack_into(self._numbers.buf, 0, _MAGIC, 0)
+
+    def numbers_array(self):
+        """Zero-copy ``uint8`` NumPy view of all outcomes, oldest first."""
+        import numpy as np
+        return np.frombuffer(self._numbers.buf, dtype=np.uint8, count=self._count,
+                             offset=self._numbers.offset)
+
+    def times_array(self):
+        """Zero-copy ``float64`` NumPy view of spin timestamps (None if not recorded)."""
+        if self._times is None:
+            return None
+        import numpy as np
+        return np.frombuffer(self._times.buf, dtype=np.float64, count=self._count)
+
+    def flush(self) -> None:
+        self._numbers.flush()
+        if self._times is not None:
+            self._times.flush()
+
+    def close(self) -> None:
+        self._numbers.close()
+        if self._times is not None:
+            self._times.close()
@@ -0,0 +1,111 @@
+"""Outcome random number generators.
+
+Every winning number is drawn through an ``Rng``; nothing else (animation,
+flashing numbers) may use the outcome stream, so an audit only has to look
+at the generator handed to the engine.
+
+- ``SeededRng`` - Mersenne Twister with a seed, for reproducible runs.
+- ``SystemRng`` - the OS CSPRNG (``secrets`` / ``os.urandom``), for live play.
+- ``NumpyRng`` - a NumPy ``Generator`` drawing outcomes in blocks, for bulk
+  analytics and the simulator (requires NumPy).
+"""
+
+import os
+import random
+import secrets
+
+from .bets import POCKETS
+
+# Largest multiple of 37 that fits in a byte; bytes at or above it are
+# rejected so every pocket stays equally likely.
+_BYTE_LIMIT = 256 - 256 % POCKETS
+
+
+class Rng:
+    """Source of roulette outcomes (0-36)."""
+
+    def pocket(self) -> int:
+        """Draw one outcome."""
+        raise NotImplementedError
+
+    def pockets(self, count: int) -> bytes:
+        """Draw ``count`` outcomes, one byte each, in draw order."""
+        return bytes(self.pocket() for _ in range(count))
+
+
+class SeededRng(Rng):
+    """Reproducible outcomes from ``random.Random(seed)``."""
+
+    def __init__(self, seed: int | None = None):
+        self.seed = seed
+        self._random = random.Random(seed)
+
+    def pocket(self) -> int:
+        return self._random.randrange(POCKETS)
+
+    def pockets(self, count: int) -> bytes:
+        randrange = self._random.randrange
+        return bytes([randrange(POCKETS) for _ in range(count)])
+
+
+class SystemRng(Rng):
+    """Cryptographically strong outcomes from the operating system."""
+
+    def pocket(self) -> int:
+        return secrets.randbelow(POCKETS)
+
+    def pockets(self, count: int) -> bytes:
+        out = bytearray()
+        while len(out) < count:
+            # ~13% of bytes are rejected, so over-draw a little
+            raw = os.urandom((count - len(out)) * 8 // 7 + 16)
+            out += bytes(b % POCKETS for b in raw if b < _BYTE_LIMIT)
+        return bytes(out[:count])
+
+
+class NumpyRng(Rng):
+    """Outcomes pre-drawn in blocks from a NumPy ``Generator``.
+
+    ``seed`` may be anything ``numpy.random.default_rng`` accepts (an int or
+    a ``SeedSequence``).  Single and bulk draws share one generator, so a
+    run is reproducible for a given seed and sequence of calls.
+    """
+
+    def __init__(self, seed=None, block: int = 4096):
+        import numpy as np
+        self._np = np
+        self._gen = np.random.default_rng(seed)
+        self.block = block
+        self._buf = b""
+        self._pos = 0
+
+    def pocket(self) -> int:
+        if self._pos >= len(self._buf):
+            self._buf = self._gen.integers(0, POCKETS, size=self.block, dtype=self._np.uint8).tobytes()
+            self._pos = 0
+        n = self._buf[self._pos]
+        self._pos += 1
+        return n
+
+    def pockets(self, count: int) -> bytes:
+        head = self._buf[self._pos:self._pos + count]
+        self._pos += len(head)
+        if len(head) == count:
+            return head
+        rest = self._gen.integers(0, POCKETS, size=count - len(head), dtype=self._np.uint8)
+        return head + rest.tobytes()
+
+    def array(self, shape):
+        """A ``uint8`` array of outcomes (drawn from the generator directly)."""
+        return self._gen.integers(0, POCKETS, size=shape, dtype=self._np.uint8)
+
+
+def make_rng(kind: str = "system", seed=None) -> Rng:
+    """Build an outcome generator by name: 'system', 'seeded' or 'numpy'."""
+    if kind == "system":
+        return SystemRng()
+    if kind == "seeded":
+        return SeededRng(seed)
+    if kind == "numpy":
+        return NumpyRng(seed)
+    raise ValueError(f"Unknown RNG {kind!r} (expected 'system', 'seeded' or 'numpy')")
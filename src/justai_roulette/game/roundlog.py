@@ -0,0 +1,308 @@
+"""Binary round log for record-and-replay of whole sessions.
+
+Every settled round is appended as one record: the outcome, the balance
+before and after, the amount returned, open/settle timestamps and the full
+bet slip that was settled.  ``replay_rounds`` re-runs a log through the
+engine's rules with no animation and reports every round whose recorded
+settlement or balance disagrees with what the rules pay.
+
+Layout (little-endian).  Each distinct slip is written once as a slip
+record; rounds refer to it by id, so re-bet rounds cost a fixed 54 bytes::
+
+    header  8s                 magic
+    record  I B                record size, kind (0 = slip, 1 = round)
+    slip    I H                slip id, bet count, then per bet:
+            d H                amount, catalogue bet id
+    round   I d d B d d d I    seq, opened, settled, number, balance before,
+                               balance after, returned, slip id
+
+A torn final record (a crash mid-write) is dropped when the log is read or
+reopened for appending.
+"""
+
+import math
+import struct
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from .bets import get_number_color
+from .catalogue import CATALOGUE
+from .slip import BetSlip
+
+_MAGIC = b"JRROUND2"
+_RECORD = struct.Struct("<IB")
+_SLIP = struct.Struct("<IH")
+_ROUND = struct.Struct("<IddBdddI")
+_BET = struct.Struct("<dH")
+_KIND_SLIP, _KIND_ROUND = 0, 1
+
+
+class LoggedBet(NamedTuple):
+    label: str
+    numbers: tuple[int, ...]
+    payout: int
+    amount: float
+    bet_id: int = -1  # -1: an id this catalogue does not have
+
+
+class LoggedRound(NamedTuple):
+    seq: int
+    opened: float
+    settled: float
+    number: int
+    balance_before: float
+    balance_after: float
+    returned: float
+    bets: tuple[LoggedBet, ...]
+
+    @property
+    def stake(self) -> float:
+        return sum(b.amount for b in self.bets)
+
+
+def encode_slip(slip: BetSlip) -> bytes:
+    """The bet list of a slip record for ``slip``."""
+    return b"".join(_BET.pack(amount, bet_id) for bet_id, amount in slip.entries())
+
+
+def _decode_bets(data, pos: int, count: int) -> tuple[LoggedBet, ...]:
+    bets = []
+    for amount, bet_id in _BET.iter_unpack(data[pos:pos + count * _BET.size]):
+        bet = CATALOGUE[bet_id] if bet_id < len(CATALOGUE) else None
+        if bet is None:
+            bets.append(LoggedBet(f"Unknown bet {bet_id}", (), 0, amount))
+        else:
+            bets.append(LoggedBet(bet.label, bet.numbers, bet.payout, amount, bet_id))
+    return tuple(bets)
+
+
+def _records(data) -> Iterator[tuple[int, int, int]]:
+    """(kind, body offset, next offset) for each complete record."""
+    pos = len(_MAGIC)
+    while pos + _RECORD.size <= len(data):
+        size, kind = _RECORD.unpack_from(data, pos)
+        if size < _RECORD.size or pos + size > len(data):
+            break
+        yield kind, pos + _RECORD.size, pos + size
+        pos += size
+
+
+class RoundLog:
+    """Append-only writer for a round log file.
+
+    Records go through a buffered file; call ``flush`` to hand them to the
+    OS (the engine does so after every hand-played round).  Opening a file
+    that is not a round log of this format raises ``ValueError``.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.seq = 0
+        self._slip_ids: dict[bytes, int] = {}
+        self._last: tuple[BetSlip | None, int] = (None, 0)
+        self._fh = open(self.path, "r+b" if self.path.exists() else "w+b")
+        data = self._fh.read()
+        end = len(_MAGIC)
+        if data[:end] != _MAGIC:
+            if not _MAGIC.startswith(data):
+                # Another format (or version): never overwrite an audit log
+                self.close()
+                raise ValueError(f"{self.path} is not a {_MAGIC.decode()} round log; "
+                                 "refusing to overwrite it")
+            self._fh.seek(0)
+            self._fh.truncate()
+            self._fh.write(_MAGIC)
+            return
+        for kind, body, end in _records(data):
+            if kind == _KIND_SLIP:
+                slip_id, count = _SLIP.unpack_from(data, body)
+                self._slip_ids[data[body + _SLIP.size:end]] = slip_id
+            elif kind == _KIND_ROUND:
+                self.seq = _ROUND.unpack_from(data, body)[0]
+        self._fh.seek(end)
+        self._fh.truncate()
+
+    def _slip_id(self, slip: BetSlip) -> int:
+        last, slip_id = self._last
+        if last is slip:
+            return slip_id
+        # Slips are frozen once spun, and a re-bet copy encodes identically
+        bets = encode_slip(slip)
+        slip_id = self._slip_ids.get(bets)
+        if slip_id is None:
+            slip_id = self._slip_ids[bets] = len(self._slip_ids) + 1
+            header = _SLIP.pack(slip_id, len(slip))
+            self._fh.write(_RECORD.pack(_RECORD.size + len(header) + len(bets), _KIND_SLIP))
+            self._fh.write(header)
+            self._fh.write(bets)
+        self._last = (slip, slip_id)
+        return slip_id
+
+    def append(self, number: int, slip: BetSlip, balance_before: float, balance_after: float,
+               returned: float, opened: float, settled: float | None = None) -> None:
+        """Record one settled round.
+
+        ``slip`` must not change after it is logged (the engine only logs
+        slips it has frozen): consecutive rounds on the same object reuse
+        its slip id without re-encoding it.
+        """
+        slip_id = self._slip_id(slip)
+        self.seq += 1
+        settled = time.time() if settled is None else settled
+        self._fh.write(_RECORD.pack(_RECORD.size + _ROUND.size, _KIND_ROUND))
+        self._fh.write(_ROUND.pack(self.seq, opened, settled, number,
+                                   balance_before, balance_after, returned, slip_id))
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def format_round(rnd: LoggedRound, currency: str = "$") -> list[str]:
+    """Human-readable lines describing a logged round."""
+    def money(v: float) -> str:
+        return f"{currency}{v:,.2f}"
+
+    lines = [
+        f"Round {rnd.seq} - {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(rnd.opened))}",
+        f"Outcome {rnd.number} ({get_number_color(rnd.number)})",
+        f"Balance {money(rnd.balance_before)} -> {money(rnd.balance_after)}"
+        f" (stake {money(rnd.stake)}, returned {money(rnd.returned)})",
+    ]
+    for bet in rnd.bets:
+        won = rnd.number in bet.numbers
+        lines.append(f"  {bet.label}: {money(bet.amount)} at {bet.payout}:1"
+                     + (f" - won {money(bet.amount * (bet.payout + 1))}" if won else ""))
+    if not rnd.bets:
+        lines.append("  (no bets)")
+    return lines
+
+
+def _load(path: Path | str) -> memoryview:
+    data = memoryview(Path(path).read_bytes())
+    if bytes(data[:len(_MAGIC)]) != _MAGIC:
+        raise ValueError(f"{path} is not a round log")
+    return data
+
+
+def read_rounds(path: Path | str) -> Iterator[LoggedRound]:
+    """Yield the complete rounds of a log, oldest first.
+
+    Rounds played on the same slip share one ``bets`` tuple.
+    """
+    data = _load(path)
+    slips: dict[int, tuple[LoggedBet, ...]] = {0: ()}
+    unpack_round = _ROUND.unpack_from
+    for kind, body, _ in _records(data):
+        if kind == _KIND_ROUND:
+            seq, opened, settled, number, before, after, returned, slip_id = unpack_round(data, body)
+            yield LoggedRound(seq, opened, settled, number, before, after, returned, slips.get(slip_id, ()))
+        elif kind == _KIND_SLIP:
+            slip_id, count = _SLIP.unpack_from(data, body)
+            slips[slip_id] = _decode_bets(data, body + _SLIP.size, count)
+
+
+def read_recent_rounds(path: Path | str, count: int) -> list[LoggedRound]:
+    """The last ``count`` complete rounds of a log, oldest first.
+
+    Earlier records are skipped by their headers, and only the slips the
+    returned rounds use are decoded, so this stays cheap on a lifetime log.
+    """
+    data = _load(path)
+    slip_at: dict[int, int] = {}
+    recent: deque[int] = deque(maxlen=max(0, count))
+    for kind, body, _ in _records(data):
+        if kind == _KIND_ROUND:
+            recent.append(body)
+        elif kind == _KIND_SLIP:
+            slip_at[_SLIP.unpack_from(data, body)[0]] = body
+    slips: dict[int, tuple[LoggedBet, ...]] = {0: ()}
+    rounds = []
+    for body in recent:
+        seq, opened, settled, number, before, after, returned, slip_id = _ROUND.unpack_from(data, body)
+        bets = slips.get(slip_id)
+        if bets is None:
+            at = slip_at.get(slip_id)
+            bets = slips[slip_id] = () if at is None else _decode_bets(
+                data, at + _SLIP.size, _SLIP.unpack_from(data, at)[1])
+        rounds.append(LoggedRound(seq, opened, settled, number, before, after, returned, bets))
+    return rounds
+
+
+@dataclass
+class ReplayMismatch:
+    """A recorded value the rules disagree with."""
+    seq: int
+    field: str  # "returned", "balance_after", or "bet" (not a legal bet; recorded = its stake)
+    recorded: float
+    replayed: float
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of ``replay_rounds``."""
+    rounds: int = 0
+    wagered: float = 0.0
+    returned: float = 0.0
+    adjustments: int = 0  # balance changed between rounds (top-ups, resets)
+    mismatches: list[ReplayMismatch] = field(default_factory=list)
+    final_balance: float | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+def replay_rounds(rounds: Iterable[LoggedRound], tolerance: float = 1e-6) -> ReplayReport:
+    """Re-settle every round through ``RouletteEngine`` and compare.
+
+    Each round starts from its recorded ``balance_before``; a difference from
+    the previous round's ``balance_after`` is counted as an adjustment (the
+    player topped up or reset), not a mismatch.  Each distinct slip is
+    compiled once; a logged bet id that is not in the catalogue is reported
+    and left off the replayed slip.
+    """
+    from .engine import RouletteEngine
+
+    report = ReplayReport()
+    engine = RouletteEngine(balance=0.0, stat_windows=())  # no sliding windows to maintain
+    slips: dict[tuple[LoggedBet, ...], tuple[BetSlip, list[LoggedBet]]] = {}
+    last_bets, slip, illegal = None, None, []
+    start = time.perf_counter()
+    for rnd in rounds:
+        if report.final_balance is not None and not math.isclose(
+                rnd.balance_before, report.final_balance, abs_tol=tolerance):
+            report.adjustments += 1
+        if rnd.bets is not last_bets:
+            last_bets = rnd.bets
+            compiled = slips.get(last_bets)
+            if compiled is None:
+                compiled = slips[last_bets] = (
+                    BetSlip.from_entries((b.bet_id, b.amount) for b in last_bets if b.bet_id >= 0),
+                    [b for b in last_bets if b.bet_id < 0])
+            slip, illegal = compiled
+        for bet in illegal:
+            report.mismatches.append(ReplayMismatch(rnd.seq, "bet", bet.amount, 0.0))
+        engine.balance = rnd.balance_before
+        engine.slip = slip  # never mutated by the engine once it is spun
+        result = engine.spin(rnd.number)
+
+        if not math.isclose(result.total_win, rnd.returned, abs_tol=tolerance):
+            report.mismatches.append(ReplayMismatch(rnd.seq, "returned", rnd.returned, result.total_win))
+        if not math.isclose(engine.balance, rnd.balance_after, abs_tol=tolerance):
+            report.mismatches.append(ReplayMismatch(rnd.seq, "balance_after", rnd.balance_after, engine.balance))
+        report.rounds += 1
+        report.wagered += result.bet_amount
+        report.returned += result.total_win
+        report.final_balance = rnd.balance_after
+    report.elapsed = time.perf_counter() - start
+    return report
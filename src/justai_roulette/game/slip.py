@@ -0,0 +1,244 @@
+"""Bet slip with a precompiled per-pocket return vector."""
+
+import math
+
+from .bets import CALL_BETS, POCKETS, QUICK_BETS
+from .catalogue import BY_LABEL, CALL_BET_IDS, CATALOGUE
+from .wheel import neighbours
+
+
+class Bet:
+    """One stacked bet on the slip: a catalogue bet plus its stake and marker position."""
+
+    __slots__ = ("id", "label", "numbers", "payout", "amount", "x", "y", "mask")
+
+    def __init__(self, bet_id: int, amount: float = 0.0, x: float = 0.0, y: float = 0.0):
+        bet = CATALOGUE[bet_id]
+        self.id = bet_id
+        self.label = bet.label
+        self.numbers = bet.numbers
+        self.payout = bet.payout
+        self.mask = bet.mask
+        self.amount = amount
+        self.x = x
+        self.y = y
+
+    @property
+    def key(self) -> tuple[int, ...]:
+        """The covered numbers, sorted (what the table keys its markers by)."""
+        return self.numbers
+
+    @property
+    def win_amount(self) -> float:
+        """Amount returned (stake included) if this bet wins."""
+        return self.amount * (self.payout + 1)
+
+    def copy(self) -> "Bet":
+        return Bet(self.id, self.amount, self.x, self.y)
+
+    def __repr__(self) -> str:
+        return f"Bet({self.label!r}, amount={self.amount})"
+
+
+class BetSlip:
+    """The chips currently on the table.
+
+    Bets are indexed by catalogue id, so stacking a chip is a dict lookup.
+    Alongside the bets the slip keeps ``returns`` - what each of the 37
+    pockets pays back if it hits - and ``coverage``, a bitmask of the pockets
+    with at least one bet on them; both are updated as chips are placed,
+    removed or doubled, so settling a spin is a single index lookup.
+
+    Every change is also recorded in an undo log as ``(bet_id, delta, created)``
+    entries, so ``undo`` only touches the bets the last action affected.
+    """
+
+    def __init__(self):
+        self.bets: dict[int, Bet] = {}
+        self.total = 0.0
+        self.returns: list[float] = [0.0] * POCKETS
+        self.coverage = 0
+        self._cover_count = [0] * POCKETS
+        self._undo: list[tuple[tuple[int, float, bool], ...]] = []
+
+    def __len__(self) -> int:
+        return len(self.bets)
+
+    def __bool__(self) -> bool:
+        return bool(self.bets)
+
+    def __iter__(self):
+        return iter(self.bets.values())
+
+    def get(self, bet_id: int) -> Bet | None:
+        return self.bets.get(bet_id)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def _apply(self, bet: Bet, amount: float) -> None:
+        """Add ``amount`` staked on ``bet`` to the return vector."""
+        win = amount * (bet.payout + 1)
+        returns = self.returns
+        for n in bet.numbers:
+            returns[n] += win
+        self.total += amount
+
+    def _cover(self, bet: Bet, step: int) -> None:
+        counts = self._cover_count
+        for n in bet.numbers:
+            counts[n] += step
+            if counts[n] == 0:
+                self.coverage &= ~(1 << n)
+        if step > 0:
+            self.coverage |= bet.mask
+
+    def _stake(self, bet_id: int, amount: float, x: float, y: float) -> tuple[Bet, bool]:
+        bet = self.bets.get(bet_id)
+        created = bet is None
+        if created:
+            bet = self.bets[bet_id] = Bet(bet_id, 0.0, x, y)
+            self._cover(bet, 1)
+        bet.amount += amount
+        self._apply(bet, amount)
+        return bet, created
+
+    def add(self, bet_id: int, amount: float, x: float = 0.0, y: float = 0.0) -> Bet:
+        """Stake ``amount`` on catalogue bet ``bet_id``, stacking onto it if already placed."""
+        bet, created = self._stake(bet_id, amount, x, y)
+        self._undo.append(((bet_id, amount, created),))
+        return bet
+
+    def add_group(self, items) -> list[Bet]:
+        """Stake several ``(bet_id, amount, x, y)`` bets as one undoable action."""
+        placed, entry = [], []
+        for bet_id, amount, x, y in items:
+            bet, created = self._stake(bet_id, amount, x, y)
+            placed.append(bet)
+            entry.append((bet_id, amount, created))
+        if entry:
+            self._undo.append(tuple(entry))
+        return placed
+
+    def double(self) -> None:
+        entry = []
+        for bet in self.bets.values():
+            entry.append((bet.id, bet.amount, False))
+            self._apply(bet, bet.amount)
+            bet.amount *= 2
+        if entry:
+            self._undo.append(tuple(entry))
+
+    def undo(self) -> list[Bet]:
+        """Revert the last action and return the bets it touched.
+
+        Bets the action had created are removed from the slip and come back
+        with ``amount`` 0.
+        """
+        if not self._undo:
+            return []
+        touched = []
+        for bet_id, amount, created in reversed(self._undo.pop()):
+            bet = self.bets[bet_id]
+            self._apply(bet, -amount)
+            bet.amount -= amount
+            if created:
+                del self.bets[bet_id]
+                self._cover(bet, -1)
+                bet.amount = 0.0
+            touched.append(bet)
+        if not self.bets:
+            # Drop float residue once the slip is empty
+            self.total = 0.0
+            self.returns = [0.0] * POCKETS
+        return touched
+
+    def restore(self, other: "BetSlip") -> list[Bet]:
+        """Replace the contents with a copy of ``other`` (one undoable action)."""
+        self.clear()
+        self.bets = {k: b.copy() for k, b in other.bets.items()}
+        self.total = other.total
+        self.returns = list(other.returns)
+        self.coverage = other.coverage
+        self._cover_count = list(other._cover_count)
+        if self.bets:
+            self._undo.append(tuple((k, b.amount, True) for k, b in self.bets.items()))
+        return list(self.bets.values())
+
+    def clear(self) -> None:
+        self.bets.clear()
+        self.total = 0.0
+        self.returns = [0.0] * POCKETS
+        self.coverage = 0
+        self._cover_count = [0] * POCKETS
+        self._undo.clear()
+
+    def copy(self) -> "BetSlip":
+        """Copy of the bets and return vector (the undo log is not copied)."""
+        slip = BetSlip()
+        slip.bets = {k: b.copy() for k, b in self.bets.items()}
+        slip.total = self.total
+        slip.returns = list(self.returns)
+        slip.coverage = self.coverage
+        slip._cover_count = list(self._cover_count)
+        return slip
+
+    def entries(self) -> list[tuple[int, float]]:
+        """The slip as compact ``(bet_id, amount)`` pairs."""
+        return [(bet.id, bet.amount) for bet in self.bets.values()]
+
+    @classmethod
+    def from_entries(cls, entries) -> "BetSlip":
+        """A slip holding ``(bet_id, amount)`` pairs (with no undo history)."""
+        slip = cls()
+        for bet_id, amount in entries:
+            slip._stake(bet_id, amount, 0.0, 0.0)
+        return slip
+
+    def payout(self, number: int) -> float:
+        """Total returned (stake included) if ``number`` hits."""
+        return self.returns[number]
+
+    def at_risk(self) -> list[float]:
+        """Net house exposure per pocket: what each number would pay beyond the stakes."""
+        total = self.total
+        return [r - total for r in self.returns]
+
+    def winners(self, number: int) -> list[Bet]:
+        """Bets that win on ``number``."""
+        if not self.coverage >> number & 1:
+            return []
+        bit = 1 << number
+        return [b for b in self.bets.values() if b.mask & bit]
+
+
+def build_slip(names: list[str], chip: float) -> BetSlip:
+    """Build a slip from QUICK_BETS / CALL_BETS names and neighbour bets.
+
+    Each name may carry a chip multiplier, e.g. ``"Red:2"`` stakes two chips
+    on Red; call bets stake their usual chip count per unit.  ``"17+2"`` is
+    17 and two neighbours either side, one chip per straight.
+    """
+    slip = BetSlip()
+    for spec in names:
+        name, _, units = spec.partition(":")
+        multiplier = float(units) if units else 1.0
+        if not 0 < multiplier < math.inf:
+            raise ValueError(f"Bad chip multiplier in {spec!r}: must be a positive number")
+        amount = chip * multiplier
+        if name in QUICK_BETS:
+            slip.add(BY_LABEL[name].id, amount)
+        elif name in CALL_BETS:
+            slip.add_group((bet_id, amount * chips, 0.0, 0.0) for bet_id, chips in CALL_BET_IDS[name])
+        elif "+" in name:
+            number, _, k = name.partition("+")
+            try:
+                bet_ids = neighbours(int(number), int(k))
+            except ValueError as exc:
+                raise ValueError(f"Bad neighbour bet {name!r}: {exc}") from None
+            slip.add_group((bet_id, amount, 0.0, 0.0) for bet_id in bet_ids)
+        else:
+            known = ", ".join([*QUICK_BETS, *CALL_BETS, "N+K"])
+            raise ValueError(f"Unknown bet {name!r} (expected one of: {known})")
+    return slip
@@ -0,0 +1,203 @@
+"""Incremental spin statistics.
+
+Per-pocket and per-category (colour, parity, dozen, column, high/low, wheel
+sector) counters are updated in O(1) per spin, both over all time and over
+sliding windows of the most recent spins kept in ring buffers.  Pockets are
+also kept ordered by frequency, adjusting by one position-swap per update,
+so hot/cold queries never sort.
+"""
+
+from .bets import POCKETS, get_number_color
+from .wheel import SECTORS as WHEEL_SECTORS
+
+DEFAULT_WINDOWS = (100, 500, 1000)
+
+# The three sectors that split the wheel (Jeu Zéro lies inside Voisins)
+SECTORS = {name: WHEEL_SECTORS[name] for name in ("Voisins", "Tiers", "Orphelins")}
+
+
+def _categories(n: int) -> tuple[tuple[str, str], ...]:
+    if n == 0:
+        return (("color", "green"), ("parity", "zero"), ("dozen", "zero"),
+                ("column", "zero"), ("range", "zero"), ("sector", "Voisins"))
+    sector = next(name for name, nums in SECTORS.items() if n in nums)
+    return (
+        ("color", get_number_color(n)),
+        ("parity", "odd" if n % 2 else "even"),
+        ("dozen", ("1st 12", "2nd 12", "3rd 12")[(n - 1) // 12]),
+        ("column", f"Col {(n - 1) % 3 + 1}"),
+        ("range", "1-18" if n <= 18 else "19-36"),
+        ("sector", sector),
+    )
+
+
+POCKET_CATEGORIES = tuple(_categories(n) for n in range(POCKETS))
+
+
+def _empty_categories() -> dict[str, dict[str, int]]:
+    cats: dict[str, dict[str, int]] = {}
+    for n in range(POCKETS):
+        for cat, key in POCKET_CATEGORIES[n]:
+            cats.setdefault(cat, {})[key] = 0
+    return cats
+
+
+class Counters:
+    """Pocket and category counts with pockets kept ordered by frequency.
+
+    ``order`` lists pockets from most to least frequent; pockets with equal
+    counts form a contiguous block whose bounds are kept in ``_blocks``.
+    Changing a count by one swaps the pocket to the edge of its block.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.pockets = [0] * POCKETS
+        self.categories = _empty_categories()
+        self.order = list(range(POCKETS))
+        self._pos = list(range(POCKETS))
+        self._blocks: dict[int, list[int]] = {0: [0, POCKETS]}  # count -> [start, end)
+
+    def load(self, pocket_counts: dict[int, int]) -> None:
+        """Replace all counts at once (sorts once; use add/remove for updates)."""
+        self.pockets = [int(pocket_counts.get(n, 0)) for n in range(POCKETS)]
+        self.total = sum(self.pockets)
+        self.categories = _empty_categories()
+        for n, count in enumerate(self.pockets):
+            for cat, key in POCKET_CATEGORIES[n]:
+                self.categories[cat][key] += count
+        self.order = sorted(range(POCKETS), key=lambda n: -self.pockets[n])
+        self._pos = [0] * POCKETS
+        self._blocks = {}
+        for i, n in enumerate(self.order):
+            self._pos[n] = i
+            block = self._blocks.setdefault(self.pockets[n], [i, i])
+            block[1] = i + 1
+
+    def _swap(self, i: int, j: int) -> None:
+        order, pos = self.order, self._pos
+        order[i], order[j] = order[j], order[i]
+        pos[order[i]] = i
+        pos[order[j]] = j
+
+    def add(self, n: int) -> None:
+        c = self.pockets[n]
+        block = self._blocks[c]
+        s = block[0]
+        self._swap(self._pos[n], s)
+        block[0] += 1
+        if block[0] == block[1]:
+            del self._blocks[c]
+        above = self._blocks.get(c + 1)
+        if above:
+            above[1] = s + 1
+        else:
+            self._blocks[c + 1] = [s, s + 1]
+        self.pockets[n] = c + 1
+        self.total += 1
+        for cat, key in POCKET_CATEGORIES[n]:
+            self.categories[cat][key] += 1
+
+    def remove(self, n: int) -> None:
+        c = self.pockets[n]
+        if c == 0:
+            raise ValueError(f"pocket {n} has no spins to remove")
+        block = self._blocks[c]
+        e = block[1] - 1
+        self._swap(self._pos[n], e)
+        block[1] = e
+        if block[0] == block[1]:
+            del self._blocks[c]
+        below = self._blocks.get(c - 1)
+        if below:
+            below[0] = e
+        else:
+            self._blocks[c - 1] = [e, e + 1]
+        self.pockets[n] = c - 1
+        self.total -= 1
+        for cat, key in POCKET_CATEGORIES[n]:
+            self.categories[cat][key] -= 1
+
+    def hot(self, k: int = 5) -> list[tuple[int, int]]:
+        """The ``k`` most frequent pockets as (number, count)."""
+        return [(n, self.pockets[n]) for n in self.order[:k]]
+
+    def cold(self, k: int = 5) -> list[tuple[int, int]]:
+        """The ``k`` least frequent pockets as (number, count)."""
+        return [(n, self.pockets[n]) for n in reversed(self.order[-k:])] if k else []
+
+
+class Window(Counters):
+    """Counters over the last ``size`` spins, backed by a ring buffer."""
+
+    def __init__(self, size: int):
+        super().__init__()
+        self.size = size
+        self._ring = bytearray(size)
+        self._head = 0
+
+    def push(self, n: int) -> None:
+        if self.total == self.size:
+            self.remove(self._ring[self._head])
+        self._ring[self._head] = n
+        self._head = (self._head + 1) % self.size
+        self.add(n)
+
+
+class SpinStats:
+    """All-time and sliding-window statistics for one machine."""
+
+    def __init__(self, windows: tuple[int, ...] = DEFAULT_WINDOWS):
+        self.all_time = Counters()
+        self.windows = {size: Window(size) for size in windows}
+
+    @classmethod
+    def restore(cls, pocket_counts: dict[int, int] | None = None, recent=(),
+                windows: tuple[int, ...] = DEFAULT_WINDOWS) -> "SpinStats":
+        """Rebuild from persisted per-pocket counts and recent outcomes (oldest first).
+
+        All-time category counts are derived from the pocket counts, so only
+        the 37 pocket totals need to be stored.
+        """
+        stats = cls(windows)
+        stats.all_time.load({int(n): c for n, c in (pocket_counts or {}).items()})
+        for n in recent:
+            for window in stats.windows.values():
+                window.push(n)
+        return stats
+
+    def record(self, n: int) -> None:
+        self.all_time.add(n)
+        for window in self.windows.values():
+            window.push(n)
+
+    def record_many(self, numbers: bytes) -> None:
+        """Record a batch of outcomes (oldest first).
+
+        All-time counts are merged and re-sorted once; only the spins that can
+        still be inside a window are pushed through the ring buffers.
+        """
+        pockets = self.all_time.pockets
+        merged = {n: pockets[n] + numbers.count(n) for n in range(POCKETS)}
+        self.all_time.load(merged)
+        tail = numbers[-max(self.windows, default=0):] if self.windows else b""
+        for n in tail:
+            for window in self.windows.values():
+                window.push(n)
+
+    def counters(self, window: int | None = None) -> Counters:
+        return self.all_time if window is None else self.windows[window]
+
+    def counts(self, category: str, window: int | None = None) -> dict[str, int]:
+        """Counts for one category ('color', 'parity', 'dozen', 'column', 'range', 'sector')."""
+        return dict(self.counters(window).categories[category])
+
+    def hot(self, k: int = 5, window: int | None = None) -> list[tuple[int, int]]:
+        return self.counters(window).hot(k)
+
+    def cold(self, k: int = 5, window: int | None = None) -> list[tuple[int, int]]:
+        return self.counters(window).cold(k)
+
+    def reset(self) -> None:
+        self.all_time = Counters()
+        self.windows = {size: Window(size) for size in self.windows}
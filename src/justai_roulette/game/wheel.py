@@ -0,0 +1,59 @@
+"""Wheel-order lookups: pocket positions, neighbour bets and sectors.
+
+Everything here is precomputed from ``WHEEL_SEQUENCE`` at import, so
+"17 and 2 neighbours" is a tuple index rather than a search round the
+wheel.  Straights have catalogue id ``n``, so a neighbour tuple is also the
+list of straight bet ids to place.
+"""
+
+from ..constants import WHEEL_SEQUENCE
+from .bets import CALL_BETS, POCKETS
+
+MAX_NEIGHBOURS = 4
+
+# Position -> number, clockwise from zero, and number -> position
+WHEEL_NUMBERS: tuple[int, ...] = tuple(WHEEL_SEQUENCE)
+WHEEL_POSITION: tuple[int, ...] = tuple(WHEEL_NUMBERS.index(n) for n in range(POCKETS))
+
+# NEIGHBOURS[k][n]: n with k pockets either side, in wheel order (k = 0..MAX_NEIGHBOURS)
+NEIGHBOURS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(WHEEL_NUMBERS[(WHEEL_POSITION[n] + d) % POCKETS] for d in range(-k, k + 1))
+          for n in range(POCKETS))
+    for k in range(MAX_NEIGHBOURS + 1)
+)
+
+
+def neighbours(number: int, k: int) -> tuple[int, ...]:
+    """``number`` and its ``k`` neighbours either side, in wheel order."""
+    if not 0 <= number < POCKETS:
+        raise ValueError(f"No pocket {number}")
+    if not 0 <= k <= MAX_NEIGHBOURS:
+        raise ValueError(f"Neighbours must be 0-{MAX_NEIGHBOURS}, got {k}")
+    return NEIGHBOURS[k][number]
+
+
+def sector(first: int, last: int) -> tuple[int, ...]:
+    """Pockets clockwise from ``first`` to ``last`` inclusive."""
+    start = WHEEL_POSITION[first]
+    length = (WHEEL_POSITION[last] - start) % POCKETS + 1
+    return tuple(WHEEL_NUMBERS[(start + i) % POCKETS] for i in range(length))
+
+
+# Wheel sectors named by the call bets that cover them (Voisins includes zero)
+SECTORS: dict[str, frozenset[int]] = {
+    "Voisins": frozenset(sector(22, 25)),
+    "Tiers": frozenset(sector(27, 33)),
+    "Orphelins": frozenset(sector(17, 6) + sector(1, 9)),
+    "Jeu Zéro": frozenset(sector(12, 15)),
+}
+
+
+def _check_call_bets() -> None:
+    for name, numbers in SECTORS.items():
+        covered = {n for nums, _, _ in CALL_BETS[name] for n in nums}
+        if covered != numbers:
+            raise ValueError(f"{name} covers {sorted(covered)}, "
+                             f"expected the wheel sector {sorted(numbers)}")
+
+
+_check_call_bets()
@@ -0,0 +1,135 @@
+"""Headless batch mode: play a fixed slip for N spins without any Tk import.
+
+Uses the same engine, limits and bet definitions as the GUI, and never
+touches the saved session, so it is safe for soak tests on build agents.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from .game.bets import POCKETS
+from .game.engine import AutoplayResult, BetError, RouletteEngine
+from .game.rng import make_rng
+from .game.roundlog import RoundLog
+from .game.slip import build_slip
+
+
+def read_slip_spec(specs: list[str]) -> list[str]:
+    """Bet names from the command line, or from a file if given a single path.
+
+    Files list ``Name[:units]`` entries separated by whitespace or newlines;
+    ``#`` starts a comment.
+    """
+    if len(specs) == 1 and Path(specs[0]).is_file():
+        names = []
+        for line in Path(specs[0]).read_text(encoding="utf-8").splitlines():
+            names.extend(line.split("#", 1)[0].split())
+        return names
+    return specs
+
+
+def _combine(results: list[AutoplayResult]) -> AutoplayResult:
+    """One ``AutoplayResult`` for consecutive autoplay runs."""
+    return AutoplayResult(
+        spins=sum(r.spins for r in results),
+        bet_total=sum(r.bet_total for r in results),
+        win_total=sum(r.win_total for r in results),
+        biggest_win=max(r.biggest_win for r in results),
+        stopped="balance" if any(r.stopped == "balance" for r in results) else "done",
+    )
+
+
+def run_headless(spins: int, slip_spec: list[str], chip: float, balance: float,
+                 seed: int | None = None, rng: str | None = None,
+                 round_log: str | None = None, profiler=None) -> dict:
+    """Play ``spins`` rounds of the slip and return a summary dict.
+
+    ``rng`` defaults to 'seeded' when a seed is given, else 'system'.
+    ``round_log`` appends every round to that round log file.  With a
+    ``profiling.RoundProfiler`` the first ``profiler.rounds`` rounds are
+    played (and profiled) one at a time; outcomes are drawn in the same order
+    either way.
+    """
+    slip = build_slip(read_slip_spec(slip_spec), chip)
+    rng = rng or ("system" if seed is None else "seeded")
+    log = RoundLog(round_log) if round_log else None
+    engine = RouletteEngine(balance=balance, rng=make_rng(rng, seed), round_log=log)
+    start = time.perf_counter()
+    try:
+        results = []
+        while profiler is not None and profiler.active and len(results) < spins:
+            profiler.begin()
+            results.append(engine.autoplay(slip, 1))
+            profiler.end()
+            if results[-1].stopped != "done":
+                break
+        else:
+            results.append(engine.autoplay(slip, spins - len(results)))
+        result = _combine(results)
+    finally:
+        if log is not None:
+            log.close()
+    elapsed = time.perf_counter() - start
+
+    stake = slip.total
+    expected = sum(slip.returns) / POCKETS / stake if stake else None
+    stats = engine.stats
+    return {
+        "rng": rng,
+        "seed": seed,
+        "slip": [{"id": b.id, "label": b.label, "numbers": list(b.numbers), "payout": b.payout,
+                  "amount": b.amount} for b in slip],
+        "stake": stake,
+        "spins": result.spins,
+        "stopped": result.stopped,
+        "start_balance": balance,
+        "final_balance": engine.balance,
+        "net": engine.balance - balance,
+        "wagered": result.bet_total,
+        "returned": result.win_total,
+        "rtp": result.win_total / result.bet_total if result.bet_total else None,
+        "expected_rtp": expected,
+        "biggest_win": result.biggest_win,
+        "hot": stats.hot(5),
+        "cold": stats.cold(5),
+        "counts": {cat: stats.counts(cat) for cat in ("color", "parity", "dozen", "column", "range", "sector")},
+        "elapsed": elapsed,
+    }
+
+
+def format_summary(s: dict) -> str:
+    def pct(v):
+        return f"{v * 100:.3f}%" if v is not None else "n/a"
+
+    bets = ", ".join(f"{b['label']} x{b['amount']:g}" for b in s["slip"])
+    lines = [
+        f"RNG:             {s['rng']}" + (f" (seed {s['seed']})" if s["seed"] is not None else ""),
+        f"Slip:            {bets} (stake {s['stake']:,.2f})",
+        f"Spins:           {s['spins']:,}" + (" (stopped: balance too low)" if s["stopped"] == "balance" else ""),
+        f"Balance:         {s['start_balance']:,.2f} -> {s['final_balance']:,.2f} (net {s['net']:+,.2f})",
+        f"Wagered:         {s['wagered']:,.2f}",
+        f"Returned:        {s['returned']:,.2f}",
+        f"RTP:             {pct(s['rtp'])} (expected {pct(s['expected_rtp'])})",
+        f"Biggest win:     {s['biggest_win']:,.2f}",
+        f"Hot:             {', '.join(f'{n} ({c})' for n, c in s['hot'])}",
+        f"Cold:            {', '.join(f'{n} ({c})' for n, c in s['cold'])}",
+    ]
+    for cat, counts in s["counts"].items():
+        lines.append(f"{cat.capitalize() + ':':<17}" + ", ".join(f"{k} {v}" for k, v in counts.items()))
+    rate = s["spins"] / s["elapsed"] if s["elapsed"] else 0
+    lines.append(f"Elapsed:         {s['elapsed']:.2f}s ({rate:,.0f} spins/s)")
+    return "\n".join(lines)
+
+
+def main(args, profiler=None) -> int:
+    """Run headless mode from parsed ``justai-roulette`` arguments; returns an exit code."""
+    try:
+        summary = run_headless(args.spins, args.slip, args.chip, args.balance, args.seed, args.rng,
+                               args.round_log, profiler)
+    except (BetError, ValueError, OSError, ImportError) as exc:
+        print(f"justai-roulette: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+    return 0
@@ -0,0 +1,185 @@
+"""Append-only session journal with a background writer thread.
+
+Spins and balance changes are queued as small JSON-line events and written
+in batches off the UI thread; fsync is batched to at most once per
+``fsync_interval``.  Once the journal grows past ``max_bytes`` (and on exit)
+it is compacted: a full snapshot is written with write-then-rename and the
+journal is truncated.  Events carry a sequence number and the snapshot
+records the last one it includes, so a crash between the two steps never
+replays an event twice.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+
+from . import probes
+from .constants import JOURNAL_FILE, SESSION_FILE
+from .session import SessionData, atomic_write, session_to_dict
+
+log = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class SessionJournal:
+    """Background journal writer for one session."""
+
+    def __init__(self, path: Path = JOURNAL_FILE, snapshot_path: Path = SESSION_FILE,
+                 seq: int = 0, max_bytes: int = 256 * 1024, fsync_interval: float = 1.0,
+                 max_queue: int = 10_000):
+        self.path = Path(path)
+        self.snapshot_path = Path(snapshot_path)
+        self.max_bytes = max_bytes
+        self.fsync_interval = fsync_interval
+        self._seq = seq
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        try:
+            self._size = self.path.stat().st_size
+        except OSError:
+            self._size = 0
+        self._compact_requested = False
+        self._thread = threading.Thread(target=self._run, name="session-journal", daemon=True)
+        self._thread.start()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last queued event."""
+        return self._seq
+
+    @property
+    def should_compact(self) -> bool:
+        """True once the journal has outgrown ``max_bytes`` and no compaction is queued."""
+        return self._size >= self.max_bytes and not self._compact_requested
+
+    def append(self, kind: str, **fields) -> None:
+        """Queue an event; never blocks the caller on disk I/O."""
+        self._seq += 1
+        event = {"s": self._seq, "e": kind, **fields}
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            log.warning("Session journal queue full; dropping event %d", self._seq)
+
+    def record_spin(self, number: int, bet: float, win: float, balance: float) -> None:
+        self.append("spin", n=number, bet=bet, win=win, bal=balance)
+
+    def compact(self, session: SessionData, context: AbstractContextManager | None = None) -> None:
+        """Queue a snapshot of ``session`` (state as of the last appended event).
+
+        ``context``, if given, is entered on the writer thread around the write.
+        """
+        session.journal_seq = self._seq
+        self._compact_requested = True
+        self._queue.put(("snapshot", session_to_dict(session), context))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything queued so far is written and fsynced."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, session: SessionData | None = None, timeout: float = 5.0) -> None:
+        """Optionally compact into a final snapshot, then stop the writer."""
+        if session is not None:
+            self.compact(session)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # --- Writer thread ---
+
+    def _run(self) -> None:
+        fh = None
+        dirty = False
+        last_sync = time.monotonic()
+        running = True
+        while running:
+            timeout = max(0.0, self.fsync_interval - (time.monotonic() - last_sync)) if dirty else None
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines: list[str] = []
+            waiters: list[threading.Event] = []
+            for item in batch:
+                if item is _STOP:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif isinstance(item, tuple):
+                    fh = self._write(fh, lines)
+                    lines = []
+                    with item[2] or nullcontext():
+                        fh = self._snapshot(fh, item[1])
+                    dirty = False
+                else:
+                    lines.append(json.dumps(item, separators=(",", ":")) + "\n")
+
+            fh = self._write(fh, lines)
+            dirty = dirty or bool(lines)
+            now = time.monotonic()
+            if dirty and (waiters or not running or now - last_sync >= self.fsync_interval):
+                self._sync(fh)
+                dirty = False
+                last_sync = now
+            for waiter in waiters:
+                waiter.set()
+
+        if fh is not None:
+            fh.close()
+
+    def _write(self, fh, lines: list[str]):
+        if not lines:
+            return fh
+        try:
+            if fh is None:
+                fh = open(self.path, "a", encoding="utf-8")
+            data = "".join(lines)
+            fh.write(data)
+            fh.flush()
+            self._size += len(data.encode("utf-8"))
+        except OSError as exc:
+            log.warning("Could not write session journal %s: %s", self.path, exc)
+        return fh
+
+    @staticmethod
+    def _sync(fh) -> None:
+        if fh is None:
+            return
+        try:
+            os.fsync(fh.fileno())
+        except OSError as exc:
+            log.warning("Could not fsync session journal: %s", exc)
+
+    def _snapshot(self, fh, data: dict):
+        """Write the snapshot atomically, then truncate the journal it supersedes."""
+        self._sync(fh)
+        started = probes.start()
+        try:
+            atomic_write(self.snapshot_path, json.dumps(data, indent=2))
+            probes.stop("session.save", started)
+        except OSError as exc:
+            log.warning("Could not save session to %s: %s", self.snapshot_path, exc)
+            self._compact_requested = False
+            return fh
+        if fh is not None:
+            fh.close()
+        try:
+            with open(self.path, "w", encoding="utf-8") as trunc:
+                os.fsync(trunc.fileno())
+            self._size = 0
+        except OSError as exc:
+            log.warning("Could not truncate session journal %s: %s", self.path, exc)
+        self._compact_requested = False
+        return None
@@ -0,0 +1,131 @@
+"""Timing probes recorded into fixed-size histograms.
+
+Probes are off by default and then cost one attribute check per call site
+(``start`` returns 0.0 and ``stop`` returns at once).  When enabled, each
+named probe feeds a ``Histogram`` of quarter-octave buckets from 1 us to
+about 16 s, so recording is a ``log2`` and an array increment and memory
+never grows with the number of samples.
+
+    t = probes.start()
+    ...
+    probes.stop("settle", t)
+"""
+
+import json
+import math
+import time
+from array import array
+from pathlib import Path
+
+_MIN_S = 1e-6
+_STEPS = 4  # buckets per doubling
+_BUCKETS = 24 * _STEPS
+
+enabled = False
+
+
+class Histogram:
+    """Log-bucketed latency histogram (seconds)."""
+
+    __slots__ = ("counts", "total", "sum", "max")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * _BUCKETS))
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds > _MIN_S:
+            bucket = min(_BUCKETS - 1, int(math.log2(seconds / _MIN_S) * _STEPS))
+        else:
+            bucket = 0
+        self.counts[bucket] += 1
+        self.total += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p: float) -> float:
+        """Upper edge of the bucket holding the ``p``-th percentile (0 if empty)."""
+        if not self.total:
+            return 0.0
+        rank = math.ceil(self.total * p / 100)
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.max, _MIN_S * 2 ** ((bucket + 1) / _STEPS))
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.total,
+            "mean": self.sum / self.total if self.total else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+_histograms: dict[str, Histogram] = {}
+_counters: dict[str, int] = {}
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def start() -> float:
+    """A start time for ``stop``, or 0.0 when probes are off."""
+    return time.perf_counter() if enabled else 0.0
+
+
+def stop(name: str, started: float) -> None:
+    """Record the time since ``started`` (a ``start()`` value) under ``name``."""
+    if started:
+        record(name, time.perf_counter() - started)
+
+
+def record(name: str, seconds: float) -> None:
+    if not enabled:
+        return
+    hist = _histograms.get(name)
+    if hist is None:
+        hist = _histograms[name] = Histogram()
+    hist.record(seconds)
+
+
+def count(name: str, n: int = 1) -> None:
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def snapshot() -> dict:
+    """All probe summaries and counters."""
+    return {
+        "histograms": {name: h.summary() for name, h in sorted(_histograms.items())},
+        "counters": dict(sorted(_counters.items())),
+    }
+
+
+def has_data() -> bool:
+    return bool(_histograms or _counters)
+
+
+def export(path: Path | str) -> None:
+    """Write ``snapshot()`` (with the bucket counts) to ``path`` as JSON."""
+    data = snapshot()
+    data["buckets"] = {
+        "min_s": _MIN_S,
+        "per_doubling": _STEPS,
+        "counts": {name: h.counts.tolist() for name, h in sorted(_histograms.items())},
+    }
+    Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def reset() -> None:
+    _histograms.clear()
+    _counters.clear()
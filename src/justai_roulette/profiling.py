@@ -0,0 +1,287 @@
+"""Per-round cProfile capture and a low-overhead stack sampler.
+
+``RoundProfiler`` profiles whole rounds (``begin`` when the spin starts,
+``end`` once it is settled and saved) and dumps one ``.prof`` per round,
+plus a merged summary sorted by cumulative time once the requested number
+of rounds is reached.  Work the round hands to another thread (the session
+save) is profiled with ``thread_profile`` and merged into the round's dump.
+cProfile slows everything it sees, so it is only on for those rounds.
+
+``StackSampler`` is cheap enough to leave on: a daemon thread wakes every
+``interval`` seconds, grabs the target thread's Python stack from
+``sys._current_frames()`` and counts it.  Each sample is charged to rules,
+UI code, Tk calls, disk I/O, or - when the stack is just Tk's ``mainloop`` -
+idle or Tk's own redraw/layout work, told apart by whether the thread used
+CPU since the previous sample.  Runs of busy samples longer than
+``stall_s`` are kept as stalls with their category breakdown.
+"""
+
+import cProfile
+import heapq
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+
+# Leaf-most matching frame decides the category
+_IO_MODULES = {"session.py", "journal.py", "history.py", "roundlog.py"}
+_UI_MODULES = {"app.py", "client.py", "audio.py"}
+IDLE = "idle"
+TK_REDRAW = "tk redraw/layout"
+
+
+def _category(stack: tuple) -> str:
+    """Category of a stack of code objects, leaf first."""
+    for code in stack:
+        path = code.co_filename
+        name = os.path.basename(path)
+        if "tkinter" in path:
+            return "mainloop" if code is stack[0] and code.co_name == "mainloop" else "tk calls"
+        if "justai_roulette" not in path:
+            continue
+        if name in _IO_MODULES:
+            return "disk io"
+        if name == "profiling.py":
+            return "profiler"
+        parent = os.path.basename(os.path.dirname(path))
+        if parent == "game":
+            return "rules"
+        if parent == "ui" or name in _UI_MODULES:
+            return "ui code"
+    return "other"
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+@contextmanager
+def _enabled(prof: cProfile.Profile):
+    try:
+        prof.enable()
+    except ValueError:
+        # Python 3.12+: the round's own profiler already sees every thread
+        yield
+        return
+    try:
+        yield
+    finally:
+        prof.disable()
+
+
+class RoundProfiler:
+    """cProfile dumps for the next ``rounds`` rounds, written to ``out_dir``."""
+
+    def __init__(self, out_dir: Path | str, rounds: int = 1):
+        self.out_dir = Path(out_dir)
+        self.rounds = rounds
+        self.dumps: list[Path] = []
+        self.walls: list[float] = []
+        self._prof: cProfile.Profile | None = None
+        self._threads: list[cProfile.Profile] = []
+        self._started = 0.0
+        self._summarised = 0
+
+    @property
+    def active(self) -> bool:
+        """True while rounds remain to be profiled."""
+        return len(self.dumps) < self.rounds
+
+    def begin(self) -> None:
+        if self._prof is not None or not self.active:
+            return
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self._prof = cProfile.Profile()
+        self._started = time.perf_counter()
+        self._prof.enable()
+
+    def thread_profile(self) -> AbstractContextManager | None:
+        """Context manager profiling a block on another thread into the current round.
+
+        Returns None when not recording.  The block must have finished
+        before ``end``.
+        """
+        if self._prof is None:
+            return None
+        prof = cProfile.Profile()
+        self._threads.append(prof)
+        return _enabled(prof)
+
+    def end(self) -> Path | None:
+        """Stop the current round and dump it; returns the dump path."""
+        prof = self._prof
+        if prof is None:
+            return None
+        prof.disable()
+        self._prof = None
+        self.walls.append(time.perf_counter() - self._started)
+        path = self.out_dir / f"round-{len(self.dumps) + 1:04d}.prof"
+        stats = pstats.Stats(prof)
+        for other in self._threads:
+            other.create_stats()
+            if other.stats:
+                stats.add(other)
+        self._threads = []
+        stats.dump_stats(path)
+        self.dumps.append(path)
+        if not self.active:
+            self.write_summary()
+        return path
+
+    def write_summary(self, top: int = 40) -> Path | None:
+        """Merge the dumps into ``merged.prof`` and a cumulative-time ``summary.txt``."""
+        if not self.dumps or self._summarised == len(self.dumps):
+            return None
+        out = io.StringIO()
+        walls = ", ".join(f"{w * 1000:.1f}" for w in self.walls)
+        out.write(f"{len(self.dumps)} round(s); wall time per round (ms): {walls}\n")
+        stats = pstats.Stats(*(str(p) for p in self.dumps), stream=out)
+        stats.dump_stats(self.out_dir / "merged.prof")
+        stats.sort_stats("cumulative").print_stats(top)
+        path = self.out_dir / "summary.txt"
+        path.write_text(out.getvalue(), encoding="utf-8")
+        self._summarised = len(self.dumps)
+        return path
+
+    def close(self) -> None:
+        """Drop an unfinished round and summarise whatever was captured."""
+        if self._prof is not None:
+            self._prof.disable()
+            self._prof = None
+            self._threads = []
+        self.write_summary()
+
+
+class StackSampler:
+    """Periodic stack samples of one thread (the calling thread by default)."""
+
+    def __init__(self, interval: float = 0.01, thread_id: int | None = None,
+                 max_depth: int = 64, stall_s: float = 0.05, keep_stalls: int = 20):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.max_depth = max_depth
+        self.stall_s = stall_s
+        self.keep_stalls = keep_stalls
+        self.stacks: Counter = Counter()  # (code, ...) leaf first -> samples
+        self.categories: Counter = Counter()
+        self.stalls: list[tuple[float, float, dict]] = []  # heap of (duration, start, categories)
+        self.samples = 0
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        try:
+            self._cpu_clock = time.pthread_getcpuclockid(self.thread_id)
+        except (AttributeError, OSError):
+            self._cpu_clock = None  # no per-thread CPU clock: mainloop samples count as idle
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _cpu(self) -> float:
+        try:
+            return time.clock_gettime(self._cpu_clock)
+        except OSError:
+            return 0.0
+
+    def _run(self) -> None:
+        tid, depth, stall_s = self.thread_id, self.max_depth, self.stall_s
+        frames, wait = sys._current_frames, self._stop.wait
+        cached: dict[tuple, str] = {}
+        has_cpu = self._cpu_clock is not None
+        t0 = last = time.perf_counter()
+        cpu_last = self._cpu() if has_cpu else 0.0
+        run_start, run_cats = None, Counter()
+        while not wait(self.interval):
+            frame = frames().get(tid)
+            now = time.perf_counter()
+            if frame is None:
+                break  # thread has exited
+            stack = []
+            while frame is not None and len(stack) < depth:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            key = tuple(stack)
+            cat = cached.get(key)
+            if cat is None:
+                cat = cached[key] = _category(key)
+            if has_cpu:
+                cpu = self._cpu()
+                busy, cpu_last = cpu - cpu_last > (now - last) / 2, cpu
+            else:
+                busy = False
+            if cat == "mainloop":
+                cat = TK_REDRAW if busy else IDLE
+            self.stacks[key] += 1
+            self.categories[cat] += 1
+            self.samples += 1
+            if cat != IDLE:
+                if run_start is None:
+                    run_start = last
+                run_cats[cat] += 1
+            elif run_start is not None:
+                self._end_run(run_start - t0, last - run_start, run_cats, stall_s)
+                run_start, run_cats = None, Counter()
+            last = now
+        if run_start is not None:
+            self._end_run(run_start - t0, last - run_start, run_cats, stall_s)
+        self.elapsed = last - t0
+
+    def _end_run(self, start: float, duration: float, cats: Counter, stall_s: float) -> None:
+        if duration < stall_s:
+            return
+        entry = (duration, start, dict(cats))
+        if len(self.stalls) < self.keep_stalls:
+            heapq.heappush(self.stalls, entry)
+        else:
+            heapq.heappushpop(self.stalls, entry)
+
+    def report(self, top: int = 25) -> str:
+        """Category shares, longest stalls, and the hottest functions."""
+        total = self.samples or 1
+        lines = [f"{self.samples} samples over {self.elapsed:.1f} s "
+                 f"(every {self.interval * 1000:g} ms)", "", "By category:"]
+        for cat, n in self.categories.most_common():
+            lines.append(f"  {cat:<18}{n / total:7.1%}")
+        if self.stalls:
+            lines += ["", f"Longest stalls (busy >= {self.stall_s * 1000:g} ms):"]
+            for duration, start, cats in sorted(self.stalls, reverse=True):
+                split = ", ".join(f"{c} {n}" for c, n in Counter(cats).most_common())
+                lines.append(f"  {duration * 1000:8.0f} ms at {start:8.2f} s  [{split}]")
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for key, n in self.stacks.items():
+            own[key[0]] += n
+            for code in set(key):
+                inclusive[code] += n
+        for title, counts in (("Top functions (self):", own), ("Top functions (inclusive):", inclusive)):
+            lines += ["", title]
+            for code, n in counts.most_common(top):
+                lines.append(f"  {n / total:7.1%}  {_frame_label(code)}")
+        return "\n".join(lines) + "\n"
+
+    def folded(self) -> str:
+        """Samples as folded stacks (root first), for flame graph tools."""
+        return "".join(";".join(_frame_label(c) for c in reversed(key)) + f" {n}\n"
+                       for key, n in self.stacks.items())
+
+    def write(self, out_dir: Path | str) -> Path:
+        """Write ``samples.txt`` (the report) and ``samples.folded``; returns the report path."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        (out_dir / "samples.folded").write_text(self.folded(), encoding="utf-8")
+        path = out_dir / "samples.txt"
+        path.write_text(self.report(), encoding="utf-8")
+        return path
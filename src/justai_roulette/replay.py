@@ -0,0 +1,78 @@
+"""Round log replay tool - ``justai-roulette-replay``.
+
+Re-settles every round in a round log through the game rules at full speed
+(no animation, no Tk) and checks the recorded amount returned and closing
+balance of each one.  ``--show`` prints the full slip of chosen rounds for
+settling disputes.  Exits with status 1 if any round disagrees.
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+
+from .constants import ROUND_LOG_FILE
+from .game.roundlog import format_round, read_rounds, replay_rounds
+
+
+def _format_report(report, limit: int) -> str:
+    rate = report.rounds / report.elapsed if report.elapsed else 0
+    final = f"{report.final_balance:,.2f}" if report.final_balance is not None else "n/a"
+    lines = [
+        f"Rounds:          {report.rounds:,}",
+        f"Wagered:         {report.wagered:,.2f}",
+        f"Returned:        {report.returned:,.2f}",
+        f"Final balance:   {final}",
+        f"Adjustments:     {report.adjustments:,} (balance changed between rounds)",
+        f"Mismatches:      {len(report.mismatches):,}",
+    ]
+    for m in report.mismatches[:limit]:
+        lines.append(f"  round {m.seq}: {m.field} recorded {m.recorded:,.2f}, rules give {m.replayed:,.2f}")
+    if len(report.mismatches) > limit:
+        lines.append(f"  ... {len(report.mismatches) - limit:,} more")
+    lines.append(f"Elapsed:         {report.elapsed:.2f}s ({rate:,.0f} rounds/s)")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for ``justai-roulette-replay``."""
+    parser = argparse.ArgumentParser(
+        prog="justai-roulette-replay",
+        description="Verify a round log against the game rules.",
+    )
+    parser.add_argument("log", nargs="?", default=str(ROUND_LOG_FILE),
+                        help=f"round log to replay (default {ROUND_LOG_FILE})")
+    parser.add_argument("--show", type=int, nargs="+", metavar="SEQ", default=[],
+                        help="print the full record of these rounds")
+    parser.add_argument("--limit", type=int, default=20, help="mismatches to list (default 20)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    wanted = set(args.show)
+    shown = []
+
+    def _rounds():
+        for rnd in read_rounds(args.log):
+            if rnd.seq in wanted:
+                shown.append(rnd)
+            yield rnd
+
+    try:
+        report = replay_rounds(_rounds())
+    except (OSError, ValueError) as exc:
+        print(f"justai-roulette-replay: {exc}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.json:
+        data = asdict(report)
+        data["shown"] = [rnd._asdict() for rnd in shown]
+        print(json.dumps(data, indent=2))
+    else:
+        for rnd in shown:
+            print("\n".join(format_round(rnd)), end="\n\n")
+        print(_format_report(report, args.limit))
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
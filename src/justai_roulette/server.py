@@ -0,0 +1,323 @@
+"""Multi-table game server - ``justai-roulette-server``.
+
+Hosts many tables, each with many seats, in one asyncio event loop.  Every
+table runs the spin schedule the standalone GUI drives with its countdown:
+betting is open for ``interval`` seconds, then one outcome is drawn and
+every seat at the table is settled in a single pass, and the table reopens
+once clients have had ``spin_time`` to animate the result.
+
+Clients speak newline-delimited JSON over TCP.  Requests carry an ``op``:
+
+    join       table, seat              take (or retake) a seat; a new seat
+                                        starts with the table's ``--balance``
+    watch      table                    receive table events without a seat
+    bet        kind=quick|call, name, amount
+               kind=id, id, amount, [x, y]      id: a ``game.catalogue`` bet id
+               kind=neighbours, number, k, amount   number and k either side
+    undo / clear / rebet / double       slip actions, as in the GUI
+    leave
+
+and events carry an ``ev``: ``joined``, ``open``, ``tick``, ``spin`` (with
+the seat's bet, win and balance for seated clients), ``slip`` (the seat's
+slip after a bet action) and ``error``.  Seats outlive their connection, so a
+kiosk that reconnects finds its balance and pending bets intact.
+
+``--bots N`` adds N loopback clients betting every round, for load tests.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import sys
+import time
+
+from .constants import DEFAULT_BALANCE
+from .game.bets import get_number_color
+from .game.engine import BetError, RouletteEngine
+from .game.history import SpinHistory
+from .game.rng import Rng, make_rng
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8737
+SPIN_TIME = 6.0  # seconds between the outcome and the next betting window
+_MAX_BUFFER = 1 << 20  # drop a client whose unsent events pass this many bytes
+
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _slip_event(engine: RouletteEngine) -> dict:
+    return {
+        "ev": "slip",
+        "bets": [{"id": b.id, "label": b.label, "amount": b.amount, "x": b.x, "y": b.y}
+                 for b in engine.slip],
+        "total": engine.total_bet,
+        "balance": engine.balance,
+    }
+
+
+class Seat:
+    """One player position: an engine plus the connection currently driving it."""
+
+    __slots__ = ("name", "engine", "conn")
+
+    def __init__(self, name: str, balance: float):
+        self.name = name
+        self.engine = RouletteEngine(balance=balance, history=SpinHistory(), stat_windows=())
+        self.conn: "Connection | None" = None
+
+
+class Table:
+    """A wheel shared by many seats."""
+
+    def __init__(self, name: str, rng: Rng, interval: float, spin_time: float = SPIN_TIME,
+                 balance: float = DEFAULT_BALANCE):
+        self.name = name
+        self.rng = rng
+        self.interval = interval
+        self.spin_time = spin_time
+        self.balance = balance  # starting balance of a new seat
+        self.seats: dict[str, Seat] = {}
+        self.watchers: set[Connection] = set()
+        self.history = SpinHistory()
+        self.round = 0
+        self.open = False
+        self.closes_at = 0.0
+
+    def state(self) -> dict:
+        return {
+            "table": self.name,
+            "round": self.round,
+            "open": self.open,
+            "remaining": max(0, round(self.closes_at - time.monotonic())) if self.open else 0,
+            "recent": self.history.recent(50),
+        }
+
+    def _broadcast(self, message: dict) -> None:
+        data = encode(message)
+        for conn in list(self.watchers):
+            conn.send_bytes(data)
+
+    def settle(self, number: int) -> float:
+        """Settle every seat on ``number`` and push the results; returns seconds taken."""
+        start = time.perf_counter()
+        base = {"ev": "spin", "table": self.name, "round": self.round,
+                "number": number, "color": get_number_color(number)}
+        data = encode(base)
+        self.history.append(number)
+        for seat in self.seats.values():
+            result = seat.engine.spin(number)
+            if seat.conn is not None:
+                seat.conn.send(dict(base, bet=result.bet_amount, win=result.total_win,
+                                    balance=seat.engine.balance))
+        seated = {seat.conn for seat in self.seats.values()}
+        for conn in self.watchers - seated:
+            conn.send_bytes(data)
+        return time.perf_counter() - start
+
+    async def run(self) -> None:
+        """The spin schedule: open, count down, draw, settle, pause, repeat."""
+        while True:
+            self.round += 1
+            self.open = True
+            self.closes_at = time.monotonic() + self.interval
+            self._broadcast({"ev": "open", "table": self.name, "round": self.round,
+                             "remaining": round(self.interval)})
+            while (remaining := self.closes_at - time.monotonic()) > 0:
+                # Tick on whole seconds of the deadline rather than accumulating sleeps
+                await asyncio.sleep(remaining - int(remaining) or 1.0)
+                left = round(self.closes_at - time.monotonic())
+                if left > 0:
+                    self._broadcast({"ev": "tick", "table": self.name, "remaining": left})
+            self.open = False
+            number = self.rng.pocket()
+            elapsed = self.settle(number)
+            log.info("%s round %d: %d settled %d seats in %.2f ms",
+                     self.name, self.round, number, len(self.seats), elapsed * 1000)
+            await asyncio.sleep(self.spin_time)
+
+
+class Connection:
+    """One client socket: parses requests and queues events."""
+
+    def __init__(self, server: "GameServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.table: Table | None = None
+        self.seat: Seat | None = None
+
+    def send(self, message: dict) -> None:
+        self.send_bytes(encode(message))
+
+    def send_bytes(self, data: bytes) -> None:
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > _MAX_BUFFER:
+            log.warning("Dropping slow client %s", self.writer.get_extra_info("peername"))
+            self.writer.close()
+            return
+        self.writer.write(data)
+
+    async def serve(self) -> None:
+        try:
+            while line := await self.reader.readline():
+                try:
+                    request = json.loads(line)
+                    self.handle(request)
+                except BetError as exc:
+                    self.send({"ev": "error", "op": request.get("op"), "message": str(exc)})
+                except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                    self.send({"ev": "error", "message": f"Bad request: {exc}"})
+                await self.writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # client gone, or the server is shutting down
+        finally:
+            self._detach()
+            self.writer.close()
+
+    def _detach(self) -> None:
+        if self.table is not None:
+            self.table.watchers.discard(self)
+        if self.seat is not None and self.seat.conn is self:
+            self.seat.conn = None
+        self.table = self.seat = None
+
+    def _engine(self) -> RouletteEngine:
+        if self.seat is None:
+            raise BetError("Join a table first.")
+        if not self.table.open:
+            raise BetError("Wait for spin...")
+        return self.seat.engine
+
+    def handle(self, request: dict) -> None:
+        op = request["op"]
+        if op in ("join", "watch"):
+            table = self.server.tables.get(request["table"])
+            if table is None:
+                raise BetError(f"Unknown table: {request['table']}")
+            self._detach()
+            self.table = table
+            table.watchers.add(self)
+            event = {"ev": "joined", **table.state()}
+            if op == "join":
+                name = str(request["seat"])
+                seat = table.seats.get(name)
+                if seat is None:
+                    seat = table.seats[name] = Seat(name, table.balance)
+                elif seat.conn is not None and seat.conn is not self:
+                    seat.conn.send({"ev": "error", "message": "Seat taken over by another client."})
+                    seat.conn._detach()
+                seat.conn = self
+                self.seat = seat
+                event.update(_slip_event(seat.engine), ev="joined", seat=name)
+            self.send(event)
+        elif op == "leave":
+            self._detach()
+        elif op == "bet":
+            engine = self._engine()
+            amount = float(request["amount"])
+            if not 0 < amount < math.inf:  # json.loads accepts NaN and Infinity
+                raise BetError("Bet amount must be a positive number.")
+            kind = request.get("kind", "id")
+            if kind == "quick":
+                engine.place_quick_bet(request["name"], amount)
+            elif kind == "call":
+                engine.place_call_bet(request["name"], amount)
+            elif kind == "neighbours":
+                engine.place_neighbour_bet(int(request["number"]), int(request["k"]), amount)
+            else:
+                engine.place_bet(int(request["id"]), amount,
+                                 float(request.get("x", 0.0)), float(request.get("y", 0.0)))
+            self.send(_slip_event(engine))
+        elif op in ("undo", "clear", "rebet", "double"):
+            engine = self._engine()
+            {"undo": engine.undo_last, "clear": engine.clear_bets,
+             "rebet": engine.rebet, "double": engine.double_bets}[op]()
+            self.send(_slip_event(engine))
+        else:
+            raise BetError(f"Unknown op: {op}")
+
+
+class GameServer:
+    """Tables plus the TCP listener that feeds them."""
+
+    def __init__(self, tables: list[Table]):
+        self.tables = {t.name: t for t in tables}
+        self._tasks: list[asyncio.Task] = []  # the loop only holds weak references
+
+    async def _on_client(self, reader, writer) -> None:
+        await Connection(self, reader, writer).serve()
+
+    async def serve(self, host: str, port: int) -> asyncio.AbstractServer:
+        server = await asyncio.start_server(self._on_client, host, port)
+        self._tasks += [asyncio.create_task(table.run(), name=f"table-{table.name}")
+                        for table in self.tables.values()]
+        return server
+
+    def add_bots(self, host: str, port: int, count: int, bet: str = "Red", amount: float = 1.0) -> None:
+        """Start ``count`` loopback ``_bot`` clients spread over the tables."""
+        names = list(self.tables)
+        self._tasks += [asyncio.create_task(_bot(host, port, names[i % len(names)], f"bot{i}", bet, amount),
+                                            name=f"bot{i}")
+                        for i in range(count)]
+
+
+async def _bot(host: str, port: int, table: str, seat: str, bet: str, amount: float) -> None:
+    """Loopback load-test client: re-bets ``bet`` every round."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode({"op": "join", "table": table, "seat": seat}))
+    while line := await reader.readline():
+        if json.loads(line).get("ev") == "open":
+            writer.write(encode({"op": "bet", "kind": "quick", "name": bet, "amount": amount}))
+            await writer.drain()
+
+
+async def _main(args) -> None:
+    tables = [
+        Table(f"T{i + 1}", make_rng(args.rng, None if args.seed is None else args.seed + i),
+              args.interval, args.spin_time, args.balance)
+        for i in range(args.tables)
+    ]
+    game = GameServer(tables)
+    server = await game.serve(args.host, args.port)
+    names = ", ".join(t.name for t in tables)
+    print(f"justai-roulette-server: tables {names} on {args.host}:{args.port}", file=sys.stderr)
+    game.add_bots(args.host, args.port, args.bots)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for ``justai-roulette-server``."""
+    parser = argparse.ArgumentParser(prog="justai-roulette-server",
+                                     description="Host roulette tables for kiosk clients.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--tables", type=int, default=1)
+    parser.add_argument("--interval", type=float, default=40.0, help="seconds of betting per round")
+    parser.add_argument("--spin-time", type=float, default=SPIN_TIME,
+                        help="seconds clients get to animate a result before betting reopens")
+    parser.add_argument("--balance", type=float, default=DEFAULT_BALANCE,
+                        help="starting balance of every new seat")
+    parser.add_argument("--rng", choices=("system", "seeded", "numpy"), default="system")
+    parser.add_argument("--seed", type=int, default=None, help="seed for --rng seeded/numpy (table i uses seed+i)")
+    parser.add_argument("--bots", type=int, default=0, help="loopback clients betting every round (load test)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log per-round settlement times")
+    args = parser.parse_args(argv)
+    if not 0 < args.balance < float("inf"):
+        parser.error("--balance must be a positive amount")
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s %(message)s")
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
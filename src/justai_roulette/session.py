@@ -1,10 +1,24 @@
-"""Session persistence for JustAI Roulette."""
+"""Session persistence for JustAI Roulette.
+
+The session is stored as a JSON snapshot plus an append-only journal of
+events written since that snapshot (see ``journal.SessionJournal``).
+``load_session`` reads the snapshot and replays the journal on top of it.
+"""
 
 import json
+import logging
+import os
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
-from .constants import SESSION_FILE, DEFAULT_BALANCE
+from . import probes
+from .constants import SESSION_FILE, JOURNAL_FILE, DEFAULT_BALANCE
+from .game.bets import get_number_color
+
+HISTORY_LIMIT = 50
+
+log = logging.getLogger(__name__)
 
 
 @dataclass
@@ -20,10 +34,93 @@ class SessionData:
     color_counts: dict[str, int] = field(default_factory=lambda: {"red": 0, "black": 0, "green": 0})
     parity_counts: dict[str, int] = field(default_factory=lambda: {"odd": 0, "even": 0, "zero": 0})
     session_stats: dict[str, Any] = field(default_factory=lambda: {"spins": 0, "bet_total": 0.0, "win_total": 0.0})
+    journal_seq: int = 0  # last journal event folded into this state
 
 
-def load_session() -> SessionData:
-    """Load session from file, returning defaults if not found."""
+def session_to_dict(session: SessionData) -> dict:
+    """JSON-ready copy of a session snapshot (safe to serialise on another thread)."""
+    return {
+        "balance": session.balance,
+        "sound_enabled": session.sound_enabled,
+        "auto_spin_enabled": session.auto_spin_enabled,
+        "auto_spin_interval": session.auto_spin_interval,
+        "currency": session.currency,
+        "history": [list(h) for h in session.history[:HISTORY_LIMIT]],
+        "hot_counts": {str(k): v for k, v in session.hot_counts.items()},
+        "color_counts": dict(session.color_counts),
+        "parity_counts": dict(session.parity_counts),
+        "session_stats": dict(session.session_stats),
+        "journal_seq": session.journal_seq,
+    }
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a fsynced temp file and an atomic rename."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(text)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def _apply_event(session: SessionData, event: dict) -> None:
+    """Fold one journal event into ``session``."""
+    kind = event.get("e")
+    if kind == "spin":
+        num = int(event["n"])
+        color = get_number_color(num)
+        session.balance = float(event["bal"])
+        session.history.insert(0, (num, color))
+        del session.history[HISTORY_LIMIT:]
+        session.hot_counts[num] = session.hot_counts.get(num, 0) + 1
+        session.color_counts[color] = session.color_counts.get(color, 0) + 1
+        parity = "zero" if num == 0 else ("odd" if num % 2 else "even")
+        session.parity_counts[parity] = session.parity_counts.get(parity, 0) + 1
+        session.session_stats["spins"] = session.session_stats.get("spins", 0) + 1
+        session.session_stats["bet_total"] = session.session_stats.get("bet_total", 0.0) + event["bet"]
+        session.session_stats["win_total"] = session.session_stats.get("win_total", 0.0) + event["win"]
+    elif kind == "balance":
+        session.balance = float(event["bal"])
+    elif kind == "reset":
+        fresh = SessionData(
+            balance=float(event["bal"]),
+            sound_enabled=session.sound_enabled,
+            auto_spin_enabled=session.auto_spin_enabled,
+            auto_spin_interval=session.auto_spin_interval,
+            currency=session.currency,
+        )
+        session.__dict__.update(fresh.__dict__)
+    elif kind == "settings":
+        for name in ("sound_enabled", "auto_spin_enabled", "auto_spin_interval", "currency"):
+            if name in event:
+                setattr(session, name, event[name])
+
+
+def _replay_journal(session: SessionData, path: Path) -> None:
+    """Apply journal events newer than the snapshot. A torn final line is ignored."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    event = json.loads(line)
+                    seq = int(event["s"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+                if seq <= session.journal_seq:
+                    continue
+                try:
+                    _apply_event(session, event)
+                except (KeyError, TypeError, ValueError):
+                    log.warning("Skipping malformed journal event %d", seq)
+                session.journal_seq = seq
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        log.warning("Could not read session journal %s: %s", path, exc)
+
+
+def _load_snapshot() -> SessionData:
     try:
         if SESSION_FILE.exists():
             data = json.loads(SESSION_FILE.read_text())
@@ -52,32 +149,32 @@ def load_session() -> SessionData:
                 auto_spin_enabled=data.get("auto_spin_enabled", data.get("auto_enabled", True)),
                 auto_spin_interval=data.get("auto_spin_interval", data.get("auto_interval", 40)),
                 currency=data.get("currency", "$"),
-                history=history[:50],
+                history=history[:HISTORY_LIMIT],
                 hot_counts=hot_counts,
                 color_counts=data.get("color_counts", {"red": 0, "black": 0, "green": 0}),
                 parity_counts=data.get("parity_counts", {"odd": 0, "even": 0, "zero": 0}),
                 session_stats=data.get("session_stats", {"spins": 0, "bet_total": 0.0, "win_total": 0.0}),
+                journal_seq=int(data.get("journal_seq", 0)),
             )
     except (json.JSONDecodeError, KeyError, TypeError, ValueError):
         pass
+    except OSError as exc:
+        log.warning("Could not read session file %s: %s", SESSION_FILE, exc)
     return SessionData()
 
 
+def load_session() -> SessionData:
+    """Load session from the snapshot plus journal, returning defaults if not found."""
+    session = _load_snapshot()
+    _replay_journal(session, JOURNAL_FILE)
+    return session
+
+
 def save_session(session: SessionData) -> None:
-    """Save session to file."""
+    """Save a full snapshot to the session file (atomically)."""
+    started = probes.start()
     try:
-        data = {
-            "balance": session.balance,
-            "sound_enabled": session.sound_enabled,
-            "auto_spin_enabled": session.auto_spin_enabled,
-            "auto_spin_interval": session.auto_spin_interval,
-            "currency": session.currency,
-            "history": [list(h) for h in session.history[:50]],
-            "hot_counts": {str(k): v for k, v in session.hot_counts.items()},
-            "color_counts": session.color_counts,
-            "parity_counts": session.parity_counts,
-            "session_stats": session.session_stats,
-        }
-        SESSION_FILE.write_text(json.dumps(data, indent=2))
-    except Exception:
-        pass
+        atomic_write(SESSION_FILE, json.dumps(session_to_dict(session), indent=2))
+    except OSError as exc:
+        log.warning("Could not save session to %s: %s", SESSION_FILE, exc)
+    probes.stop("session.save", started)
@@ -0,0 +1,254 @@
+"""Monte Carlo strategy simulator - ``justai-roulette-sim``.
+
+Runs many independent sessions of a bet slip (optionally under a staking
+progression) across a process pool and reports the bankroll distribution,
+time to ruin, max drawdown and realised house edge.  Sessions are split into
+chunks, each with its own seeded RNG stream spawned from ``--seed``, so
+results do not depend on the number of workers.  Partial aggregates are
+printed as chunks complete; Ctrl-C stops early and reports what finished.
+
+Requires NumPy (``pip install justai-roulette[sim]``).
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from .constants import DEFAULT_BALANCE, MAX_SINGLE_BET
+from .game.batch import payout_vector
+from .game.rng import NumpyRng
+from .game.slip import build_slip
+
+STRATEGIES = ("flat", "martingale", "dalembert")
+_OUTCOME_BLOCK = 256
+
+
+def simulate_chunk(vector: np.ndarray, stake: float, max_mult: float, strategy: str,
+                   sessions: int, spins: int, bankroll: float,
+                   seed: np.random.SeedSequence) -> dict:
+    """Play ``sessions`` sessions of up to ``spins`` spins each.
+
+    ``vector`` is the slip's net result per pocket for one unit; the
+    progression scales the unit.  All sessions in the chunk advance together,
+    one vectorised step per spin.
+    """
+    rng = NumpyRng(seed)
+    balance = np.full(sessions, bankroll, dtype=np.float64)
+    peak = balance.copy()
+    max_dd = np.zeros(sessions)
+    mult = np.ones(sessions)
+    alive = np.ones(sessions, dtype=bool)
+    ruin = np.full(sessions, -1, dtype=np.int64)
+    wagered = 0.0
+    net_total = 0.0
+
+    spin = 0
+    while spin < spins and alive.any():
+        block = rng.array((min(_OUTCOME_BLOCK, spins - spin), sessions))
+        for outcomes in block:
+            cost = mult * stake
+            broke = alive & (cost > balance + 1e-9)
+            ruin[broke] = spin
+            alive &= ~broke
+            if not alive.any():
+                break
+            net = np.where(alive, mult * vector[outcomes], 0.0)
+            wagered += cost[alive].sum()
+            net_total += net.sum()
+            balance += net
+            np.maximum(peak, balance, out=peak)
+            np.maximum(max_dd, peak - balance, out=max_dd)
+
+            if strategy == "martingale":
+                mult = np.where(net > 0, 1.0, mult * 2)
+            elif strategy == "dalembert":
+                mult = np.where(net > 0, np.maximum(1.0, mult - 1), mult + 1)
+            if strategy != "flat":
+                # Table limit: a progression that would breach it restarts at one unit
+                mult = np.where(mult > max_mult, 1.0, mult)
+            spin += 1
+
+    return {
+        "final": balance,
+        "ruin": ruin,
+        "max_drawdown": max_dd,
+        "wagered": wagered,
+        "net": net_total,
+    }
+
+
+class _Aggregate:
+    """Running totals over completed chunks.
+
+    ``progress`` reads only the running sums; the per-session arrays are
+    concatenated once, by ``summary``.
+    """
+
+    def __init__(self):
+        self.final: list[np.ndarray] = []
+        self.ruin: list[np.ndarray] = []
+        self.max_dd: list[np.ndarray] = []
+        self.sessions = 0
+        self.final_sum = 0.0
+        self.ruined = 0
+        self.wagered = 0.0
+        self.net = 0.0
+
+    def add(self, chunk: dict) -> None:
+        self.final.append(chunk["final"])
+        self.ruin.append(chunk["ruin"])
+        self.max_dd.append(chunk["max_drawdown"])
+        self.sessions += chunk["final"].size
+        self.final_sum += float(chunk["final"].sum())
+        self.ruined += int((chunk["ruin"] >= 0).sum())
+        self.wagered += chunk["wagered"]
+        self.net += chunk["net"]
+
+    def progress(self) -> tuple[int, float, float, float | None]:
+        """(sessions, mean bankroll, ruin rate, house edge) so far."""
+        n = self.sessions or 1
+        edge = -self.net / self.wagered if self.wagered else None
+        return self.sessions, self.final_sum / n, self.ruined / n, edge
+
+    def summary(self) -> dict:
+        if not self.final:
+            return {"sessions": 0}
+        final = np.concatenate(self.final)
+        ruin = np.concatenate(self.ruin)
+        max_dd = np.concatenate(self.max_dd)
+        ruined = ruin[ruin >= 0]
+        pct = (5, 25, 50, 75, 95)
+        return {
+            "sessions": int(final.size),
+            "bankroll": {
+                "mean": float(final.mean()),
+                "std": float(final.std()),
+                "min": float(final.min()),
+                "max": float(final.max()),
+                **{f"p{p}": float(v) for p, v in zip(pct, np.percentile(final, pct))},
+            },
+            "ruin_rate": float(ruined.size / final.size),
+            "time_to_ruin": {
+                "mean": float(ruined.mean()) if ruined.size else None,
+                "median": float(np.median(ruined)) if ruined.size else None,
+            },
+            "max_drawdown": {
+                "mean": float(max_dd.mean()),
+                "p95": float(np.percentile(max_dd, 95)),
+            },
+            "wagered": self.wagered,
+            "house_edge": -self.net / self.wagered if self.wagered else None,
+        }
+
+
+def _format_summary(s: dict) -> str:
+    if not s["sessions"]:
+        return "No sessions completed."
+    b, ttr, dd = s["bankroll"], s["time_to_ruin"], s["max_drawdown"]
+    edge = f"{s['house_edge'] * 100:.3f}%" if s["house_edge"] is not None else "n/a"
+    ruin_line = f"{s['ruin_rate'] * 100:.2f}%"
+    if ttr["mean"] is not None:
+        ruin_line += f" (time to ruin: mean {ttr['mean']:.1f}, median {ttr['median']:.0f} spins)"
+    return "\n".join([
+        f"Sessions:        {s['sessions']:,}",
+        f"Final bankroll:  mean {b['mean']:.2f}  sd {b['std']:.2f}  min {b['min']:.2f}  max {b['max']:.2f}",
+        f"  percentiles:   p5 {b['p5']:.2f}  p25 {b['p25']:.2f}  p50 {b['p50']:.2f}"
+        f"  p75 {b['p75']:.2f}  p95 {b['p95']:.2f}",
+        f"Ruin:            {ruin_line}",
+        f"Max drawdown:    mean {dd['mean']:.2f}  p95 {dd['p95']:.2f}",
+        f"Wagered:         {s['wagered']:,.2f}",
+        f"House edge:      {edge}",
+    ])
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for ``justai-roulette-sim``."""
+    parser = argparse.ArgumentParser(
+        prog="justai-roulette-sim",
+        description="Monte Carlo simulation of a roulette betting strategy.",
+    )
+    parser.add_argument("bets", nargs="+",
+                        help="QUICK_BETS / CALL_BETS names or N+K neighbour bets, "
+                             "optionally NAME:units (e.g. Red:2 Voisins 17+2)")
+    parser.add_argument("--chip", type=float, default=1.0, help="chip value per unit (default 1)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="flat")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--spins", type=int, default=1_000, help="max spins per session")
+    parser.add_argument("--bankroll", type=float, default=DEFAULT_BALANCE)
+    parser.add_argument("--table-limit", type=float, default=MAX_SINGLE_BET,
+                        help="largest single bet a progression may reach")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=1_000, help="sessions per task")
+    parser.add_argument("--json", action="store_true", help="print the final summary as JSON")
+    parser.add_argument("--quiet", action="store_true", help="do not stream partial results")
+    args = parser.parse_args(argv)
+    for name in ("sessions", "spins", "chunk_size", "workers"):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be at least 1")
+    if not 0 < args.chip < math.inf:
+        parser.error("--chip must be a positive number")
+
+    try:
+        slip = build_slip(args.bets, args.chip)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if slip.total > args.bankroll:
+        parser.error(f"slip costs {slip.total:.2f}, more than the bankroll")
+    vector = payout_vector(slip)
+    largest = max(b.amount for b in slip)
+    if largest > args.table_limit:
+        parser.error(f"a {largest:.2f} bet is over the table limit of {args.table_limit:.2f}")
+    max_mult = max(1.0, args.table_limit / largest)
+
+    chunk_sizes = [args.chunk_size] * (args.sessions // args.chunk_size)
+    if args.sessions % args.chunk_size:
+        chunk_sizes.append(args.sessions % args.chunk_size)
+    seeds = np.random.SeedSequence(args.seed).spawn(len(chunk_sizes))
+
+    agg = _Aggregate()
+    started = time.perf_counter()
+    interrupted = False
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        pending = {
+            pool.submit(simulate_chunk, vector, slip.total, max_mult, args.strategy,
+                        n, args.spins, args.bankroll, seq)
+            for n, seq in zip(chunk_sizes, seeds)
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    agg.add(fut.result())
+                if not args.quiet:
+                    sessions, mean, ruin_rate, edge = agg.progress()
+                    print(
+                        f"[{time.perf_counter() - started:7.1f}s] {sessions:>10,}/{args.sessions:,} sessions"
+                        f"  mean bankroll {mean:9.2f}"
+                        f"  ruin {ruin_rate * 100:6.2f}%"
+                        f"  edge {edge * 100 if edge is not None else float('nan'):6.3f}%",
+                        file=sys.stderr, flush=True,
+                    )
+        except KeyboardInterrupt:
+            interrupted = True
+            pool.shutdown(wait=False, cancel_futures=True)
+            print("Interrupted - reporting completed sessions.", file=sys.stderr)
+
+    summary = agg.summary()
+    summary["elapsed"] = time.perf_counter() - started
+    summary["interrupted"] = interrupted
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(_format_summary(summary))
+        print(f"Elapsed:         {summary['elapsed']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Precomputed ball trajectories and a drift-free frame scheduler.
+
+A spin is computed up front as a ``Timeline``: parallel columns of frame
+time, ball angle, radius and phase, plus a short list of timed events (ball
+clicks).  ``play_timeline`` replays it against ``time.monotonic()``: each
+tick draws the frame due *now* and sleeps until the next one, skipping
+frames when the Tk loop falls behind, so a spin always lasts exactly
+``timeline.duration`` and costs the same per frame however busy the UI is.
+"""
+
+import math
+import time
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .. import probes
+
+FRAME_S = 1 / 30
+
+# Phase durations in seconds
+SPIN_S = 2.1
+DROP_S = 0.85
+BOUNCES = ((15, 0.12), (5, 0.10), (8, 0.08), (0, 0.06))  # (radius offset, hold)
+
+PHASE_SPIN, PHASE_DROP, PHASE_BOUNCE = 0, 1, 2
+_FRAME_PROBES = ("frame.spin", "frame.drop", "frame.bounce")  # by phase
+
+
+@dataclass
+class Timeline:
+    """Frame columns for one spin; frame ``i`` is shown from ``t[i]``."""
+    t: array = field(default_factory=lambda: array("d"))
+    angle: array = field(default_factory=lambda: array("d"))
+    radius: array = field(default_factory=lambda: array("d"))
+    phase: array = field(default_factory=lambda: array("B"))
+    events: list[tuple[float, str]] = field(default_factory=list)
+    duration: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def _add(self, t: float, angle: float, radius: float, phase: int) -> None:
+        self.t.append(t)
+        self.angle.append(angle)
+        self.radius.append(radius)
+        self.phase.append(phase)
+
+
+def spin_timeline(start_angle: float, target_angle: float, track_r: float,
+                  ring_r: float, frame_s: float = FRAME_S) -> Timeline:
+    """Ball path from ``start_angle`` on the track down to ``target_angle``.
+
+    The ball decelerates around the track, drops in towards the pockets and
+    settles after a few bounces (each bounce start is a ``"ball_click"`` event).
+    """
+    tl = Timeline()
+    travel = start_angle - target_angle
+
+    frames = max(1, round(SPIN_S / frame_s))
+    for i in range(frames):
+        u = (i + 1) / frames
+        tl._add(i * frame_s, start_angle - travel * (1 - (1 - u) ** 2), track_r, PHASE_SPIN)
+    t0 = frames * frame_s
+
+    inner_r = ring_r * 0.3
+    frames = max(1, round(DROP_S / frame_s))
+    for i in range(frames):
+        p = (i + 1) / frames
+        radius = track_r - (track_r - inner_r) * p ** 0.8
+        tl._add(t0 + i * frame_s, target_angle, radius, PHASE_DROP)
+    t0 += frames * frame_s
+
+    settle_r = ring_r * 0.35
+    for offset, hold in BOUNCES:
+        tl.events.append((t0, "ball_click"))
+        tl._add(t0, target_angle, settle_r + offset, PHASE_BOUNCE)
+        t0 += hold
+    tl.duration = t0
+    return tl
+
+
+def play_timeline(root, timeline: Timeline,
+                  on_frame: Callable[[int], None],
+                  on_event: Callable[[str], None] | None = None,
+                  on_done: Callable[[], None] | None = None) -> Callable[[], None]:
+    """Replay ``timeline`` on ``root``'s event loop; returns a cancel function.
+
+    ``on_frame(i)`` is called with the index of the frame due at the current
+    time (intermediate frames are skipped if the loop ran late).  Events are
+    never skipped, but several overdue ones fire in the same tick.
+
+    With probes enabled, each tick records how late ``after`` fired
+    (``after.lateness``), each drawn frame its ``on_frame`` time under the
+    phase's probe, and skipped frames count as ``frames.dropped``.
+    """
+    start = time.monotonic()
+    times = timeline.t
+    events = timeline.events
+    phases = timeline.phase
+    state = {"frame": -1, "event": 0, "after": None, "due": None}
+
+    def tick():
+        elapsed = time.monotonic() - start
+        if probes.enabled and state["due"] is not None:
+            probes.record("after.lateness", max(0.0, elapsed - state["due"]))
+        while state["event"] < len(events) and events[state["event"]][0] <= elapsed:
+            if on_event is not None:
+                on_event(events[state["event"]][1])
+            state["event"] += 1
+        if elapsed >= timeline.duration:
+            if state["frame"] != len(times) - 1:
+                on_frame(len(times) - 1)
+            state["after"] = None
+            if on_done is not None:
+                on_done()
+            return
+        frame = max(0, bisect_right(times, elapsed) - 1)
+        if frame != state["frame"]:
+            if probes.enabled:
+                probes.count("frames.drawn")
+                if frame > state["frame"] + 1:
+                    probes.count("frames.dropped", frame - state["frame"] - 1)
+            drawn = probes.start()
+            state["frame"] = frame
+            on_frame(frame)
+            probes.stop(_FRAME_PROBES[phases[frame]], drawn)
+        next_t = times[frame + 1] if frame + 1 < len(times) else timeline.duration
+        state["due"] = next_t
+        delay = max(1, math.ceil((next_t - (time.monotonic() - start)) * 1000))
+        state["after"] = root.after(delay, tick)
+
+    def cancel():
+        if state["after"] is not None:
+            root.after_cancel(state["after"])
+            state["after"] = None
+
+    tick()
+    return cancel
@@ -0,0 +1,112 @@
+"""Chip tray component."""
+
+import math
+from tkinter import Canvas, DoubleVar
+
+from ..constants import CHIP_VALUES, Colors
+
+CHIP_STYLES = [
+    {"fill": "#dc143c", "edge": "#fff", "stripe": "#fff"},
+    {"fill": "#1e90ff", "edge": "#fff", "stripe": "#fff"},
+    {"fill": "#228b22", "edge": "#fff", "stripe": "#fff"},
+    {"fill": "#8b008b", "edge": "#ffd700", "stripe": "#ffd700"},
+    {"fill": "#ff8c00", "edge": "#000", "stripe": "#000"},
+    {"fill": "#2f4f4f", "edge": "#ffd700", "stripe": "#ffd700"},
+]
+
+
+def build_chip_tray(parent, selected_chip: DoubleVar, bg_color: str = Colors.FELT) -> dict:
+    """
+    Create the chip selector, drawn once as tagged canvas items.
+
+    Every item of chip ``i`` carries the tags ``tray`` and ``chip{i}``; the
+    selection glow is a single item that is moved when ``selected_chip``
+    changes, and a resize just translates the ``tray`` tag.
+
+    Returns a dict with:
+        - canvas: The Canvas widget
+        - select: Function to move the glow to a chip value
+    """
+    canvas = Canvas(parent, bg=bg_color, highlightthickness=0, height=90)
+    canvas.pack(fill="x", padx=4, pady=(6, 4))
+
+    chip_r, spacing = 34, 84
+    cy = 45
+    glow_r = chip_r + 4
+
+    def _left_for(width: int) -> float:
+        return (width - len(CHIP_VALUES) * spacing) // 2 + chip_r + 8
+
+    state = {"left": _left_for(700)}  # x of the first chip centre
+
+    for i, value in enumerate(CHIP_VALUES):
+        cx = state["left"] + i * spacing
+        style = CHIP_STYLES[i % len(CHIP_STYLES)]
+        tags = ("tray", f"chip{i}")
+
+        # Shadow and chip body
+        canvas.create_oval(cx - chip_r + 3, cy - chip_r + 3, cx + chip_r + 3, cy + chip_r + 3,
+                           fill="#0a0a0a", outline="", tags=tags)
+        canvas.create_oval(cx - chip_r, cy - chip_r, cx + chip_r, cy + chip_r,
+                           fill=style["fill"], outline=style["edge"], width=2, tags=tags)
+
+        # Edge stripes
+        stripe_r = chip_r - 2
+        for angle_deg in range(0, 360, 45):
+            angle = math.radians(angle_deg)
+            sx = cx + stripe_r * math.cos(angle)
+            sy = cy + stripe_r * math.sin(angle)
+            canvas.create_oval(sx - 4, sy - 4, sx + 4, sy + 4, fill=style["stripe"], outline="", tags=tags)
+
+        # Inner rings
+        inner_r1 = chip_r - 10
+        canvas.create_oval(cx - inner_r1, cy - inner_r1, cx + inner_r1, cy + inner_r1,
+                           fill="", outline=style["edge"], width=2, tags=tags)
+        inner_r2 = chip_r - 14
+        canvas.create_oval(cx - inner_r2, cy - inner_r2, cx + inner_r2, cy + inner_r2,
+                           fill=style["fill"], outline="", tags=tags)
+
+        # Value text
+        txt = f"${value:.0f}" if value >= 1 else "50¢"
+        canvas.create_text(cx, cy, text=txt, font=("Segoe UI", 12, "bold"), fill="#fff", tags=tags)
+
+    # Selection glow (one item, moved between chips)
+    glow = canvas.create_oval(0, 0, 0, 0, fill="", outline="#ffd700", width=3,
+                              state="hidden", tags=("tray", "glow"))
+
+    def select(value: float) -> None:
+        for i, chip_value in enumerate(CHIP_VALUES):
+            if abs(chip_value - value) < 0.01:
+                cx = state["left"] + i * spacing
+                canvas.coords(glow, cx - glow_r, cy - glow_r, cx + glow_r, cy + glow_r)
+                canvas.itemconfigure(glow, state="normal")
+                return
+        canvas.itemconfigure(glow, state="hidden")
+
+    def _on_configure(event):
+        if event.width < 10:
+            return
+        left = _left_for(event.width)
+        if left != state["left"]:
+            canvas.move("tray", left - state["left"], 0)
+            state["left"] = left
+
+    def _on_click(event):
+        hit = canvas.find_closest(event.x, event.y)
+        for tag in canvas.gettags(hit[0]) if hit else ():
+            if tag.startswith("chip"):
+                i = int(tag[4:])
+                cx = state["left"] + i * spacing
+                if math.hypot(event.x - cx, event.y - cy) <= glow_r:
+                    selected_chip.set(CHIP_VALUES[i])
+                return
+
+    canvas.bind("<Configure>", _on_configure)
+    canvas.bind("<ButtonRelease-1>", _on_click)
+    selected_chip.trace_add("write", lambda *_: select(selected_chip.get()))
+    select(selected_chip.get())
+
+    return {
+        "canvas": canvas,
+        "select": select,
+    }
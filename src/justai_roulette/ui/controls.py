@@ -7,8 +7,19 @@ from typing import Callable
 from ..constants import Colors
 
 
-def build_quick_bet_panel(parent: Frame, on_bet: Callable[[str], None], bg_color: str = Colors.FELT) -> Frame:
-    """Build the quick bet button panel."""
+def _bind_hover(widget, bet_name: str, on_hover: Callable[[str | None], None] | None) -> None:
+    if on_hover is not None:
+        widget.bind("<Enter>", lambda e: on_hover(bet_name), add="+")
+        widget.bind("<Leave>", lambda e: on_hover(None), add="+")
+
+
+def build_quick_bet_panel(parent: Frame, on_bet: Callable[[str], None], bg_color: str = Colors.FELT,
+                          on_hover: Callable[[str | None], None] | None = None) -> Frame:
+    """Build the quick bet button panel.
+
+    ``on_hover`` is called with a bet name when the pointer enters its button
+    and with None when it leaves.
+    """
     frame = Frame(parent, bg=bg_color)
 
     # Row 1: Color and even-money bets
@@ -30,6 +41,7 @@ def build_quick_bet_panel(parent: Frame, on_bet: Callable[[str], None], bg_color
     for text, bet_name, style in bets_row1:
         btn = ttk.Button(row1, text=text, command=lambda b=bet_name: on_bet(b), width=7, style=style)
         btn.pack(side=LEFT, padx=2)
+        _bind_hover(btn, bet_name, on_hover)
 
     # Row 2: Columns and call bets
     row2 = Frame(frame, bg=bg_color)
@@ -48,6 +60,7 @@ def build_quick_bet_panel(parent: Frame, on_bet: Callable[[str], None], bg_color
     for text, bet_name, style in bets_row2:
         btn = ttk.Button(row2, text=text, command=lambda b=bet_name: on_bet(b), width=8, style=style)
         btn.pack(side=LEFT, padx=2)
+        _bind_hover(btn, bet_name, on_hover)
 
     return frame
 
@@ -0,0 +1,113 @@
+"""Recent-results strip over the full spin history."""
+
+from tkinter import Canvas
+
+from ..constants import Colors, RED_NUMBERS
+
+
+def _chip_fill(num: int) -> str:
+    return "#0ecf6e" if num == 0 else ("#c0392b" if num in RED_NUMBERS else "#1c1c1c")
+
+
+def build_history_strip(parent, history) -> dict:
+    """
+    Create the history strip, newest result on the left.
+
+    The strip is a fixed pool of chip slots (shadow, body, text), enough to
+    span the screen, created once.  Slots form a ring: a new spin slides the
+    whole strip one place with a single ``move`` on the ``hist`` tag and
+    recycles the slot that fell off the end as the newest chip.  The mouse
+    wheel scrolls back through the full ``history`` the same way, so the
+    item count never grows with the history.
+
+    Returns a dict with:
+        - canvas: The Canvas widget
+        - refresh: Sync the strip with ``history`` (call after a spin or reset)
+    """
+    canvas = Canvas(parent, bg=Colors.FELT, highlightthickness=0, height=56)
+    canvas.pack(fill="x", pady=(0, 4))
+
+    chip_r, spacing, start_x, cy = 22, 52, 8, 28
+    size = canvas.winfo_screenwidth() // spacing + 2
+    slots: list[tuple[int, int, int]] = []
+    for k in range(size):
+        cx = start_x + k * spacing + chip_r
+        tags = ("hist", f"slot{k}")
+        slots.append((
+            canvas.create_oval(cx - chip_r + 2, cy - chip_r + 2, cx + chip_r + 2, cy + chip_r + 2,
+                               fill="#1a1a1a", outline="", state="hidden", tags=tags),
+            canvas.create_oval(cx - chip_r, cy - chip_r, cx + chip_r, cy + chip_r,
+                               outline="#ffd700", width=2, state="hidden", tags=tags),
+            canvas.create_text(cx, cy, font=("Segoe UI", 12, "bold"), fill="#fff",
+                               state="hidden", tags=tags),
+        ))
+    # head: slot shown first; offset: newest entries scrolled past; shown: history length drawn
+    state = {"head": 0, "offset": 0, "shown": 0}
+
+    def _paint(k: int, index: int) -> None:
+        """Show history entry ``index`` (oldest = 0) in slot ``k``, or hide it."""
+        shadow, body, text = slots[k]
+        if 0 <= index < len(history):
+            num = history[index]
+            canvas.itemconfigure(shadow, state="normal")
+            canvas.itemconfigure(body, fill=_chip_fill(num), state="normal")
+            canvas.itemconfigure(text, text=str(num), state="normal")
+        else:
+            for item in slots[k]:
+                canvas.itemconfigure(item, state="hidden")
+
+    def _index_at(position: int) -> int:
+        return len(history) - 1 - state["offset"] - position
+
+    def _repaint() -> None:
+        for position in range(size):
+            _paint((state["head"] + position) % size, _index_at(position))
+
+    def _shift(step: int) -> None:
+        """Slide one place: +1 brings a newer entry in on the left, -1 an older one on the right."""
+        canvas.move("hist", step * spacing, 0)
+        if step > 0:
+            state["head"] = (state["head"] - 1) % size
+            k, position = state["head"], 0
+        else:
+            k, position = state["head"], size - 1
+            state["head"] = (state["head"] + 1) % size
+        canvas.move(f"slot{k}", -step * size * spacing, 0)
+        _paint(k, _index_at(position))
+
+    def refresh() -> None:
+        grown = len(history) - state["shown"]
+        state["shown"] = len(history)
+        if grown == 1 and state["offset"] == 0:
+            _shift(1)
+        elif grown > 0 and state["offset"] > 0:
+            state["offset"] += grown  # keep the scrolled view where it is
+        elif grown:
+            state["offset"] = 0
+            _repaint()
+
+    def scroll(steps: int) -> None:
+        """Scroll ``steps`` entries towards older (positive) or newer results."""
+        limit = max(0, len(history) - 1)
+        target = min(limit, max(0, state["offset"] + steps))
+        delta, state["offset"] = target - state["offset"], target
+        if abs(delta) == 1:
+            _shift(-delta)
+        elif delta:
+            _repaint()
+
+    def _on_wheel(event):
+        if event.num == 4 or event.delta > 0:
+            scroll(-1)
+        elif event.num == 5 or event.delta < 0:
+            scroll(1)
+
+    for sequence in ("<MouseWheel>", "<Shift-MouseWheel>", "<Button-4>", "<Button-5>"):
+        canvas.bind(sequence, _on_wheel)
+    canvas.bind("<Double-Button-1>", lambda e: scroll(-state["offset"]))
+
+    return {
+        "canvas": canvas,
+        "refresh": refresh,
+        "scroll": scroll,
+    }
@@ -0,0 +1,37 @@
+"""Pre-created coverage highlights shown and hidden by tag."""
+
+from typing import Callable, Iterable
+
+
+def coverage_overlay(canvas, items: dict[int, int]) -> Callable[[Iterable[int] | None], None]:
+    """
+    Return ``show(numbers)`` for highlight ``items`` (one hidden item per number).
+
+    Each distinct set of numbers gets a canvas tag added to its items the
+    first time it is shown; after that, changing the highlight is one
+    ``itemconfigure`` to hide the old tag and one to show the new.  No items
+    are ever created or deleted.  ``show(None)`` hides the highlight.
+    """
+    groups: dict[tuple[int, ...], str] = {}
+    state = {"shown": None}
+
+    def _tag(key: tuple[int, ...]) -> str:
+        tag = groups.get(key)
+        if tag is None:
+            tag = groups[key] = f"cover{len(groups)}"
+            for n in key:
+                if n in items:
+                    canvas.addtag_withtag(tag, items[n])
+        return tag
+
+    def show(numbers: Iterable[int] | None = None) -> None:
+        tag = _tag(tuple(sorted(set(numbers)))) if numbers else None
+        if tag == state["shown"]:
+            return
+        if state["shown"] is not None:
+            canvas.itemconfigure(state["shown"], state="hidden")
+        if tag is not None:
+            canvas.itemconfigure(tag, state="normal")
+        state["shown"] = tag
+
+    return show
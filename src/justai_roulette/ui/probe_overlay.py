@@ -0,0 +1,65 @@
+"""Debug overlay of probe percentiles, drawn over a canvas."""
+
+from .. import probes
+
+REFRESH_MS = 500
+_SHOWN = ("frame.spin", "frame.drop", "frame.bounce", "after.lateness",
+          "click_to_marker", "settle", "session.save")
+
+
+def _format() -> str:
+    snap = probes.snapshot()
+    lines = [f"{'probe':<16}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+    for name in _SHOWN:
+        s = snap["histograms"].get(name)
+        if s is None:
+            continue
+        lines.append(f"{name:<16}{s['p50'] * 1e3:7.1f}{s['p95'] * 1e3:7.1f}"
+                     f"{s['p99'] * 1e3:7.1f}  n={s['count']}")
+    counters = snap["counters"]
+    lines.append(f"dropped frames  {counters.get('frames.dropped', 0)}"
+                 f" / {counters.get('frames.drawn', 0)} drawn")
+    return "\n".join(lines)
+
+
+def build_probe_overlay(canvas) -> dict:
+    """
+    Create a hidden probe read-out in the top-left corner of ``canvas``.
+
+    The two items (a backing rectangle and a text block) are created once,
+    in screen coordinates, and only re-texted every ``REFRESH_MS`` while
+    visible.  Showing the overlay turns probes on.
+
+    Returns a dict with:
+        - toggle: Show or hide the overlay
+        - visible: Whether the overlay is shown
+    """
+    state = {"shown": False, "after": None}
+    bg = canvas.create_rectangle(0, 0, 0, 0, fill="#000000", outline="#ffd700",
+                                 stipple="gray75", state="hidden")
+    text = canvas.create_text(10, 10, anchor="nw", fill="#e8ffe8",
+                              font=("Courier", 9), state="hidden")
+
+    def _refresh() -> None:
+        canvas.itemconfigure(text, text=_format())
+        x0, y0, x1, y1 = canvas.bbox(text)
+        canvas.coords(bg, x0 - 4, y0 - 4, x1 + 4, y1 + 4)
+        canvas.tag_raise(bg)
+        canvas.tag_raise(text)
+        state["after"] = canvas.after(REFRESH_MS, _refresh)
+
+    def toggle() -> None:
+        state["shown"] = not state["shown"]
+        if state["shown"]:
+            probes.enable()
+            canvas.itemconfigure(bg, state="normal")
+            canvas.itemconfigure(text, state="normal")
+            _refresh()
+        else:
+            if state["after"] is not None:
+                canvas.after_cancel(state["after"])
+                state["after"] = None
+            canvas.itemconfigure(bg, state="hidden")
+            canvas.itemconfigure(text, state="hidden")
+
+    return {"toggle": toggle, "visible": lambda: state["shown"]}
@@ -0,0 +1,128 @@
+"""Racetrack: the pockets in wheel order, for placing neighbour bets."""
+
+from tkinter import Canvas
+from typing import Callable
+
+from ..constants import Colors
+from ..game.bets import POCKETS, get_number_color
+from ..game.wheel import MAX_NEIGHBOURS, NEIGHBOURS, WHEEL_NUMBERS
+from .scaling import logical_scaler
+
+_FILLS = {"green": Colors.GREEN, "red": Colors.RED, "black": Colors.BLACK}
+_ROW = (POCKETS - 1) // 2  # pockets along each straight
+
+
+def _cell_boxes(cell_w: float, cell_h: float, pad: float) -> list[tuple[float, float, float, float]]:
+    """Logical box for each wheel position.
+
+    Zero sits in the left cap; positions 1-18 run left to right along the
+    top and 19-36 come back right to left along the bottom, so wheel
+    neighbours are always adjacent cells.
+    """
+    boxes = [(pad, pad, pad + cell_w, pad + 2 * cell_h)]
+    x0 = pad + cell_w
+    for i in range(_ROW):
+        boxes.append((x0 + i * cell_w, pad, x0 + (i + 1) * cell_w, pad + cell_h))
+    for i in range(_ROW):
+        x = x0 + (_ROW - 1 - i) * cell_w
+        boxes.append((x, pad + cell_h, x + cell_w, pad + 2 * cell_h))
+    return boxes
+
+
+def build_racetrack(parent, on_select: Callable[[int, int], None],
+                    on_hover: Callable | None = None, neighbours: int = 2) -> dict:
+    """
+    Create the racetrack below the wheel.
+
+    Clicking a pocket calls ``on_select(number, k)`` with the current
+    neighbour count; the cap on the right shows that count and cycles it
+    1..MAX_NEIGHBOURS when clicked (the mouse wheel steps it too).  While
+    the pointer is over a pocket its neighbour bet is outlined here and
+    ``on_hover(number, k)`` is called, or ``on_hover(None, k)`` on leaving;
+    neither callback fires while the racetrack is being built.
+
+    Returns a dict with:
+        - canvas: The Canvas widget
+        - neighbours: Current neighbour count
+        - set_neighbours: Set the neighbour count (clamped to 1..MAX_NEIGHBOURS)
+    """
+    cell_w, cell_h, pad = 26, 30, 4
+    width = pad * 2 + cell_w * (_ROW + 2)
+    height = pad * 2 + cell_h * 2
+
+    canvas = Canvas(parent, width=width, height=height, bg=Colors.FELT, highlightthickness=0)
+    canvas.pack(side="bottom", fill="x", pady=(8, 0))
+    scaler = logical_scaler(canvas, width, height, max_factor=2.0)
+
+    state = {"k": max(1, min(MAX_NEIGHBOURS, neighbours)), "hover": None}
+    cells: dict[int, int] = {}  # number -> cell rectangle
+    for position, (x0, y0, x1, y1) in enumerate(_cell_boxes(cell_w, cell_h, pad)):
+        num = WHEEL_NUMBERS[position]
+        tags = ("pocket", f"n{num}")
+        cells[num] = canvas.create_rectangle(x0, y0, x1, y1, fill=_FILLS[get_number_color(num)],
+                                             outline="white", tags=tags)
+        canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=str(num), fill="white",
+                           font=("Segoe UI", 10, "bold"), tags=tags)
+
+    cap_x0 = pad + cell_w * (_ROW + 1)
+    canvas.create_rectangle(cap_x0, pad, cap_x0 + cell_w, pad + 2 * cell_h, fill=Colors.BUTTON_BG,
+                            outline=Colors.ACCENT_DIM, tags="count")
+    count_text = canvas.create_text(cap_x0 + cell_w / 2, pad + cell_h, fill=Colors.ACCENT,
+                                    font=("Segoe UI", 11, "bold"), tags="count")
+    scaler["track_all"]()
+
+    def _outline(numbers, colour: str, width: int) -> None:
+        for n in numbers:
+            canvas.itemconfigure(cells[n], outline=colour, width=width)
+            canvas.tag_raise(f"n{n}")  # keep the thick outline above the next cell
+
+    def _show(number: int | None) -> None:
+        if state["hover"] is not None:
+            _outline(NEIGHBOURS[state["k"]][state["hover"]], "white", 1)
+        state["hover"] = number
+        if number is not None:
+            _outline(NEIGHBOURS[state["k"]][number], Colors.ACCENT, 3)
+        if on_hover:
+            on_hover(number, state["k"])
+
+    def set_neighbours(k: int) -> None:
+        hover = state["hover"]
+        if hover is not None:
+            _show(None)  # clear the outline drawn for the old count
+        state["k"] = max(1, min(MAX_NEIGHBOURS, k))
+        canvas.itemconfigure(count_text, text=f"±{state['k']}")
+        if hover is not None:
+            _show(hover)
+
+    def _pocket_at(event) -> int | None:
+        for item in canvas.find_overlapping(event.x, event.y, event.x, event.y):
+            for tag in canvas.gettags(item):
+                if tag.startswith("n") and tag[1:].isdigit():
+                    return int(tag[1:])
+        return None
+
+    def _on_motion(event) -> None:
+        number = _pocket_at(event)
+        if number != state["hover"]:
+            _show(number)
+
+    def _on_click(event) -> None:
+        number = _pocket_at(event)
+        if number is not None:
+            on_select(number, state["k"])
+
+    def _on_wheel(event) -> None:
+        if event.num == 4 or event.delta > 0:
+            set_neighbours(state["k"] + 1)
+        elif event.num == 5 or event.delta < 0:
+            set_neighbours(state["k"] - 1)
+
+    canvas.tag_bind("pocket", "<Motion>", _on_motion)
+    canvas.tag_bind("pocket", "<Leave>", lambda _e: _show(None))
+    canvas.tag_bind("pocket", "<Button-1>", _on_click)
+    canvas.tag_bind("count", "<Button-1>", lambda _e: set_neighbours(state["k"] % MAX_NEIGHBOURS + 1))
+    for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        canvas.bind(sequence, _on_wheel)
+    set_neighbours(state["k"])
+
+    return {"canvas": canvas, "neighbours": lambda: state["k"], "set_neighbours": set_neighbours}
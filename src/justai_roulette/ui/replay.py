@@ -0,0 +1,117 @@
+"""Round-by-round replay window for the round log."""
+
+from tkinter import BOTH, LEFT, RIGHT, Frame, IntVar, Label, Scale, StringVar, Toplevel
+from tkinter import ttk
+from typing import Callable
+
+from ..constants import Colors
+from ..game.roundlog import LoggedRound, ReplayMismatch, format_round
+
+
+def build_replay_window(root, rounds: list[LoggedRound], mismatches: list[ReplayMismatch] | None,
+                        on_show: Callable[[LoggedRound], None], on_close: Callable[[], None],
+                        currency: str = "$") -> dict:
+    """
+    Open a modal window that steps through ``rounds``.
+
+    ``rounds`` may be just the most recent part of the log.  Each step
+    shows the round's record and whether the rules agree with it
+    (``mismatches`` from ``replay_rounds``; None while that is still
+    running, until ``set_mismatches`` is called), and calls ``on_show`` so
+    the main window can lay the slip and outcome out on the table and wheel.
+    Left/Right step, Home/End jump; ``on_close`` runs when the window goes.
+
+    Returns a dict with:
+        - window: The Toplevel
+        - show: Jump to a round by index (0 = oldest)
+        - set_mismatches: Deliver the ``replay_rounds`` mismatches
+    """
+    win = Toplevel(root)
+    win.title("Replay")
+    win.configure(bg=Colors.CARD_BG)
+    win.transient(root)
+    win.grab_set()
+    win.geometry(f"420x440+{root.winfo_x() + 100}+{root.winfo_y() + 50}")
+
+    frame = Frame(win, bg=Colors.CARD_BG)
+    frame.pack(fill=BOTH, expand=True, padx=16, pady=16)
+
+    title_var = StringVar()
+    detail_var = StringVar()
+    check_var = StringVar()
+    index_var = IntVar(value=len(rounds) - 1)
+    state = {"shown": None, "open": True, "by_seq": None}  # by_seq: None until checked
+
+    Label(frame, textvariable=title_var, font=("Segoe UI", 14, "bold"),
+          fg=Colors.ACCENT, bg=Colors.CARD_BG).pack(anchor="w")
+    check_label = Label(frame, textvariable=check_var, font=("Segoe UI", 10, "bold"),
+                        bg=Colors.CARD_BG, justify="left")
+    check_label.pack(anchor="w", pady=(2, 8))
+    Label(frame, textvariable=detail_var, font=("Consolas", 10), fg=Colors.TEXT_LIGHT,
+          bg=Colors.CARD_BG, justify="left", anchor="nw").pack(fill=BOTH, expand=True)
+
+    def _show_check(rnd: LoggedRound) -> None:
+        by_seq = state["by_seq"]
+        if by_seq is None:
+            check_var.set("Checking the log against the rules...")
+            check_label.configure(fg=Colors.TEXT_MUTED)
+            return
+        problems = by_seq.get(rnd.seq)
+        if problems:
+            check_var.set("\n".join(
+                f"MISMATCH {m.field}: recorded {currency}{m.recorded:,.2f}, "
+                f"rules give {currency}{m.replayed:,.2f}" for m in problems))
+            check_label.configure(fg=Colors.LED_GLOW)
+        else:
+            check_var.set("Settlement matches the rules")
+            check_label.configure(fg="#3fe68b")
+
+    def show(index: int) -> None:
+        index = max(0, min(len(rounds) - 1, index))
+        if index == state["shown"]:
+            return
+        state["shown"] = index
+        if index_var.get() != index:
+            index_var.set(index)
+        rnd = rounds[index]
+        title_var.set(f"Round {rnd.seq:,} ({index + 1:,} of the last {len(rounds):,})")
+        detail_var.set("\n".join(format_round(rnd, currency)))
+        _show_check(rnd)
+        on_show(rnd)
+
+    def set_mismatches(found: list[ReplayMismatch]) -> None:
+        by_seq = state["by_seq"] = {}
+        for m in found:
+            by_seq.setdefault(m.seq, []).append(m)
+        if state["open"] and state["shown"] is not None:
+            _show_check(rounds[state["shown"]])
+
+    def step(delta: int) -> None:
+        show(index_var.get() + delta)
+
+    Scale(frame, from_=0, to=max(0, len(rounds) - 1), orient="horizontal", variable=index_var,
+          showvalue=False, bg=Colors.CARD_BG, troughcolor=Colors.BUTTON_BG, highlightthickness=0,
+          command=lambda value: show(int(float(value)))).pack(fill="x", pady=(8, 4))
+
+    buttons = Frame(frame, bg=Colors.CARD_BG)
+    buttons.pack(fill="x")
+    for text, command in (("|<", lambda: show(0)), ("<", lambda: step(-1)),
+                          (">", lambda: step(1)), (">|", lambda: show(len(rounds) - 1))):
+        ttk.Button(buttons, text=text, command=command, width=4).pack(side=LEFT, padx=2)
+
+    def _close():
+        state["open"] = False
+        win.destroy()
+        on_close()
+
+    ttk.Button(buttons, text="Close", command=_close, style="Accent.TButton", width=10).pack(side=RIGHT)
+    win.protocol("WM_DELETE_WINDOW", _close)
+    win.bind("<Left>", lambda e: step(-1))
+    win.bind("<Right>", lambda e: step(1))
+    win.bind("<Home>", lambda e: show(0))
+    win.bind("<End>", lambda e: show(len(rounds) - 1))
+
+    if mismatches is not None:
+        set_mismatches(mismatches)
+    show(len(rounds) - 1)
+    return {"window": win, "show": show, "set_mismatches": set_mismatches}
@@ -0,0 +1,110 @@
+"""Resize handling for canvases drawn in fixed logical coordinates.
+
+Every tracked item keeps its logical coordinates (and font, for text);
+on resize the screen geometry is recomputed from those as
+``offset + logical * factor``, so repeated resizes never compound rounding
+error.  ``<Configure>`` bursts during a window drag are coalesced into one
+update on idle, and fonts come from a cache keyed by whole point sizes.
+"""
+
+from tkinter import font as tkfont
+
+
+def logical_scaler(canvas, width: float, height: float, max_factor: float) -> dict:
+    """
+    Fit a ``width`` x ``height`` logical drawing into ``canvas``, centred.
+
+    Returns a dict with:
+        - track_all: Record every current item's coords as logical (call once, before any resize)
+        - place: Set an item's logical coords (and optionally font) and track it
+        - forget: Stop tracking an item (call before deleting it)
+        - point: Convert a logical point (and optional radius) to screen coords
+        - state: {"factor", "offset"} of the last applied layout
+    """
+    state = {"factor": 1.0, "offset": (0.0, 0.0), "size": None, "pending": None}
+    coords: dict[int, tuple[float, ...]] = {}
+    fonts: dict[int, tuple[str, int, str]] = {}
+    applied: dict[int, int] = {}  # item -> font size currently set
+    font_cache: dict[tuple[str, int, str], tkfont.Font] = {}
+
+    def _font(family: str, size: int, style: str) -> tkfont.Font:
+        key = (family, size, style)
+        f = font_cache.get(key)
+        if f is None:
+            weight = "bold" if "bold" in style else "normal"
+            slant = "italic" if "italic" in style else "roman"
+            f = font_cache[key] = tkfont.Font(root=canvas, family=family, size=size,
+                                               weight=weight, slant=slant)
+        return f
+
+    def _apply_font(item: int) -> None:
+        family, size, style = fonts[item]
+        scaled = max(1, round(size * state["factor"]))
+        if applied.get(item) != scaled:
+            applied[item] = scaled
+            canvas.itemconfigure(item, font=_font(family, scaled, style))
+
+    def _screen(values: tuple[float, ...]) -> list[float]:
+        sf = state["factor"]
+        ox, oy = state["offset"]
+        return [(ox if i % 2 == 0 else oy) + v * sf for i, v in enumerate(values)]
+
+    def _track_font(item: int, spec) -> None:
+        parts = canvas.tk.splitlist(spec) if isinstance(spec, str) else spec
+        if len(parts) >= 2:
+            fonts[item] = (str(parts[0]), int(parts[1]), " ".join(str(p) for p in parts[2:]))
+            applied.pop(item, None)
+
+    def track_all() -> None:
+        for item in canvas.find_all():
+            coords[item] = tuple(canvas.coords(item))
+            if canvas.type(item) == "text":
+                _track_font(item, canvas.itemcget(item, "font"))
+
+    def place(item: int, *logical: float, font=None) -> None:
+        coords[item] = logical
+        canvas.coords(item, *_screen(logical))
+        if font is not None:
+            _track_font(item, font)
+            _apply_font(item)
+
+    def forget(item: int) -> None:
+        coords.pop(item, None)
+        fonts.pop(item, None)
+        applied.pop(item, None)
+
+    def point(x: float, y: float, radius: float | None = None):
+        sf = state["factor"]
+        ox, oy = state["offset"]
+        sx, sy = ox + x * sf, oy + y * sf
+        return (sx, sy) if radius is None else (sx, sy, radius * sf)
+
+    def _relayout() -> None:
+        state["pending"] = None
+        new_w, new_h = state["size"]
+        factor = min(new_w / width, new_h / height, max_factor)
+        offset = ((new_w - width * factor) / 2, (new_h - height * factor) / 2)
+        if factor == state["factor"] and offset == state["offset"]:
+            return
+        state["factor"], state["offset"] = factor, offset
+        for item, values in coords.items():
+            canvas.coords(item, *_screen(values))
+        for item in fonts:
+            _apply_font(item)
+
+    def _on_configure(event) -> None:
+        if event.width < 10 or event.height < 10:
+            return
+        state["size"] = (event.width, event.height)
+        if state["pending"] is None:
+            state["pending"] = canvas.after_idle(_relayout)
+
+    canvas.bind("<Configure>", _on_configure, add="+")
+
+    return {
+        "track_all": track_all,
+        "place": place,
+        "forget": forget,
+        "point": point,
+        "state": state,
+    }
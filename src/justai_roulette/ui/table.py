@@ -1,15 +1,28 @@
 """Roulette betting table component."""
 
+from array import array
 from tkinter import Canvas, BOTH
-from typing import Callable
+from typing import Callable, NamedTuple
 
-from ..constants import Colors, RED_NUMBERS, TABLE_ROWS, COLUMNS
+from ..constants import Colors, RED_NUMBERS, TABLE_ROWS
+from ..game.catalogue import BY_LABEL, BetDef, find_bet
+from .overlay import coverage_overlay
+from .scaling import logical_scaler
 
-_DOZENS = {
-    "1st 12 (1-12)": list(range(1, 13)),
-    "2nd 12 (13-24)": list(range(13, 25)),
-    "3rd 12 (25-36)": list(range(25, 37)),
-}
+_DOZENS = {"1st 12 (1-12)": "1st 12", "2nd 12 (13-24)": "2nd 12", "3rd 12 (25-36)": "3rd 12"}
+
+_OUTSIDE_LABELS = ["1-18", "Even", "Red", "Black", "Odd", "19-36"]
+
+_GRID = 2  # logical pixels per hit-map cell; every table edge is a multiple of this
+
+
+class TableBet(NamedTuple):
+    """A bet region on the table; (x, y) is the logical anchor for its marker."""
+    id: int
+    label: str
+    numbers: tuple[int, ...]
+    x: float
+    y: float
 
 
 def _number_color(n: int) -> tuple[str, str]:
@@ -18,8 +31,17 @@ def _number_color(n: int) -> tuple[str, str]:
     return (Colors.RED if n in RED_NUMBERS else Colors.BLACK), "white"
 
 
-def build_table(parent, on_select: Callable) -> tuple:
-    """Create a roulette table grid on a Canvas with clickable bets."""
+def build_table(parent, on_select: Callable, on_hover: Callable | None = None) -> tuple:
+    """Create a roulette table grid on a Canvas with clickable bets.
+
+    Every catalogue bet gets a region, rasterised once into a hit-map, so
+    resolving a pointer position is one array lookup.  A click calls
+    ``on_select(bet_id, x, y, mark)``; ``on_hover`` (if given) is called with
+    the ``TableBet`` under the pointer, or None, whenever that changes.  The
+    returned ``bet_anchors`` maps each bet id to its logical marker position,
+    and ``show_coverage(numbers)`` outlines numbers on the table.  Items the
+    caller adds must go through the returned ``scaler`` to follow resizes.
+    """
     cell_w, cell_h = 60, 44
     zero_w = 78
     edge_tol = 8
@@ -35,9 +57,11 @@ def build_table(parent, on_select: Callable) -> tuple:
     canvas = Canvas(parent, width=width, height=height, bg=Colors.FELT, highlightthickness=0)
     canvas.pack(padx=12, pady=(4, 16), fill=BOTH, expand=True)
 
-    scale_state = {"factor": 1.0, "offset": (0.0, 0.0)}
+    scaler = logical_scaler(canvas, width, height, max_factor=2.3)
+    scale_state = scaler["state"]
     markers: dict[tuple[int, ...], dict] = {}
     number_centers: dict[int, tuple[float, float]] = {}
+    highlights: dict[int, int] = {}
     outside_bet_centers: dict[str, tuple[float, float]] = {}
 
     def _cell_bbox(r, c):
@@ -80,7 +104,7 @@ def build_table(parent, on_select: Callable) -> tuple:
         dozen_y0 = padding_y + len(rows) * cell_h
         dozen_y1 = dozen_y0 + extra_h
         box_w = (width_numbers - zero_w) / 3
-        for i, (label, name) in enumerate(zip(_DOZENS.keys(), ["1st 12", "2nd 12", "3rd 12"])):
+        for i, (label, name) in enumerate(_DOZENS.items()):
             x0, x1 = padding_x + zero_w + i * box_w, padding_x + zero_w + (i + 1) * box_w
             canvas.create_rectangle(x0, dozen_y0, x1, dozen_y1, fill="#0f7a3a", outline="white")
             canvas.create_text((x0 + x1) / 2, (dozen_y0 + dozen_y1) / 2, text=label, fill="white", font=("Segoe UI", 15, "bold"))
@@ -89,124 +113,109 @@ def build_table(parent, on_select: Callable) -> tuple:
         # Outside bets
         outside_y0, outside_y1 = dozen_y1, dozen_y1 + extra_h
         box_w_out = (width_numbers - zero_w) / 6
-        for i, label in enumerate(["1-18", "Even", "Red", "Black", "Odd", "19-36"]):
+        for i, label in enumerate(_OUTSIDE_LABELS):
             x0, x1 = padding_x + zero_w + i * box_w_out, padding_x + zero_w + (i + 1) * box_w_out
             bg = Colors.RED if label == "Red" else Colors.BLACK if label == "Black" else "#0b6b33"
             canvas.create_rectangle(x0, outside_y0, x1, outside_y1, fill=bg, outline="white")
             canvas.create_text((x0 + x1) / 2, (outside_y0 + outside_y1) / 2, text=label, fill="white", font=("Segoe UI", 15, "bold"))
             outside_bet_centers[label] = ((x0 + x1) / 2, (outside_y0 + outside_y1) / 2)
 
-    def _scale_point(x, y, radius=None):
-        """Convert logical coords to screen coords."""
-        sf = scale_state["factor"] or 1.0
-        ox, oy = scale_state["offset"]
-        sx, sy = ox + x * sf, oy + y * sf
-        return (sx, sy) if radius is None else (sx, sy, max(6.0, radius * sf))
-
-    def _apply_scale(new_w, new_h):
-        """Scale canvas using canvas.scale() - no redraw needed."""
-        if new_w < 10 or new_h < 10:
-            return
-        new_factor = min(new_w / width, new_h / height, 2.3)
-        if new_factor <= 0:
-            return
-        draw_w, draw_h = width * new_factor, height * new_factor
-        ox, oy = (new_w - draw_w) / 2, (new_h - draw_h) / 2
-        prev_factor = scale_state["factor"] or 1.0
-        delta = new_factor / prev_factor
-        if abs(delta - 1) < 0.02 and abs(ox - scale_state["offset"][0]) < 2 and abs(oy - scale_state["offset"][1]) < 2:
-            return
-        # Scale ALL items in place - no redraw
-        canvas.scale("all", 0, 0, delta, delta)
-        canvas.move("all", ox - scale_state["offset"][0], oy - scale_state["offset"][1])
-        scale_state["factor"] = new_factor
-        scale_state["offset"] = (ox, oy)
-
-    def _get_outside_numbers(label):
-        if label == "1-18": return list(range(1, 19))
-        if label == "19-36": return list(range(19, 37))
-        if label == "Even": return [n for n in range(1, 37) if n % 2 == 0]
-        if label == "Odd": return [n for n in range(1, 37) if n % 2 == 1]
-        if label == "Red": return [n for n in range(1, 37) if n in RED_NUMBERS]
-        if label == "Black": return [n for n in range(1, 37) if n not in RED_NUMBERS]
-        return []
-
-    def _detect_bet(raw_x, raw_y):
-        """Detect what bet was clicked."""
-        sf = scale_state["factor"] or 1.0
-        ox, oy = scale_state["offset"]
-        x, y = (raw_x - ox) / sf, (raw_y - oy) / sf
-
+        # Coverage highlights, one per number (hidden until a bet is hovered)
+        for num, bbox in [(0, _zero_bbox())] + [(n, _cell_bbox(r, c)) for r, row_data in enumerate(rows)
+                                                 for c, n in enumerate(row_data)]:
+            x0, y0, x1, y1 = bbox
+            highlights[num] = canvas.create_rectangle(x0 + 3, y0 + 3, x1 - 3, y1 - 3, fill="",
+                                                      outline=Colors.ACCENT, width=3, state="hidden")
+
+    # --- Hit-map: logical grid of indexes into hit_bets (0 = no bet) ---
+
+    grid_w, grid_h = -(-width // _GRID), -(-height // _GRID)
+    hit_map = array("H", bytes(2 * grid_w * grid_h))
+    hit_bets: list[TableBet | None] = [None]
+    bet_index: dict[int, int] = {}
+    bet_anchors: dict[int, tuple[float, float]] = {}
+
+    def _paint(x0, y0, x1, y1, bet: BetDef, ax, ay):
+        """Map the logical rectangle to a bet; later paints win where regions overlap."""
+        idx = bet_index.get(bet.id)
+        if idx is None:
+            idx = bet_index[bet.id] = len(hit_bets)
+            hit_bets.append(TableBet(bet.id, bet.label, bet.numbers, ax, ay))
+            bet_anchors[bet.id] = (ax, ay)
+        c0, c1 = int(x0) // _GRID, -(-int(x1) // _GRID)
+        run = array("H", [idx]) * (c1 - c0)
+        for row in range(int(y0) // _GRID, -(-int(y1) // _GRID)):
+            hit_map[row * grid_w + c0:row * grid_w + c1] = run
+
+    def _build_hit_map():
         zx0, zy0, zx1, zy1 = _zero_bbox()
-        dozen_y0, dozen_y1 = zy1, zy1 + extra_h
-        outside_y0, outside_y1 = dozen_y1, dozen_y1 + extra_h
-        col_x0, col_x1 = padding_x + width_numbers, padding_x + width_numbers + col_box_w
+        _paint(zx0, zy0, zx1, zy1, find_bet([0]), (zx0 + zx1) / 2, (zy0 + zy1) / 2)
 
-        # Zero
-        if zx0 <= x <= zx1 and zy0 <= y <= zy1:
-            return "Straight 0", [0], 35, (zx0 + zx1) / 2, (zy0 + zy1) / 2
-
-        # Columns
-        if col_x0 <= x <= col_x1 and zy0 <= y <= zy1:
-            idx = int((y - zy0) // cell_h)
-            if 0 <= idx < 3:
-                col_map = {0: ("Column 3", COLUMNS[2]), 1: ("Column 2", COLUMNS[1]), 2: ("Column 1", COLUMNS[0])}
-                label, nums = col_map[idx]
-                return label, nums, 2, (col_x0 + col_x1) / 2, zy0 + idx * cell_h + cell_h / 2
-
-        # Dozens
-        if dozen_y0 <= y <= dozen_y1:
-            x_off = x - (padding_x + zero_w)
-            if 0 <= x_off <= width_numbers - zero_w:
-                segment_w = (width_numbers - zero_w) / 3
-                idx = int(x_off // segment_w)
-                if 0 <= idx < 3:
-                    labels = list(_DOZENS.keys())
-                    return labels[idx], _DOZENS[labels[idx]], 2, x, (dozen_y0 + dozen_y1) / 2
+        col_x0, col_x1 = padding_x + width_numbers, padding_x + width_numbers + col_box_w
+        for i, name in enumerate(["Col 3", "Col 2", "Col 1"]):
+            y0 = zy0 + i * cell_h
+            _paint(col_x0, y0, col_x1, y0 + cell_h, BY_LABEL[name], (col_x0 + col_x1) / 2, y0 + cell_h / 2)
 
-        # Outside bets
-        if outside_y0 <= y <= outside_y1:
-            x_off = x - (padding_x + zero_w)
-            if 0 <= x_off <= width_numbers - zero_w:
-                labels = ["1-18", "Even", "Red", "Black", "Odd", "19-36"]
-                segment_w = (width_numbers - zero_w) / 6
-                idx = int(x_off // segment_w)
-                if 0 <= idx < 6:
-                    return labels[idx], _get_outside_numbers(labels[idx]), 1, x, (outside_y0 + outside_y1) / 2
-
-        # Outside table
-        if x < zx1 or x > col_x1 or y < zy0 or y > outside_y1:
-            return None
-
-        # Number grid
-        col = int((x - zx1) // cell_w)
-        row = int((y - zy0) // cell_h)
-        if not (0 <= row < len(rows) and 0 <= col < len(rows[0])):
-            return None
-
-        num = rows[row][col]
-        x0, y0, x1, y1 = _cell_bbox(row, col)
-        lx, ly = x - x0, y - y0
-
-        def nb(ro, co):
-            nr, nc = row + ro, col + co
-            return rows[nr][nc] if 0 <= nr < len(rows) and 0 <= nc < len(rows[0]) else None
-
-        nl, nr, nt, nb_ = lx <= edge_tol, lx >= cell_w - edge_tol, ly <= edge_tol, ly >= cell_h - edge_tol
-
-        # Corners
-        if nl and nt and (n := nb(-1, -1)): return "Corner", [num, nb(-1, 0), nb(0, -1), n], 8, x0, y0
-        if nr and nt and (n := nb(-1, 1)): return "Corner", [num, nb(-1, 0), nb(0, 1), n], 8, x1, y0
-        if nl and nb_ and (n := nb(1, -1)): return "Corner", [num, nb(0, -1), nb(1, 0), n], 8, x0, y1
-        if nr and nb_ and (n := nb(1, 1)): return "Corner", [num, nb(1, 0), nb(0, 1), n], 8, x1, y1
-
-        # Splits
-        if nl and (n := nb(0, -1)): return f"Split {num}/{n}", [num, n], 17, x0, (y0 + y1) / 2
-        if nr and (n := nb(0, 1)): return f"Split {num}/{n}", [num, n], 17, x1, (y0 + y1) / 2
-        if nt and (n := nb(-1, 0)): return f"Split {num}/{n}", [num, n], 17, (x0 + x1) / 2, y0
-        if nb_ and (n := nb(1, 0)): return f"Split {num}/{n}", [num, n], 17, (x0 + x1) / 2, y1
-
-        return f"Straight {num}", [num], 35, (x0 + x1) / 2, (y0 + y1) / 2
+        dozen_y0 = zy1
+        box_w = (width_numbers - zero_w) / 3
+        for i, name in enumerate(_DOZENS.values()):
+            x0 = zx1 + i * box_w
+            _paint(x0, dozen_y0, x0 + box_w, dozen_y0 + extra_h, BY_LABEL[name],
+                   x0 + box_w / 2, dozen_y0 + extra_h / 2)
+
+        outside_y0 = dozen_y0 + extra_h
+        box_w = (width_numbers - zero_w) / 6
+        for i, name in enumerate(_OUTSIDE_LABELS):
+            x0 = zx1 + i * box_w
+            _paint(x0, outside_y0, x0 + box_w, outside_y0 + extra_h, BY_LABEL[name],
+                   x0 + box_w / 2, outside_y0 + extra_h / 2)
+
+        def nb(r, c):
+            return rows[r][c] if 0 <= r < len(rows) and 0 <= c < len(rows[0]) else None
+
+        def zone(x, y, numbers, w=edge_tol, h=edge_tol):
+            """Paint the bet on ``numbers`` in a box around the logical point (x, y)."""
+            _paint(x - w, y - h, x + w, y + h, find_bet(numbers), x, y)
+
+        # Number grid, lowest priority first: straights, splits, then the
+        # chips placed on lines and line crossings (edge_tol either side)
+        for r, row_data in enumerate(rows):
+            for c, num in enumerate(row_data):
+                x0, y0, x1, y1 = _cell_bbox(r, c)
+                _paint(x0, y0, x1, y1, find_bet([num]), (x0 + x1) / 2, (y0 + y1) / 2)
+        for r, row_data in enumerate(rows):
+            for c, num in enumerate(row_data):
+                x0, y0, x1, y1 = _cell_bbox(r, c)
+                if (n := nb(r, c - 1)) is not None:
+                    zone(x0, (y0 + y1) / 2, [num, n], h=cell_h / 2)
+                if (n := nb(r - 1, c)) is not None:
+                    zone((x0 + x1) / 2, y0, [num, n], w=cell_w / 2)
+            # 0/n splits along the zero's edge, short of the trio crossings
+            zone(zx1, zy0 + (r + 0.5) * cell_h, [0, row_data[0]], h=cell_h / 2 - edge_tol)
+        # Streets and six lines sit on the bottom edge of the grid
+        for c in range(len(rows[0])):
+            x0, _, x1, _ = _cell_bbox(len(rows) - 1, c)
+            street = [rows[r][c] for r in range(len(rows))]
+            zone((x0 + x1) / 2, zy1, street, w=cell_w / 2 - edge_tol)
+            if c:
+                zone(x0, zy1, street + [rows[r][c - 1] for r in range(len(rows))])
+        for r in range(1, len(rows)):
+            for c in range(1, len(rows[0])):
+                x0, y0, _, _ = _cell_bbox(r, c)
+                zone(x0, y0, [rows[r][c], rows[r - 1][c], rows[r][c - 1], rows[r - 1][c - 1]])
+        # Trios where the zero meets a line between rows; first four at its foot
+        for r in range(1, len(rows)):
+            zone(zx1, zy0 + r * cell_h, [0, rows[r][0], rows[r - 1][0]])
+        zone(zx1, zy1, [0] + [rows[r][0] for r in range(len(rows))])
+
+    def _detect_bet(raw_x, raw_y) -> TableBet | None:
+        """The bet under a screen position (one hit-map lookup)."""
+        sf = scale_state["factor"] or 1.0
+        ox, oy = scale_state["offset"]
+        gx, gy = int((raw_x - ox) / sf) // _GRID, int((raw_y - oy) / sf) // _GRID
+        if 0 <= gx < grid_w and 0 <= gy < grid_h and raw_x >= ox and raw_y >= oy:
+            return hit_bets[hit_map[gy * grid_w + gx]]
+        return None
 
     def _update_marker(key, amount, x, y):
         """Update marker in place using itemconfigure - NO redraw."""
@@ -214,28 +223,49 @@ def build_table(parent, on_select: Callable) -> tuple:
             # Just update the text - don't delete/recreate
             canvas.itemconfigure(markers[key]["text_id"], text=str(int(amount) if amount == int(amount) else amount))
         else:
-            # Create new marker
+            # Create new marker, positioned from logical coords by the scaler
             r = 10.0
-            sx, sy, sr = _scale_point(x, y, r)
-            oval_id = canvas.create_oval(sx - sr, sy - sr, sx + sr, sy + sr, fill="#f1c40f", outline="#c27c0e", width=2)
-            text_id = canvas.create_text(sx, sy, text=str(int(amount) if amount == int(amount) else amount), font=("Segoe UI", 9, "bold"), fill="black")
+            oval_id = canvas.create_oval(0, 0, 0, 0, fill="#f1c40f", outline="#c27c0e", width=2)
+            text_id = canvas.create_text(0, 0, text=str(int(amount) if amount == int(amount) else amount), fill="black")
+            scaler["place"](oval_id, x - r, y - r, x + r, y + r)
+            scaler["place"](text_id, x, y, font=("Segoe UI", 9, "bold"))
             markers[key] = {"oval_id": oval_id, "text_id": text_id, "x": x, "y": y}
 
+    def _remove_marker(key):
+        data = markers.pop(key, None)
+        if data:
+            for item in (data["oval_id"], data["text_id"]):
+                scaler["forget"](item)
+                canvas.delete(item)
+
     def _clear_markers():
         for data in markers.values():
-            canvas.delete(data.get("oval_id"))
-            canvas.delete(data.get("text_id"))
+            for item in (data["oval_id"], data["text_id"]):
+                scaler["forget"](item)
+                canvas.delete(item)
         markers.clear()
 
     def _on_click(event):
         bet = _detect_bet(event.x, event.y)
         if bet:
-            label, nums, payout, cx, cy = bet
-            on_select(label, nums, payout, tuple(sorted(nums)), cx, cy, _update_marker)
+            on_select(bet.id, bet.x, bet.y, _update_marker)
+
+    hover = {"bet": None}
+
+    def _set_hover(bet):
+        if bet is not hover["bet"]:
+            hover["bet"] = bet
+            on_hover(bet)
 
     # Draw table once, bind click, set up scaling
     _draw_cells()
+    _build_hit_map()
+    show_coverage = coverage_overlay(canvas, highlights)
     canvas.bind("<ButtonPress-1>", _on_click)
-    canvas.bind("<Configure>", lambda e: _apply_scale(e.width, e.height))
+    if on_hover is not None:
+        canvas.bind("<Motion>", lambda e: _set_hover(_detect_bet(e.x, e.y)))
+        canvas.bind("<Leave>", lambda e: _set_hover(None))
+    scaler["track_all"]()
 
-    return (_clear_markers, _update_marker, number_centers, outside_bet_centers, canvas, _scale_point)
+    return (_clear_markers, _update_marker, number_centers, outside_bet_centers, canvas, scaler,
+            _remove_marker, show_coverage, bet_anchors)
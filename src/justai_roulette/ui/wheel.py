@@ -4,6 +4,8 @@ import math
 from tkinter import Canvas
 
 from ..constants import Colors, RED_NUMBERS, WHEEL_SEQUENCE
+from .overlay import coverage_overlay
+from .scaling import logical_scaler
 
 
 def _number_color(n: int) -> tuple[str, str]:
@@ -23,6 +25,7 @@ def build_wheel(parent) -> dict:
         - move_ball: Function to move ball to angle
         - show_result: Function to display winning number
         - reset: Function to reset ball position
+        - show_coverage: Function to make the given pockets glow (None clears)
         - number_to_angle: Dict mapping numbers to angles
         - cx, cy: Center coordinates
     """
@@ -37,7 +40,6 @@ def build_wheel(parent) -> dict:
 
     canvas = Canvas(parent, width=size, height=size, bg=Colors.FELT, highlightthickness=0)
     canvas.pack(fill="both", expand=True)
-    scale_state = {"factor": 1.0, "offset": (0.0, 0.0)}
 
     # Outer chrome bezel
     canvas.create_oval(
@@ -63,6 +65,7 @@ def build_wheel(parent) -> dict:
     # Draw wheel segments
     angle_rad_step = 2 * math.pi / len(WHEEL_SEQUENCE)
     number_to_angle: dict[int, float] = {}
+    wedges: dict[int, list[float]] = {}
     base_angle = -math.pi / 2  # 12 o'clock
 
     for idx, num in enumerate(WHEEL_SEQUENCE):
@@ -80,6 +83,7 @@ def build_wheel(parent) -> dict:
             cx + inner_r * math.cos(start_rad), cy + inner_r * math.sin(start_rad),
         ]
         canvas.create_polygon(points, fill=bg, outline=Colors.BORDER, width=1)
+        wedges[num] = points
 
         tx = cx + text_r * math.cos(mid_rad)
         ty = cy + text_r * math.sin(mid_rad)
@@ -98,6 +102,13 @@ def build_wheel(parent) -> dict:
         fill="", outline=Colors.ACCENT_DIM, width=1,
     )
 
+    # Coverage glow per pocket (hidden until a bet is hovered)
+    glows = {
+        num: canvas.create_polygon(points, fill="", outline=Colors.ACCENT, width=3, state="hidden")
+        for num, points in wedges.items()
+    }
+    show_coverage = coverage_overlay(canvas, glows)
+
     # Gold pointer
     pointer_base_y = cy - outer_r - 26
     canvas.create_polygon(
@@ -132,41 +143,16 @@ def build_wheel(parent) -> dict:
     )
     center_text = canvas.create_text(cx, cy, text="--", fill=Colors.ACCENT, font=("Courier", 26, "bold"))
 
-    def _apply_scale(new_w: int, new_h: int) -> None:
-        if new_w < 10 or new_h < 10:
-            return
-        new_factor = min(new_w / size, new_h / size, 2.0)
-        if new_factor <= 0:
-            return
-        draw_w = size * new_factor
-        draw_h = size * new_factor
-        ox = (new_w - draw_w) / 2
-        oy = (new_h - draw_h) / 2
-        prev_factor = scale_state["factor"] or 1.0
-        delta = new_factor / prev_factor
-        if abs(delta - 1) < 0.02 and abs(ox - scale_state["offset"][0]) < 2 and abs(oy - scale_state["offset"][1]) < 2:
-            return
-        canvas.scale("all", 0, 0, delta, delta)
-        canvas.move("all", ox - scale_state["offset"][0], oy - scale_state["offset"][1])
-        scale_state["factor"] = new_factor
-        scale_state["offset"] = (ox, oy)
-
-    canvas.bind("<Configure>", lambda e: _apply_scale(e.width, e.height))
+    scaler = logical_scaler(canvas, size, size, max_factor=2.0)
+    scaler["track_all"]()
+    place = scaler["place"]
 
     def move_ball(angle: float, radius: float | None = None, on_track: bool = False):
         r = radius if radius is not None else (ball_track_r if on_track else ball_ring_r)
-        sf = scale_state["factor"]
-        ox, oy = scale_state["offset"]
         bx = cx + r * math.cos(angle)
         by = cy + r * math.sin(angle)
-        sr = ball_r * sf
-        canvas.coords(ball, ox + bx * sf - sr, oy + by * sf - sr, ox + bx * sf + sr, oy + by * sf + sr)
-        highlight_offset = 3 * sf
-        canvas.coords(
-            ball_highlight,
-            ox + bx * sf - sr + highlight_offset, oy + by * sf - sr + highlight_offset,
-            ox + bx * sf - sr + highlight_offset + 4 * sf, oy + by * sf - sr + highlight_offset + 4 * sf,
-        )
+        place(ball, bx - ball_r, by - ball_r, bx + ball_r, by + ball_r)
+        place(ball_highlight, bx - ball_r + 3, by - ball_r + 3, bx - ball_r + 7, by - ball_r + 7)
 
     def show_result(num: int, color: str):
         if color == "green":
@@ -175,17 +161,20 @@ def build_wheel(parent) -> dict:
             display_color = "#ff3333"
         else:
             display_color = Colors.ACCENT
-        canvas.itemconfigure(center_text, text=str(num), fill=display_color, font=("Courier", 32, "bold"))
+        canvas.itemconfigure(center_text, text=str(num), fill=display_color)
+        place(center_text, cx, cy, font=("Courier", 32, "bold"))
 
     def reset_ball():
         move_ball(-math.pi / 2, on_track=True)
-        canvas.itemconfigure(center_text, text="--", fill=Colors.ACCENT, font=("Courier", 26, "bold"))
+        canvas.itemconfigure(center_text, text="--", fill=Colors.ACCENT)
+        place(center_text, cx, cy, font=("Courier", 26, "bold"))
 
     return {
         "canvas": canvas,
         "move_ball": move_ball,
         "show_result": show_result,
         "reset": reset_ball,
+        "show_coverage": show_coverage,
         "number_to_angle": number_to_angle,
         "outer_radius": ball_ring_r,
         "ball_track_radius": ball_track_r,
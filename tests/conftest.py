@@ -0,0 +1,85 @@
+"""Shared fixtures: a stand-in Tk canvas so UI builders run without a display."""
+
+import pytest
+
+
+class FakeCanvas:
+    """Just enough of ``tkinter.Canvas`` for the table, racetrack and scaler."""
+
+    def __init__(self, parent=None, **options):
+        self.items: dict[int, dict] = {}
+        self.bindings: dict = {}
+        self._next = 0
+
+    def pack(self, **options):
+        pass
+
+    def _create(self, kind, coords, options):
+        self._next += 1
+        tags = options.pop("tags", ())
+        self.items[self._next] = {"type": kind, "coords": list(coords),
+                                  "tags": (tags,) if isinstance(tags, str) else tuple(tags), **options}
+        return self._next
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def delete(self, item):
+        self.items.pop(item, None)
+
+    def itemconfigure(self, item, **options):
+        for it in self._resolve(item):
+            self.items[it].update(options)
+
+    def itemcget(self, item, option):
+        return self.items[item].get(option, "")
+
+    def coords(self, item, *coords):
+        if coords:
+            self.items[item]["coords"] = list(coords)
+        return self.items[item]["coords"]
+
+    def type(self, item):
+        return self.items[item]["type"]
+
+    def gettags(self, item):
+        return self.items[item]["tags"]
+
+    def addtag_withtag(self, tag, item):
+        self.items[item]["tags"] += (tag,)
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def find_overlapping(self, x0, y0, x1, y1):
+        return tuple(item for item, it in self.items.items() if it["type"] == "rectangle"
+                     and it["coords"][0] <= x0 <= it["coords"][2]
+                     and it["coords"][1] <= y0 <= it["coords"][3])
+
+    def tag_raise(self, tag):
+        pass
+
+    def tag_bind(self, tag, sequence, func):
+        self.bindings[tag, sequence] = func
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def _resolve(self, item):
+        if isinstance(item, int):
+            return (item,)
+        return tuple(i for i, it in self.items.items() if item in it["tags"])
+
+
+@pytest.fixture
+def fake_canvas(monkeypatch):
+    """Patch ``Canvas`` in the given UI module with ``FakeCanvas``."""
+    def patch(module):
+        monkeypatch.setattr(module, "Canvas", FakeCanvas)
+    return patch
@@ -0,0 +1,47 @@
+"""The numbered bet catalogue."""
+
+from collections import Counter
+
+from justai_roulette.game.bets import CALL_BETS, QUICK_BETS, number_mask
+from justai_roulette.game.catalogue import (
+    BY_LABEL, BY_NUMBERS, CALL_BET_IDS, CATALOGUE, OUTSIDE, PAYOUTS, STRAIGHT, find_bet,
+)
+
+
+def test_every_legal_bet_once():
+    kinds = Counter(b.kind for b in CATALOGUE)
+    assert kinds == {"straight": 37, "split": 60, "street": 12, "trio": 2, "corner": 22,
+                     "basket": 1, "six line": 11, OUTSIDE: len(QUICK_BETS)}
+    assert len(BY_NUMBERS) == len(CATALOGUE)
+    assert len(BY_LABEL) == len(CATALOGUE)
+
+
+def test_ids_are_positions_and_straights_are_numbers():
+    for i, bet in enumerate(CATALOGUE):
+        assert bet.id == i
+    for n in range(37):
+        assert CATALOGUE[n].kind == STRAIGHT and CATALOGUE[n].numbers == (n,)
+
+
+def test_numbers_payout_and_mask_agree():
+    for bet in CATALOGUE:
+        assert list(bet.numbers) == sorted(bet.numbers)
+        assert bet.mask == number_mask(bet.numbers)
+        if bet.kind != OUTSIDE:
+            assert bet.payout == PAYOUTS[bet.kind]
+            if bet.kind != "basket":  # First Four pays 6:1, not the 8:1 the formula gives
+                assert bet.payout == 36 // len(bet.numbers) - 1
+
+
+def test_find_bet_ignores_order():
+    assert find_bet([5, 4, 2, 1]).label == "Corner 1/2/4/5"
+    assert find_bet([0, 3, 2]).label == "Trio 0/2/3"
+    assert find_bet([1, 3]) is None
+
+
+def test_call_bets_resolve_to_catalogue_ids():
+    assert set(CALL_BET_IDS) == set(CALL_BETS)
+    for name, components in CALL_BETS.items():
+        resolved = [(CATALOGUE[bet_id].numbers, CATALOGUE[bet_id].payout, chips)
+                    for bet_id, chips in CALL_BET_IDS[name]]
+        assert resolved == [(tuple(sorted(n)), p, c) for n, p, c in components]
@@ -0,0 +1,164 @@
+"""RouletteEngine: placing, undoing and settling bets without a UI."""
+
+import pytest
+
+from justai_roulette.game.catalogue import BY_LABEL, CALL_BET_IDS
+from justai_roulette.game.engine import BetError, RouletteEngine
+from justai_roulette.game.rng import SeededRng
+from justai_roulette.game.slip import build_slip
+from justai_roulette.game.wheel import NEIGHBOURS
+
+RED = BY_LABEL["Red"].id
+
+
+def _engine(balance=100.0, seed=1, **kwargs):
+    return RouletteEngine(balance=balance, rng=SeededRng(seed), stat_windows=(10,), **kwargs)
+
+
+def test_place_stack_and_undo():
+    engine = _engine()
+    engine.place_bet(17, 1.0)
+    engine.place_bet(17, 2.0)
+    engine.place_quick_bet("Red", 5.0)
+    assert engine.total_bet == 8.0
+    assert [b.id for b in engine.undo_last()] == [RED]
+    assert engine.undo_last()[0].amount == 1.0
+    assert engine.total_bet == 1.0
+
+
+def test_balance_and_limit_errors():
+    engine = _engine(balance=10.0, max_single_bet=5.0)
+    with pytest.raises(BetError, match="Max bet"):
+        engine.place_bet(17, 6.0)
+    with pytest.raises(BetError, match="Unknown bet id"):
+        engine.place_bet(999, 1.0)
+    with pytest.raises(BetError, match="Unknown bet"):
+        engine.place_quick_bet("Purple", 1.0)
+    engine.place_bet(17, 5.0)
+    engine.place_bet(18, 5.0)
+    with pytest.raises(BetError, match="Insufficient"):
+        engine.place_bet(19, 1.0)
+    with pytest.raises(BetError, match="Insufficient"):
+        engine.double_bets()
+
+
+@pytest.mark.parametrize("amount", [0.0, -5.0, float("nan"), float("inf")])
+def test_amount_must_be_positive_and_finite(amount):
+    engine = _engine()
+    for place in (lambda: engine.place_bet(17, amount),
+                  lambda: engine.place_quick_bet("Red", amount),
+                  lambda: engine.place_call_bet("Tiers", amount),
+                  lambda: engine.place_neighbour_bet(0, 1, amount)):
+        with pytest.raises(BetError, match="positive"):
+            place()
+    assert engine.total_bet == 0.0
+
+
+def test_max_bet_counts_stacked_chips():
+    engine = _engine(balance=1000.0, max_single_bet=5.0)
+    engine.place_quick_bet("Red", 5.0)
+    with pytest.raises(BetError, match="Max bet"):
+        engine.place_quick_bet("Red", 1.0)
+    with pytest.raises(BetError, match="Max bet"):
+        engine.place_call_bet("Voisins", 3.0)  # two chips on the trio
+    engine.place_neighbour_bet(0, 1, 5.0)
+    with pytest.raises(BetError, match="Max bet"):
+        engine.place_bet(0, 1.0)
+    assert engine.total_bet == 20.0
+
+
+def test_call_bet_is_one_undo_step():
+    engine = _engine()
+    bets = engine.place_call_bet("Voisins", 1.0)
+    assert sorted((b.id, b.amount) for b in bets) == sorted(
+        (bet_id, float(chips)) for bet_id, chips in CALL_BET_IDS["Voisins"])
+    assert engine.total_bet == 9.0
+    engine.undo_last()
+    assert engine.total_bet == 0.0
+    with pytest.raises(BetError, match="Need 9 chips"):
+        _engine(balance=8.0).place_call_bet("Voisins", 1.0)
+
+
+def test_neighbour_bet():
+    engine = _engine()
+    bets = engine.place_neighbour_bet(0, 2, 1.0)
+    assert [b.id for b in bets] == list(NEIGHBOURS[2][0])
+    assert engine.total_bet == 5.0
+    with pytest.raises(BetError):
+        engine.place_neighbour_bet(37, 1, 1.0)
+    with pytest.raises(BetError, match="0-4"):
+        engine.place_neighbour_bet(0, 9, 1.0)
+    with pytest.raises(BetError, match="Need 9 chips"):
+        engine.place_neighbour_bet(0, 4, 20.0)
+
+
+def test_spin_settles_slip_and_locks_betting():
+    engine = _engine()
+    engine.place_bet(17, 2.0)
+    engine.place_quick_bet("Black", 3.0)
+    engine.begin_spin(17)
+    assert engine.spinning and engine.stake == 5.0 and engine.total_bet == 0.0
+    with pytest.raises(BetError):
+        engine.place_bet(1, 1.0)
+    result = engine.finish_spin()
+    assert result.number == 17 and result.color == "black"
+    assert result.total_win == 2.0 * 36 + 3.0 * 2
+    assert result.max_payout == 35 and result.is_big_win
+    assert engine.balance == 100.0 - 5.0 + result.total_win
+    assert engine.last_number == 17 and engine.history.last() == 17
+    assert engine.session_stats == {"spins": 1, "bet_total": 5.0, "win_total": 78.0}
+    assert engine.hot_counts == {17: 1}
+
+
+def test_rebet_and_double():
+    engine = _engine()
+    assert engine.rebet() == [] and engine.double_bets() is False
+    engine.place_bet(17, 2.0)
+    engine.spin(0)
+    assert engine.balance == 98.0
+    assert [(b.id, b.amount) for b in engine.rebet()] == [(17, 2.0)]
+    assert engine.double_bets() is True
+    assert engine.total_bet == 4.0
+    engine.undo_last()
+    assert engine.total_bet == 2.0
+
+
+def test_reset_keeps_history():
+    engine = _engine()
+    engine.place_bet(17, 1.0)
+    for n in (1, 2, 3):
+        engine.spin(n)
+    engine.place_bet(4, 1.0)
+    engine.reset(50.0)
+    assert engine.balance == 50.0 and engine.total_bet == 0.0
+    assert engine.session_stats["spins"] == 0 and engine.hot_counts == {}
+    assert list(engine.history) == [1, 2, 3]
+
+
+def test_autoplay_matches_spin_by_spin():
+    slip = build_slip(["Red", "17+0", "Voisins"], 1.0)
+    fast, slow = _engine(seed=7), _engine(seed=7)
+    result = fast.autoplay(slip, 200)
+
+    for _ in range(result.spins):
+        slow.slip.restore(slip)
+        slow.spin()
+    assert list(fast.history) == list(slow.history)
+    assert fast.balance == pytest.approx(slow.balance)
+    assert fast.session_stats == pytest.approx(slow.session_stats)
+    assert fast.hot_counts == slow.hot_counts
+    assert fast.stats.windows[10].pockets == slow.stats.windows[10].pockets
+    assert result.bet_total == pytest.approx(11.0 * result.spins)
+
+
+def test_autoplay_stops_when_stake_exceeds_balance():
+    engine = _engine(balance=3.0)
+    result = engine.autoplay(build_slip(["0+0"], 1.0), 1000)
+    if result.stopped == "balance":
+        assert engine.balance < 1.0
+    else:
+        assert result.spins == 1000
+    assert engine.balance >= 0.0
+    assert engine.autoplay(build_slip(["Red"], 1.0), -1).spins == 0
+    with pytest.raises(BetError, match="Max bet"):
+        _engine(max_single_bet=1.0).autoplay(build_slip(["Red:2"], 1.0), 1)
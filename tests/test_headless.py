@@ -0,0 +1,22 @@
+"""Headless batch mode and its command-line checks."""
+
+import pytest
+
+from justai_roulette.__main__ import main
+from justai_roulette.headless import run_headless
+
+
+@pytest.mark.parametrize("argv", [["--spins", "-1"], ["--chip", "-5"], ["--chip", "0"], ["--chip", "nan"]])
+def test_bad_arguments_are_rejected(argv, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--headless", *argv])
+    assert exc.value.code == 2
+    assert "must" in capsys.readouterr().err
+
+
+def test_seeded_run_is_reproducible():
+    first = run_headless(500, ["Red", "Voisins"], 1.0, 100.0, seed=3)
+    second = run_headless(500, ["Red", "Voisins"], 1.0, 100.0, seed=3)
+    assert first["final_balance"] == second["final_balance"]
+    assert first["stake"] == 10.0 and first["wagered"] == 10.0 * first["spins"]
+    assert first["net"] == pytest.approx(first["returned"] - first["wagered"])
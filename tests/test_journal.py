@@ -0,0 +1,89 @@
+"""Session journal: events, compaction and replay on load."""
+
+import json
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from justai_roulette import session as session_mod
+from justai_roulette.journal import SessionJournal
+from justai_roulette.session import SessionData, load_session
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    snapshot, journal = tmp_path / "session.json", tmp_path / "journal.jsonl"
+    monkeypatch.setattr(session_mod, "SESSION_FILE", snapshot)
+    monkeypatch.setattr(session_mod, "JOURNAL_FILE", journal)
+    return snapshot, journal
+
+
+def _journal(files, **kwargs):
+    snapshot, journal = files
+    return SessionJournal(journal, snapshot, fsync_interval=0.0, **kwargs)
+
+
+def test_events_replay_on_load(files):
+    j = _journal(files)
+    j.record_spin(17, 5.0, 0.0, 995.0)
+    j.record_spin(0, 5.0, 180.0, 1170.0)
+    j.append("balance", bal=2000.0)
+    j.append("settings", currency="€")
+    assert j.flush(5)
+    j.close()
+
+    loaded = load_session()
+    assert loaded.balance == 2000.0 and loaded.currency == "€"
+    assert loaded.history == [(0, "green"), (17, "black")]
+    assert loaded.hot_counts == {17: 1, 0: 1}
+    assert loaded.session_stats == {"spins": 2, "bet_total": 10.0, "win_total": 180.0}
+    assert loaded.journal_seq == 4
+
+
+def test_compaction_writes_snapshot_and_truncates(files):
+    snapshot, journal = files
+    j = _journal(files, max_bytes=1)
+    j.record_spin(3, 1.0, 0.0, 99.0)
+    assert j.flush(5)
+    assert j.should_compact
+    state = load_session()
+    j.compact(state)
+    assert not j.should_compact
+    j.record_spin(4, 1.0, 0.0, 98.0)
+    j.close()
+
+    assert json.loads(snapshot.read_text())["journal_seq"] == 1
+    assert [json.loads(line)["s"] for line in journal.read_text().splitlines()] == [2]
+    loaded = load_session()
+    assert loaded.balance == 98.0 and [n for n, _ in loaded.history] == [4, 3]
+
+
+def test_compact_enters_context_on_writer_thread(files):
+    seen = []
+
+    @contextmanager
+    def context():
+        seen.append(("enter", threading.current_thread().name))
+        yield
+        seen.append(("exit", files[0].exists()))
+
+    j = _journal(files)
+    j.compact(SessionData(balance=7.0), context())
+    assert j.flush(5)
+    j.close()
+    assert seen == [("enter", "session-journal"), ("exit", True)]
+
+
+def test_replay_skips_folded_and_torn_events(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"s":1,"e":"balance","bal":1}\n'
+                    '{"s":2,"e":"balance","bal":2}\n'
+                    '{"s":3,"e":"reset","bal":50}\n'
+                    '{"s":4,"e":"spin","n":7}\n'
+                    '{"s":5,"e":"bal')
+    state = SessionData(balance=9.0, currency="£", journal_seq=1)
+    state.hot_counts[7] = 3
+    session_mod._replay_journal(state, path)
+    assert state.balance == 50.0 and state.currency == "£"
+    assert state.hot_counts == {} and state.journal_seq == 4  # the malformed spin still advances seq
@@ -0,0 +1,73 @@
+"""Racetrack widget, driven through a stand-in canvas (no display needed)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from justai_roulette.game.wheel import NEIGHBOURS
+from justai_roulette.ui import racetrack
+
+
+def _event(x=0, y=0, num=0, delta=0):
+    return SimpleNamespace(x=x, y=y, num=num, delta=delta)
+
+
+def _centre(canvas, number):
+    for item in canvas.items.values():
+        if item["type"] == "rectangle" and f"n{number}" in item["tags"]:
+            x0, y0, x1, y1 = item["coords"]
+            return (x0 + x1) / 2, (y0 + y1) / 2
+    raise LookupError(number)
+
+
+def _outlined(canvas):
+    return sorted(int(tag[1:]) for item in canvas.items.values() if item.get("width") == 3
+                  for tag in item["tags"] if tag[1:].isdigit())
+
+
+@pytest.fixture
+def track(fake_canvas):
+    fake_canvas(racetrack)
+    selected, hovered = [], []
+    widget = racetrack.build_racetrack(None, lambda n, k: selected.append((n, k)),
+                                       on_hover=lambda n, k: hovered.append((n, k)))
+    return widget, selected, hovered
+
+
+def test_build_does_not_call_back(track):
+    widget, selected, hovered = track
+    assert selected == [] and hovered == []
+    assert widget["neighbours"]() == 2
+
+
+def test_wheel_neighbours_are_adjacent_cells(track):
+    canvas = track[0]["canvas"]
+    for left, n, right in NEIGHBOURS[1]:
+        x, y = _centre(canvas, n)
+        for other in (left, right):
+            ox, oy = _centre(canvas, other)
+            assert abs(ox - x) <= 26 and abs(oy - y) <= 30
+
+
+def test_click_selects_with_current_count(track):
+    widget, selected, _ = track
+    canvas = widget["canvas"]
+    x, y = _centre(canvas, 17)
+    canvas.bindings["pocket", "<Button-1>"](_event(x, y))
+    widget["set_neighbours"](9)
+    canvas.bindings["pocket", "<Button-1>"](_event(x, y))
+    assert selected == [(17, 2), (17, 4)]
+
+
+def test_hover_outlines_and_follows_count(track):
+    widget, _, hovered = track
+    canvas = widget["canvas"]
+    canvas.bindings["pocket", "<Motion>"](_event(*_centre(canvas, 0)))
+    assert hovered[-1] == (0, 2)
+    assert _outlined(canvas) == sorted(NEIGHBOURS[2][0])
+    canvas.bindings["<Button-5>"](_event(num=5))
+    assert hovered[-1] == (0, 1)
+    assert _outlined(canvas) == sorted(NEIGHBOURS[1][0])
+    canvas.bindings["pocket", "<Leave>"](_event())
+    assert hovered[-1] == (None, 1)
+    assert _outlined(canvas) == []
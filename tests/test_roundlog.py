@@ -0,0 +1,114 @@
+"""Round log: binary encoding, torn tails and replay."""
+
+import pytest
+
+from justai_roulette.game import roundlog
+from justai_roulette.game.engine import RouletteEngine
+from justai_roulette.game.rng import SeededRng
+from justai_roulette.game.roundlog import RoundLog, read_recent_rounds, read_rounds, replay_rounds
+from justai_roulette.game.slip import build_slip
+
+
+def _play(path, rounds=20):
+    log = RoundLog(path)
+    engine = RouletteEngine(balance=500.0, rng=SeededRng(9), stat_windows=(), round_log=log)
+    slip = build_slip(["Red", "Voisins"], 1.0)
+    for i in range(rounds):
+        engine.slip.restore(slip if i % 5 else build_slip(["17+1"], 2.0))
+        engine.spin()
+    engine.autoplay(slip, rounds)
+    log.close()
+    return engine
+
+
+def test_round_trip_and_clean_replay(tmp_path):
+    path = tmp_path / "rounds.bin"
+    engine = _play(path)
+    rounds = list(read_rounds(path))
+    assert [r.seq for r in rounds] == list(range(1, 41))
+    assert [r.number for r in rounds] == list(engine.history)
+    assert rounds[-1].balance_after == pytest.approx(engine.balance)
+    assert rounds[1].bets is rounds[2].bets  # a re-bet slip is stored once and shared
+    assert {b.label for b in rounds[0].bets} == {"Straight 17", "Straight 25", "Straight 34"}
+
+    report = replay_rounds(rounds)
+    assert report.ok and report.rounds == 40 and report.adjustments == 0
+    assert report.final_balance == pytest.approx(engine.balance)
+
+
+def test_autoplay_logs_a_slip_edited_between_runs(tmp_path):
+    path = tmp_path / "rounds.bin"
+    log = RoundLog(path)
+    engine = RouletteEngine(balance=500.0, rng=SeededRng(4), stat_windows=(), round_log=log)
+    slip = build_slip(["Red"], 1.0)
+    engine.autoplay(slip, 5)
+    slip.add(17, 2.0)
+    engine.autoplay(slip, 5)
+    log.close()
+    rounds = list(read_rounds(path))
+    assert [r.stake for r in rounds] == [1.0] * 5 + [3.0] * 5
+    assert replay_rounds(rounds).ok
+    assert engine.last_slip is not slip
+
+
+def test_recent_rounds_match_the_tail(tmp_path):
+    path = tmp_path / "rounds.bin"
+    _play(path)
+    rounds = list(read_rounds(path))
+    for count in (0, 1, 7, 40, 100):
+        assert read_recent_rounds(path, count) == rounds[max(0, len(rounds) - count):]
+    recent = read_recent_rounds(path, 7)
+    assert recent[-1].bets is recent[-2].bets
+
+
+def test_reopen_appends_and_drops_torn_tail(tmp_path):
+    path = tmp_path / "rounds.bin"
+    _play(path, 5)
+    size = path.stat().st_size
+    with open(path, "ab") as fh:
+        fh.write(b"\x40\x00\x00\x00\x01\x02")  # a round record cut off mid-write
+    assert len(list(read_rounds(path))) == 10
+
+    log = RoundLog(path)
+    assert log.seq == 10 and path.stat().st_size == size
+    log.append(0, build_slip(["Red"], 1.0), 10.0, 9.0, 0.0, 1.0)
+    log.close()
+    rounds = list(read_rounds(path))
+    assert rounds[-1].seq == 11 and rounds[-1].bets[0].label == "Red"
+
+
+def test_foreign_file_is_refused_untouched(tmp_path):
+    path = tmp_path / "rounds.bin"
+    path.write_bytes(b"JRROUND1" + bytes(100))
+    with pytest.raises(ValueError, match="refusing to overwrite"):
+        RoundLog(path)
+    assert path.read_bytes() == b"JRROUND1" + bytes(100)
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"JRRO")
+    RoundLog(empty).close()
+    assert empty.read_bytes() == b"JRROUND2"
+
+
+def test_replay_reports_tampering(tmp_path):
+    path = tmp_path / "rounds.bin"
+    _play(path, 5)
+    rounds = list(read_rounds(path))
+    rounds[2] = rounds[2]._replace(returned=rounds[2].returned + 35.0,
+                                   balance_after=rounds[2].balance_after + 35.0)
+    report = replay_rounds(rounds)
+    assert [(m.seq, m.field) for m in report.mismatches] == [(3, "returned"), (3, "balance_after")]
+    assert report.adjustments == 1  # round 4 starts from the honest balance
+
+
+def test_unknown_bet_id_is_reported(tmp_path, monkeypatch):
+    path = tmp_path / "rounds.bin"
+    monkeypatch.setattr(roundlog, "encode_slip",
+                        lambda slip: roundlog._BET.pack(1.0, 999) + roundlog._BET.pack(1.0, 17))
+    log = RoundLog(path)
+    log.append(17, build_slip(["Red", "17+0"], 1.0), 10.0, 44.0, 36.0, 1.0)
+    log.close()
+    rnd, = read_rounds(path)
+    assert rnd.bets[0].bet_id == -1 and rnd.bets[1].label == "Straight 17"
+    report = replay_rounds([rnd])
+    assert [(m.field, m.recorded) for m in report.mismatches] == [("bet", 1.0), ("balance_after", 44.0)]
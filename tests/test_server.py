@@ -0,0 +1,159 @@
+"""Game server protocol, driven through a stand-in stream writer."""
+
+import asyncio
+import json
+
+import pytest
+
+from justai_roulette.game.catalogue import BY_LABEL
+from justai_roulette.game.engine import BetError
+from justai_roulette.game.rng import make_rng
+from justai_roulette.server import Connection, GameServer, Table, encode
+
+
+class _Transport:
+    def get_write_buffer_size(self):
+        return 0
+
+
+class _Writer:
+    transport = _Transport()
+
+    def __init__(self):
+        self.sent = []
+
+    def write(self, data):
+        self.sent += [json.loads(line) for line in data.splitlines()]
+
+    def is_closing(self):
+        return False
+
+
+def _client(table):
+    writer = _Writer()
+    return Connection(GameServer([table]), None, writer), writer.sent
+
+
+@pytest.fixture
+def table():
+    t = Table("T1", make_rng("seeded", 1), 30, balance=50.0)
+    t.open = True
+    return t
+
+
+def test_join_uses_table_balance(table):
+    conn, sent = _client(table)
+    conn.handle({"op": "join", "table": "T1", "seat": "kiosk", "balance": 1e12})
+    assert sent[-1]["ev"] == "joined" and sent[-1]["seat"] == "kiosk"
+    assert sent[-1]["balance"] == 50.0 and sent[-1]["bets"] == []
+
+
+def test_bet_kinds_and_slip_actions(table):
+    conn, sent = _client(table)
+    conn.handle({"op": "join", "table": "T1", "seat": "a"})
+    conn.handle({"op": "bet", "kind": "quick", "name": "Red", "amount": 1})
+    conn.handle({"op": "bet", "kind": "call", "name": "Tiers", "amount": 1})
+    conn.handle({"op": "bet", "kind": "neighbours", "number": 0, "k": 1, "amount": 1})
+    conn.handle({"op": "bet", "id": 17, "amount": 2, "x": 3, "y": 4})
+    assert sent[-1]["ev"] == "slip" and sent[-1]["total"] == 1 + 6 + 3 + 2
+    assert sent[-1]["bets"][-1] == {"id": 17, "label": "Straight 17", "amount": 2.0, "x": 3.0, "y": 4.0}
+    conn.handle({"op": "undo"})
+    assert sent[-1]["total"] == 10
+    conn.handle({"op": "double"})
+    assert sent[-1]["total"] == 20
+    conn.handle({"op": "clear"})
+    assert sent[-1]["total"] == 0 and sent[-1]["bets"] == []
+
+
+def test_errors(table):
+    conn, _ = _client(table)
+    with pytest.raises(BetError, match="Join a table first"):
+        conn.handle({"op": "bet", "id": 1, "amount": 1})
+    with pytest.raises(BetError, match="Unknown table"):
+        conn.handle({"op": "join", "table": "T9", "seat": "a"})
+    conn.handle({"op": "join", "table": "T1", "seat": "a"})
+    with pytest.raises(BetError, match="Insufficient"):
+        conn.handle({"op": "bet", "kind": "quick", "name": "Red", "amount": 60})
+    with pytest.raises(BetError, match="Unknown op"):
+        conn.handle({"op": "fold"})
+    table.open = False
+    with pytest.raises(BetError, match="Wait for spin"):
+        conn.handle({"op": "bet", "id": 1, "amount": 1})
+
+
+@pytest.mark.parametrize("amount", [-45, 0, float("nan"), float("inf")])
+def test_bad_amounts_are_rejected(table, amount):
+    conn, sent = _client(table)
+    conn.handle({"op": "join", "table": "T1", "seat": "a"})
+    request = json.loads(json.dumps({"op": "bet", "id": 5, "amount": amount}))
+    with pytest.raises(BetError, match="positive"):
+        conn.handle(request)
+    assert conn.seat.engine.total_bet == 0.0
+
+
+def test_error_event_reaches_the_client():
+    async def run():
+        table = Table("T1", make_rng("seeded", 2), 30, balance=20.0)
+        game = GameServer([table])
+        server = await game.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(encode({"op": "join", "table": "T1", "seat": "s"}))
+        writer.write(b'{"op":"bet","id":5,"amount":NaN}\n')
+        events = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in range(2)]
+        writer.close()
+        server.close()
+        for task in game._tasks:
+            task.cancel()
+        return events
+
+    joined, error = asyncio.run(run())
+    assert error == {"ev": "error", "op": "bet", "message": "Bet amount must be a positive number."}
+
+
+def test_settle_sends_each_seat_its_result(table):
+    seated, seated_sent = _client(table)
+    watcher, watcher_sent = _client(table)
+    seated.handle({"op": "join", "table": "T1", "seat": "a"})
+    watcher.handle({"op": "watch", "table": "T1"})
+    seated.handle({"op": "bet", "id": 17, "amount": 1})
+    table.round = 3
+    table.settle(17)
+    base = {"ev": "spin", "table": "T1", "round": 3, "number": 17, "color": "black"}
+    assert seated_sent[-1] == dict(base, bet=1.0, win=36.0, balance=85.0)
+    assert watcher_sent[-1] == base
+    assert table.history.recent(1) == [17]
+
+
+def test_seat_takeover_and_reconnect(table):
+    first, first_sent = _client(table)
+    first.handle({"op": "join", "table": "T1", "seat": "a"})
+    first.handle({"op": "bet", "kind": "quick", "name": "Black", "amount": 5})
+    second, second_sent = _client(table)
+    second.handle({"op": "join", "table": "T1", "seat": "a"})
+    assert first_sent[-1]["ev"] == "error" and first.seat is None
+    assert second_sent[-1]["total"] == 5.0 and second_sent[-1]["bets"][0]["id"] == BY_LABEL["Black"].id
+
+
+def test_loopback_round():
+    async def run():
+        table = Table("T1", make_rng("seeded", 2), 0.2, spin_time=0.0, balance=20.0)
+        game = GameServer([table])
+        server = await game.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(encode({"op": "join", "table": "T1", "seat": "s"}))
+        writer.write(encode({"op": "bet", "kind": "quick", "name": "Red", "amount": 1}))
+        events = []
+        while not events or events[-1]["ev"] != "spin":
+            events.append(json.loads(await asyncio.wait_for(reader.readline(), 5)))
+        writer.close()
+        server.close()
+        for task in game._tasks:
+            task.cancel()
+        return events
+
+    events = asyncio.run(run())
+    assert [e["ev"] for e in events[:2]] == ["joined", "slip"]
+    spin = events[-1]
+    assert spin["bet"] == 1.0 and spin["balance"] == 19.0 + spin["win"]
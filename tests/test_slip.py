@@ -0,0 +1,96 @@
+"""Bet slip: the per-pocket return vector, coverage and undo log."""
+
+import random
+
+import pytest
+
+from justai_roulette.game.bets import calculate_winnings
+from justai_roulette.game.catalogue import BY_LABEL, CATALOGUE
+from justai_roulette.game.slip import BetSlip, build_slip
+
+
+def _as_dicts(slip: BetSlip) -> list[dict]:
+    return [{"numbers": b.numbers, "payout": b.payout, "amount": b.amount} for b in slip]
+
+
+def _random_slip(rng: random.Random) -> BetSlip:
+    slip = BetSlip()
+    for _ in range(rng.randint(1, 12)):
+        slip.add(rng.randrange(len(CATALOGUE)), rng.choice((0.5, 1.0, 2.0, 5.0)))
+    if rng.random() < 0.3:
+        slip.double()
+    return slip
+
+
+def test_returns_match_calculate_winnings():
+    rng = random.Random(11)
+    for _ in range(200):
+        slip = _random_slip(rng)
+        bets = _as_dicts(slip)
+        for n in range(37):
+            total, winners = calculate_winnings(bets, n)
+            assert slip.payout(n) == pytest.approx(total)
+            assert sorted(b.id for b in slip.winners(n)) == sorted(
+                BY_LABEL[CATALOGUE[b.id].label].id for b in slip if n in b.numbers)
+            assert len(winners) == len(slip.winners(n))
+
+
+def test_coverage_mask_tracks_covered_pockets():
+    rng = random.Random(5)
+    for _ in range(100):
+        slip = _random_slip(rng)
+        covered = {n for b in slip for n in b.numbers}
+        assert slip.coverage == sum(1 << n for n in covered)
+
+
+def test_stacking_and_undo():
+    slip = BetSlip()
+    red = BY_LABEL["Red"].id
+    slip.add(17, 1.0)
+    slip.add(17, 2.0)
+    slip.add(red, 5.0)
+    assert len(slip) == 2 and slip.get(17).amount == 3.0
+    assert slip.total == 8.0
+
+    assert [b.id for b in slip.undo()] == [red]
+    assert slip.get(red) is None and slip.payout(1) == 0.0
+    slip.undo()
+    assert slip.get(17).amount == 1.0 and slip.payout(17) == 36.0
+    slip.undo()
+    assert not slip and slip.total == 0.0 and slip.coverage == 0
+    assert slip.returns == [0.0] * 37
+    assert slip.undo() == []
+
+
+def test_group_and_double_undo_as_one_action():
+    slip = BetSlip()
+    slip.add_group([(0, 1.0, 0, 0), (32, 1.0, 0, 0), (15, 1.0, 0, 0)])
+    slip.double()
+    assert slip.total == 6.0
+    slip.undo()
+    assert slip.total == 3.0 and len(slip) == 3
+    slip.undo()
+    assert not slip
+
+
+def test_entries_round_trip():
+    slip = _random_slip(random.Random(3))
+    copy = BetSlip.from_entries(slip.entries())
+    assert copy.entries() == slip.entries()
+    assert copy.returns == pytest.approx(slip.returns)
+    assert not copy.can_undo
+
+
+def test_build_slip_specs():
+    slip = build_slip(["Red:2", "Voisins", "17+2"], 1.0)
+    assert slip.get(BY_LABEL["Red"].id).amount == 2.0
+    assert slip.get(BY_LABEL["Trio 0/2/3"].id).amount == 2.0  # Voisins puts two chips on the trio
+    for n in (6, 34, 17, 25, 2):
+        assert slip.get(n).amount == 1.0
+    assert slip.total == 2 + 9 + 5
+
+
+@pytest.mark.parametrize("spec", ["Purple", "40+1", "4+9", "4+x", "Red:-1", "Red:0", "Red:nan", "Red:inf"])
+def test_build_slip_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        build_slip([spec], 1.0)
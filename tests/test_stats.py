@@ -0,0 +1,64 @@
+"""Incremental spin statistics against brute-force recounts."""
+
+import random
+from collections import Counter
+
+from justai_roulette.game.stats import POCKET_CATEGORIES, SpinStats
+
+
+def _brute(numbers):
+    pockets = Counter(numbers)
+    categories: Counter = Counter()
+    for n in numbers:
+        categories.update(POCKET_CATEGORIES[n])
+    return pockets, categories
+
+
+def _check(counters, numbers):
+    pockets, categories = _brute(numbers)
+    assert counters.total == len(numbers)
+    assert counters.pockets == [pockets[n] for n in range(37)]
+    for cat, keys in counters.categories.items():
+        for key, count in keys.items():
+            assert count == categories[cat, key]
+    counts = [counters.pockets[n] for n in counters.order]
+    assert counts == sorted(counts, reverse=True)
+    assert sorted(counters.order) == list(range(37))
+
+
+def test_windows_match_brute_force():
+    rng = random.Random(2)
+    stats = SpinStats((1, 7, 50))
+    seen = []
+    for _ in range(400):
+        n = rng.randrange(37)
+        stats.record(n)
+        seen.append(n)
+        _check(stats.all_time, seen)
+        for size, window in stats.windows.items():
+            _check(window, seen[-size:])
+
+
+def test_record_many_equals_repeated_record():
+    rng = random.Random(4)
+    one, many = SpinStats((5, 60)), SpinStats((5, 60))
+    for _ in range(5):
+        batch = bytes(rng.randrange(37) for _ in range(rng.randrange(0, 120)))
+        for n in batch:
+            one.record(n)
+        many.record_many(batch)
+        assert many.all_time.pockets == one.all_time.pockets
+        assert many.all_time.categories == one.all_time.categories
+        for size in (5, 60):
+            assert many.windows[size].pockets == one.windows[size].pockets
+            assert many.counts("color", size) == one.counts("color", size)
+
+
+def test_restore_hot_and_cold():
+    stats = SpinStats.restore({"17": 5, 3: 2, 0: 1}, recent=[3, 3, 17], windows=(2,))
+    assert stats.hot(3) == [(17, 5), (3, 2), (0, 1)]
+    assert stats.cold(1)[0][1] == 0
+    assert sorted(stats.hot(2, window=2)) == [(3, 1), (17, 1)]
+    assert stats.counts("sector") == {"Voisins": 2 + 1, "Tiers": 0, "Orphelins": 5}
+    stats.reset()
+    assert stats.all_time.total == 0 and stats.windows[2].total == 0
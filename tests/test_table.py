@@ -0,0 +1,40 @@
+"""Table hit-map, driven through a stand-in canvas (no display needed)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from justai_roulette.game.catalogue import CATALOGUE
+from justai_roulette.ui import table
+
+
+@pytest.fixture
+def grid(fake_canvas):
+    fake_canvas(table)
+    selected, hovered = [], []
+    res = table.build_table(None, lambda *args: selected.append(args), on_hover=hovered.append)
+    return res[4], res[8], selected, hovered
+
+
+def test_every_bet_has_an_anchor(grid):
+    anchors = grid[1]
+    assert sorted(anchors) == [bet.id for bet in CATALOGUE]
+
+
+def test_anchor_click_selects_that_bet(grid):
+    canvas, anchors, selected, _ = grid
+    click = canvas.bindings["<ButtonPress-1>"]
+    for bet_id, (x, y) in anchors.items():
+        click(SimpleNamespace(x=x, y=y))
+        assert selected[-1][0] == bet_id, CATALOGUE[bet_id].label
+        assert selected[-1][1:3] == (x, y)
+
+
+def test_hover_reports_changes_only(grid):
+    canvas, anchors, _, hovered = grid
+    motion = canvas.bindings["<Motion>"]
+    x, y = anchors[17]
+    motion(SimpleNamespace(x=x, y=y))
+    motion(SimpleNamespace(x=x + 1, y=y))
+    canvas.bindings["<Leave>"](SimpleNamespace(x=0, y=0))
+    assert [bet and bet.id for bet in hovered] == [17, None]
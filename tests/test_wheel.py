@@ -0,0 +1,44 @@
+"""Wheel-order tables: positions, neighbours and sectors."""
+
+import pytest
+
+from justai_roulette.constants import WHEEL_SEQUENCE
+from justai_roulette.game.wheel import (
+    MAX_NEIGHBOURS, NEIGHBOURS, SECTORS, WHEEL_NUMBERS, WHEEL_POSITION, neighbours, sector,
+)
+
+
+def test_positions_invert_the_wheel_order():
+    assert list(WHEEL_NUMBERS) == WHEEL_SEQUENCE
+    for position, n in enumerate(WHEEL_NUMBERS):
+        assert WHEEL_POSITION[n] == position
+
+
+def test_neighbours_walk_the_wheel():
+    assert neighbours(0, 2) == (3, 26, 0, 32, 15)
+    assert neighbours(26, 1) == (3, 26, 0)  # wraps past the end of the sequence
+    for k in range(MAX_NEIGHBOURS + 1):
+        for n in range(37):
+            bets = NEIGHBOURS[k][n]
+            assert len(set(bets)) == 2 * k + 1 and bets[k] == n
+            for a, b in zip(bets, bets[1:]):
+                assert (WHEEL_POSITION[b] - WHEEL_POSITION[a]) % 37 == 1
+
+
+@pytest.mark.parametrize("number, k", [(37, 1), (-1, 1), (5, MAX_NEIGHBOURS + 1), (5, -1)])
+def test_neighbours_rejects_bad_input(number, k):
+    with pytest.raises(ValueError):
+        neighbours(number, k)
+
+
+def test_sector_is_clockwise_and_inclusive():
+    assert sector(17, 6) == (17, 34, 6)
+    assert sector(3, 32) == (3, 26, 0, 32)
+    assert sector(5, 5) == (5,)
+
+
+def test_sectors_split_the_wheel():
+    main = [SECTORS[name] for name in ("Voisins", "Tiers", "Orphelins")]
+    assert sum(len(s) for s in main) == 37
+    assert frozenset().union(*main) == frozenset(range(37))
+    assert SECTORS["Jeu Zéro"] < SECTORS["Voisins"]